@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from .models import User
+from .models import User, RevokedToken
+from .services import set_up_customer
 
 
 @admin.register(User)
@@ -26,3 +27,16 @@ class UserAdmin(BaseUserAdmin):
             'fields': ('user_type', 'mobile_number', 'whatsapp_number', 'profile_picture')
         }),
     )
+    
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # The admin view runs in a transaction, so the profile is saved (or rolled back) with the user
+        if not change and obj.user_type == 'CUSTOMER':
+            set_up_customer(obj)
+
+
+@admin.register(RevokedToken)
+class RevokedTokenAdmin(admin.ModelAdmin):
+    list_display = ['jti', 'revoked_at', 'expires_at']
+    search_fields = ['jti']
+    readonly_fields = ['jti', 'revoked_at', 'expires_at']
@@ -0,0 +1,98 @@
+from collections import OrderedDict
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+class UserCache:
+    """
+    Short-TTL, size-bounded (least recently used out), in-process cache of user rows keyed by id.
+    Rows are stored as plain field values and rebuilt into a fresh User
+    instance on every hit, so requests never share (or mutate) one object.
+    """
+
+    def __init__(self, ttl, max_size):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id):
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            self.misses += 1
+            return None
+        self.hits += 1
+        with self._lock:
+            try:
+                # Least recently used entries are evicted first
+                self._entries.move_to_end(user_id)
+            except KeyError:
+                # Invalidated or evicted since the read above; this request still uses the row it got
+                pass
+        _, field_names, values = entry
+        return get_user_model().from_db(DEFAULT_DB_ALIAS, field_names, values)
+
+    def set(self, user):
+        field_names = [field.attname for field in user._meta.concrete_fields]
+        values = [getattr(user, name) for name in field_names]
+        with self._lock:
+            self._entries[user.pk] = (time.monotonic() + self.ttl, field_names, values)
+            self._entries.move_to_end(user.pk)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+user_cache = UserCache(
+    ttl=getattr(settings, 'AUTH_USER_CACHE_TTL', 30),
+    max_size=getattr(settings, 'AUTH_USER_CACHE_SIZE', 10000),
+)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that serves the request user from `user_cache` and only
+    queries the database on a miss. Tokens whose `is_active` claim is false
+    are rejected without any lookup.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        if validated_token.get('is_active') is False:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        user = user_cache.get(user_id)
+        if user is None:
+            user = super().get_user(validated_token)
+            user_cache.set(user)
+        elif not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        elif api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."), code="password_changed"
+            )
+        return user
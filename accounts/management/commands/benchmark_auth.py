@@ -0,0 +1,74 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import Client, RequestFactory
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from accounts.authentication import CachedJWTAuthentication, user_cache
+from accounts.tokens import UserRefreshToken
+import time
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Compare queries and latency of plain vs cached JWT authentication'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=1000,
+            help='Number of authentications per backend (default: 1000)',
+        )
+        parser.add_argument(
+            '--username',
+            default='admin',
+            help='User to authenticate as (default: admin)',
+        )
+        parser.add_argument(
+            '--path',
+            default='/api/auth/profile/',
+            help='Endpoint used for the end-to-end comparison (default: /api/auth/profile/)',
+        )
+
+    def handle(self, *args, **kwargs):
+        try:
+            user = User.objects.get(username=kwargs['username'])
+        except User.DoesNotExist:
+            raise CommandError(f'User "{kwargs["username"]}" not found. Run create_sample_data first.')
+
+        access = str(UserRefreshToken.for_user(user).access_token)
+        header = f'Bearer {access}'
+        count = kwargs['requests']
+
+        request = RequestFactory().get(kwargs['path'], HTTP_AUTHORIZATION=header)
+        self.stdout.write(f'Authenticating {count} requests as {user.username}\n')
+
+        user_cache.clear()
+        for label, backend in (('JWTAuthentication', JWTAuthentication()),
+                               ('CachedJWTAuthentication', CachedJWTAuthentication())):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                for _ in range(count):
+                    backend.authenticate(request)
+                elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f'{label:<25} {len(queries) / count:6.2f} queries/request  '
+                f'{elapsed / count * 1e6:8.1f} µs/request'
+            )
+
+        # End to end through the configured middleware and view stack
+        self.stdout.write(f'\nEnd to end: GET {kwargs["path"]}')
+        client = Client()
+        with override_settings(ALLOWED_HOSTS=['*']):
+            user_cache.clear()
+            with CaptureQueriesContext(connection) as cold:
+                client.get(kwargs['path'], HTTP_AUTHORIZATION=header)
+            with CaptureQueriesContext(connection) as warm:
+                client.get(kwargs['path'], HTTP_AUTHORIZATION=header)
+        self.stdout.write(f'  cache miss: {len(cold)} queries')
+        self.stdout.write(f'  cache hit:  {len(warm)} queries')
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ Cached authentication removes {len(cold) - len(warm)} queries per request'
+        ))
@@ -0,0 +1,84 @@
+from django.core.management.base import BaseCommand
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+import random
+import statistics
+import time
+import uuid
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Measure latency and queries of POST /api/auth/register/'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count',
+            type=int,
+            default=20,
+            help='Number of registrations to run (default: 20)',
+        )
+        parser.add_argument(
+            '--keep',
+            action='store_true',
+            help='Keep the benchmark users instead of deleting them afterwards',
+        )
+
+    def handle(self, *args, **kwargs):
+        count = kwargs['count']
+        run = uuid.uuid4().hex[:6]
+        mobile_prefix = f'+23320{random.randrange(1000):03d}'
+        client = Client()
+        latencies = []
+        query_counts = []
+        statements = {}
+
+        with override_settings(ALLOWED_HOSTS=['*'], EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend'):
+            for i in range(count):
+                payload = {
+                    'username': f'bench_{run}_{i}',
+                    'email': f'bench_{run}_{i}@example.com',
+                    'password': 'BenchPass!2024',
+                    'password2': 'BenchPass!2024',
+                    'first_name': 'Bench',
+                    'last_name': 'User',
+                    'mobile_number': f'{mobile_prefix}{i:04d}',
+                }
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    response = client.post('/api/auth/register/', payload, content_type='application/json')
+                    latencies.append(time.perf_counter() - started)
+                if response.status_code != 201:
+                    self.stderr.write(f'Registration failed ({response.status_code}): {response.content[:200]}')
+                    break
+                query_counts.append(len(queries))
+                for query in queries:
+                    verb = query['sql'].split(None, 1)[0].upper()
+                    statements[verb] = statements.get(verb, 0) + 1
+
+        if not kwargs['keep']:
+            User.objects.filter(username__startswith=f'bench_{run}_').delete()
+
+        if not latencies or not query_counts:
+            return
+
+        # Password hashing is the floor for any registration
+        started = time.perf_counter()
+        make_password('BenchPass!2024')
+        hashing = time.perf_counter() - started
+
+        done = len(query_counts)
+        ordered = sorted(latencies)
+        self.stdout.write(f'Registrations: {done}')
+        self.stdout.write(f'Latency mean: {statistics.mean(latencies) * 1000:.1f} ms')
+        self.stdout.write(f'Latency p95:  {ordered[int(0.95 * (len(ordered) - 1))] * 1000:.1f} ms')
+        self.stdout.write(f'  of which password hashing: {hashing * 1000:.1f} ms')
+        self.stdout.write(f'Queries per registration: {statistics.mean(query_counts):.1f}')
+        for verb, total in sorted(statements.items()):
+            self.stdout.write(f'  {verb:<10} {total / done:.1f}')
+        self.stdout.write(self.style.SUCCESS(f'✓ {done} customers registered; welcome emails handed to the task queue after commit'))
+
@@ -70,9 +70,8 @@ class Command(BaseCommand):
                     mobile_number=phone,
                     user_type='CUSTOMER'
                 )
-                customer = Customer.objects.get(user=user)
-                customer.location = location
-                customer.save()
+                # No welcome email for example.com addresses
+                Customer.objects.create(user=user, location=location)
                 self.stdout.write(f'✓ Customer {username} created')
         
         # Create products
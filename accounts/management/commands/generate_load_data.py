@@ -0,0 +1,75 @@
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+from datetime import date
+from io import StringIO
+from maize_point.loadgen import LOAD_PASSWORD, LoadDataError, LoadGenerator
+from reports.queries import bump_stock_version
+from reports.rollups import refresh_rollups
+import time
+
+
+class Command(BaseCommand):
+    help = 'Generate large, realistic, reproducible data for load tests and benchmarks (use a fresh database)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--customers', type=int, default=1000, help='Customers to create (default: 1000)')
+        parser.add_argument('--farmers', type=int, default=500, help='Farmers to create (default: 500)')
+        parser.add_argument('--orders', type=int, default=10000, help='Orders to create (default: 10000)')
+        parser.add_argument('--supplies', type=int, default=5000, help='Farmer supplies to create (default: 5000)')
+        parser.add_argument('--movements', type=int, default=20000, help='Stock movements to create (default: 20000)')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed; same seed and --end, same data (default: 0)')
+        parser.add_argument('--days', type=int, default=730, help='Length of the generated history (default: 730)')
+        parser.add_argument('--end', type=date.fromisoformat, help='Day the history ends, YYYY-MM-DD (default: today)')
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=5000,
+            help='Rows built and inserted per statement (default: 5000)',
+        )
+        parser.add_argument(
+            '--no-derived',
+            action='store_true',
+            help="Skip rebuilding customer order stats and report rollups afterwards",
+        )
+
+    def handle(self, *args, **kwargs):
+        started = time.perf_counter()
+        counts = {name: kwargs[name] for name in ('customers', 'farmers', 'orders', 'supplies', 'movements')}
+        if min(counts.values()) < 0 or kwargs['days'] < 1 or kwargs['chunk_size'] < 1:
+            raise CommandError('Counts must not be negative; --days and --chunk-size must be positive.')
+
+        generator = LoadGenerator(
+            seed=kwargs['seed'],
+            days=kwargs['days'],
+            end=kwargs['end'],
+            chunk_size=kwargs['chunk_size'],
+            log=lambda message: self.stdout.write(f'  {message} ({time.perf_counter() - started:.0f}s)'),
+        )
+        self.stdout.write(
+            f'Generating {", ".join(f"{count} {name}" for name, count in counts.items())} '
+            f'over {kwargs["days"]} days to {generator.end.date()} (seed {kwargs["seed"]})'
+        )
+        try:
+            generator.run(**counts)
+        except LoadDataError as e:
+            raise CommandError(str(e))
+        except IntegrityError as e:
+            raise CommandError(f'Generated rows clash with existing data ({e}); use a fresh database.')
+        generated = time.perf_counter() - started
+        total = sum(counts.values())
+        self.stdout.write(f'Inserted {total} rows in {generated:.1f}s ({total / max(generated, 1e-9):,.0f} rows/s)')
+
+        # Bulk inserts send no signals, so rebuild what they would have kept up to date
+        if not kwargs['no_derived']:
+            if counts['orders']:
+                call_command('reconcile_customer_stats', stdout=StringIO())
+                self.stdout.write('Customer order stats reconciled')
+            refresh_rollups(full=True)
+            bump_stock_version()
+            self.stdout.write('Report rollups rebuilt')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ Load data generated in {time.perf_counter() - started:.1f}s '
+            f'(customers log in as load_customer_<n> / {LOAD_PASSWORD})'
+        ))
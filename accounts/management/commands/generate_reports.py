@@ -1,13 +1,18 @@
-from django.core.management.base import BaseCommand
-from django.db.models import Sum, Count, Avg, Q
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
 from django.utils import timezone
-from datetime import timedelta
-from customers.models import Customer
-from farmers.models import Farmer, FarmerSupply
-from orders.models import Order
-from inventory.models import Stock, StockMovement
-from products.models import Product
-from decimal import Decimal
+from datetime import date, timedelta
+from reports.rollups import local_day, refresh_rollups
+from reports.summary import build_report, SECTIONS
+import csv
+import json
+
+
+def _day(value):
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f'Invalid date "{value}". Use YYYY-MM-DD.')
 
 
 class Command(BaseCommand):
@@ -20,137 +25,148 @@ class Command(BaseCommand):
             default=30,
             help='Number of days to include in report (default: 30)',
         )
-
-    def handle(self, *args, **kwargs):
-        days = kwargs['days']
-        start_date = timezone.now() - timedelta(days=days)
-        
-        self.stdout.write('='*70)
-        self.stdout.write(self.style.SUCCESS(f'MAIZE SUPPLY & STORAGE ENTERPRISE - BUSINESS REPORT'))
-        self.stdout.write(f'Report Period: Last {days} days ({start_date.date()} to {timezone.now().date()})')
-        self.stdout.write('='*70)
-        
-        # Customer Statistics
-        self.stdout.write('\n📊 CUSTOMER STATISTICS')
-        self.stdout.write('-'*70)
-        total_customers = Customer.objects.filter(is_active=True).count()
-        new_customers = Customer.objects.filter(created_at__gte=start_date).count()
-        self.stdout.write(f'Total Active Customers: {total_customers}')
-        self.stdout.write(f'New Customers (last {days} days): {new_customers}')
-        
-        # Farmer Statistics
-        self.stdout.write('\n🌾 FARMER STATISTICS')
-        self.stdout.write('-'*70)
-        total_farmers = Farmer.objects.filter(is_active=True).count()
-        approved_farmers = Farmer.objects.filter(is_active=True, is_approved=True).count()
-        pending_farmers = Farmer.objects.filter(is_active=True, is_approved=False).count()
-        self.stdout.write(f'Total Active Farmers: {total_farmers}')
-        self.stdout.write(f'Approved Farmers: {approved_farmers}')
-        self.stdout.write(f'Pending Approval: {pending_farmers}')
-        
-        # Farmer Supply Summary
-        supplies = FarmerSupply.objects.filter(date_delivered__gte=start_date)
-        supply_stats = supplies.aggregate(
-            total_bags=Sum('quantity_bags'),
-            total_cost=Sum('total_cost'),
-            total_paid=Sum('amount_paid'),
-            count=Count('id')
+        parser.add_argument(
+            '--start',
+            help='First day of the report period, YYYY-MM-DD (overrides --days)',
         )
-        
-        self.stdout.write(f'\nFarmer Supplies (last {days} days):')
-        self.stdout.write(f'  Total Supplies: {supply_stats["count"] or 0}')
-        self.stdout.write(f'  Total Bags Received: {supply_stats["total_bags"] or 0}')
-        self.stdout.write(f'  Total Cost: GHS {supply_stats["total_cost"] or 0:.2f}')
-        self.stdout.write(f'  Total Paid: GHS {supply_stats["total_paid"] or 0:.2f}')
-        outstanding = (supply_stats["total_cost"] or 0) - (supply_stats["total_paid"] or 0)
-        self.stdout.write(self.style.WARNING(f'  Outstanding Payments: GHS {outstanding:.2f}'))
-        
-        # Stock Levels
-        self.stdout.write('\n📦 STOCK LEVELS')
-        self.stdout.write('-'*70)
-        stock_summary = Stock.objects.aggregate(
-            total_bags=Sum('quantity_bags'),
-            total_tons=Sum('quantity_tons'),
-            low_stock_count=Count('id', filter=Q(quantity_bags__lt=100))
+        parser.add_argument(
+            '--end',
+            help='Last day of the report period, inclusive, YYYY-MM-DD (default: today)',
         )
-        self.stdout.write(f'Total Stock: {stock_summary["total_bags"] or 0} bags')
-        self.stdout.write(f'Total Tons: {stock_summary["total_tons"] or 0:.3f} tons')
-        if stock_summary["low_stock_count"] > 0:
-            self.stdout.write(self.style.WARNING(f'Low Stock Items: {stock_summary["low_stock_count"]}'))
-        
-        # Product-wise stock
-        self.stdout.write('\nStock by Product:')
-        for product in Product.objects.all():
-            product_stock = Stock.objects.filter(product=product).aggregate(
-                total=Sum('quantity_bags')
-            )['total'] or 0
-            self.stdout.write(f'  {product.name}: {product_stock} bags')
-        
-        # Order Statistics
-        self.stdout.write('\n🛒 ORDER STATISTICS')
-        self.stdout.write('-'*70)
-        orders = Order.objects.filter(created_at__gte=start_date)
-        order_stats = orders.aggregate(
-            total_orders=Count('id'),
-            total_revenue=Sum('total_price', filter=Q(order_status='DELIVERED')),
-            pending_orders=Count('id', filter=Q(order_status='PENDING')),
-            processing_orders=Count('id', filter=Q(order_status='PROCESSING')),
-            delivered_orders=Count('id', filter=Q(order_status='DELIVERED')),
-            cancelled_orders=Count('id', filter=Q(order_status='CANCELLED')),
+        parser.add_argument(
+            '--format',
+            choices=['text', 'json', 'csv'],
+            default='text',
+            help='Output format (default: text)',
         )
-        
-        self.stdout.write(f'Total Orders (last {days} days): {order_stats["total_orders"] or 0}')
-        self.stdout.write(f'  Pending: {order_stats["pending_orders"] or 0}')
-        self.stdout.write(f'  Processing: {order_stats["processing_orders"] or 0}')
-        self.stdout.write(f'  Delivered: {order_stats["delivered_orders"] or 0}')
-        self.stdout.write(f'  Cancelled: {order_stats["cancelled_orders"] or 0}')
-        self.stdout.write(self.style.SUCCESS(f'\nTotal Revenue (Delivered): GHS {order_stats["total_revenue"] or 0:.2f}'))
-        
-        # Top Products
-        self.stdout.write('\n🏆 TOP SELLING PRODUCTS')
-        self.stdout.write('-'*70)
-        top_products = Order.objects.filter(
-            created_at__gte=start_date,
-            order_status='DELIVERED'
-        ).values('product__name').annotate(
-            total_sold=Sum('quantity_bags'),
-            revenue=Sum('total_price')
-        ).order_by('-total_sold')[:5]
-        
-        for i, item in enumerate(top_products, 1):
-            self.stdout.write(
-                f'{i}. {item["product__name"]}: {item["total_sold"]} bags - '
-                f'GHS {item["revenue"]:.2f}'
-            )
-        
-        # Stock Movements
-        self.stdout.write('\n📈 STOCK MOVEMENTS')
-        self.stdout.write('-'*70)
-        movements = StockMovement.objects.filter(created_at__gte=start_date)
-        movement_stats = movements.values('movement_type').annotate(
-            count=Count('id'),
-            total_bags=Sum('quantity_bags')
+        parser.add_argument(
+            '--output',
+            help='Write the report to this file instead of stdout',
         )
-        
-        for stat in movement_stats:
-            self.stdout.write(
-                f'{stat["movement_type"]}: {stat["count"]} movements, '
-                f'{stat["total_bags"]} bags'
-            )
-        
-        # Financial Summary
-        self.stdout.write('\n💰 FINANCIAL SUMMARY')
-        self.stdout.write('-'*70)
-        total_revenue = order_stats["total_revenue"] or 0
-        total_supply_cost = supply_stats["total_cost"] or 0
-        gross_profit = total_revenue - total_supply_cost
-        
-        self.stdout.write(f'Total Revenue: GHS {total_revenue:.2f}')
-        self.stdout.write(f'Total Supply Costs: GHS {total_supply_cost:.2f}')
-        if gross_profit > 0:
-            self.stdout.write(self.style.SUCCESS(f'Gross Profit: GHS {gross_profit:.2f}'))
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=len(SECTIONS),
+            help=f'Sections computed concurrently, each on its own connection (default: {len(SECTIONS)})',
+        )
+        parser.add_argument(
+            '--no-refresh',
+            action='store_true',
+            help='Report from the daily rollups as they are, without refreshing them first',
+        )
+
+    def handle(self, *args, **kwargs):
+        end_day = _day(kwargs['end']) if kwargs['end'] else local_day(timezone.now())
+        start_day = _day(kwargs['start']) if kwargs['start'] else end_day - timedelta(days=kwargs['days'])
+        if start_day > end_day:
+            raise CommandError('--start must not be after --end')
+
+        if not kwargs['no_refresh']:
+            # Incremental: only days touched since the last refresh are re-aggregated
+            refresh_rollups()
+        report = build_report(start_day, end_day, workers=max(kwargs['workers'], 1))
+
+        stream = open(kwargs['output'], 'w', newline='', encoding='utf-8') if kwargs['output'] else None
+        try:
+            if kwargs['format'] == 'json':
+                (stream or self.stdout).write(json.dumps(report, cls=DjangoJSONEncoder, indent=2) + '\n')
+            elif kwargs['format'] == 'csv':
+                self.write_csv(report, stream or self.stdout)
+            else:
+                self.write_text(report, stream)
+        finally:
+            if stream:
+                stream.close()
+
+        if stream:
+            self.stdout.write(self.style.SUCCESS(f'✓ Report written to {kwargs["output"]}'))
+
+    def write_csv(self, report, stream):
+        """One row per figure: section, item, metric, value"""
+        writer = csv.writer(stream)
+        writer.writerow(['section', 'item', 'metric', 'value'])
+        writer.writerow(['period', '', 'start', report['period']['start']])
+        writer.writerow(['period', '', 'end', report['period']['end']])
+        for section in ('customers', 'farmers', 'supplies', 'stock', 'orders', 'finance'):
+            for metric, value in report[section].items():
+                if not isinstance(value, list):
+                    writer.writerow([section, '', metric, value])
+        for row in report['stock']['by_product']:
+            writer.writerow(['stock_by_product', row['name'], 'bags', row['bags']])
+        for row in report['orders']['top_products']:
+            writer.writerow(['top_products', row['product__name'], 'bags_sold', row['bags_sold']])
+            writer.writerow(['top_products', row['product__name'], 'revenue', row['revenue']])
+        for row in report['movements']:
+            writer.writerow(['movements', row['movement_type'], 'count', row['count']])
+            writer.writerow(['movements', row['movement_type'], 'total_bags', row['total_bags']])
+
+    def write_text(self, report, stream=None):
+        if stream:
+            write = lambda line, style=None: stream.write(f'{line}\n')
         else:
-            self.stdout.write(self.style.WARNING(f'Gross Profit: GHS {gross_profit:.2f}'))
-        
-        self.stdout.write('\n' + '='*70)
-        self.stdout.write(self.style.SUCCESS('Report generated successfully!'))
+            write = lambda line, style=None: self.stdout.write(style(line) if style else line)
+        start_day, end_day = report['period']['start'], report['period']['end']
+        customers, farmers, supplies = report['customers'], report['farmers'], report['supplies']
+        stock, orders, finance = report['stock'], report['orders'], report['finance']
+
+        write('='*70)
+        write('MAIZE SUPPLY & STORAGE ENTERPRISE - BUSINESS REPORT', self.style.SUCCESS)
+        write(f'Report Period: {start_day} to {end_day}')
+        write('='*70)
+
+        write('\n📊 CUSTOMER STATISTICS')
+        write('-'*70)
+        write(f'Total Active Customers: {customers["total_active"]}')
+        write(f'New Customers (in period): {customers["new"]}')
+
+        write('\n🌾 FARMER STATISTICS')
+        write('-'*70)
+        write(f'Total Active Farmers: {farmers["total_active"]}')
+        write(f'Approved Farmers: {farmers["approved"]}')
+        write(f'Pending Approval: {farmers["pending"]}')
+
+        write('\nFarmer Supplies (in period):')
+        write(f'  Total Supplies: {supplies["count"]}')
+        write(f'  Total Bags Received: {supplies["total_bags"]}')
+        write(f'  Total Cost: GHS {supplies["total_cost"]:.2f}')
+        write(f'  Total Paid: GHS {supplies["total_paid"]:.2f}')
+        write(f'  Outstanding Payments: GHS {supplies["outstanding"]:.2f}', self.style.WARNING)
+
+        write('\n📦 STOCK LEVELS')
+        write('-'*70)
+        write(f'Total Stock: {stock["total_bags"]} bags')
+        write(f'Total Tons: {stock["total_tons"]:.3f} tons')
+        if stock['low_stock_count'] > 0:
+            write(f'Low Stock Items: {stock["low_stock_count"]}', self.style.WARNING)
+        write('\nStock by Product:')
+        for row in stock['by_product']:
+            write(f'  {row["name"]}: {row["bags"]} bags')
+
+        write('\n🛒 ORDER STATISTICS')
+        write('-'*70)
+        write(f'Total Orders (in period): {orders["total"]}')
+        write(f'  Pending: {orders["pending"]}')
+        write(f'  Processing: {orders["processing"]}')
+        write(f'  Delivered: {orders["delivered"]}')
+        write(f'  Cancelled: {orders["cancelled"]}')
+        write(f'\nTotal Revenue (Delivered): GHS {orders["revenue"]:.2f}', self.style.SUCCESS)
+
+        write('\n🏆 TOP SELLING PRODUCTS')
+        write('-'*70)
+        for i, item in enumerate(orders['top_products'], 1):
+            write(f'{i}. {item["product__name"]}: {item["bags_sold"]} bags - GHS {item["revenue"]:.2f}')
+
+        write('\n📈 STOCK MOVEMENTS')
+        write('-'*70)
+        for stat in report['movements']:
+            write(f'{stat["movement_type"]}: {stat["count"]} movements, {stat["total_bags"]} bags')
+
+        write('\n💰 FINANCIAL SUMMARY')
+        write('-'*70)
+        write(f'Total Revenue: GHS {finance["revenue"]:.2f}')
+        write(f'Total Supply Costs: GHS {finance["supply_cost"]:.2f}')
+        write(f'Gross Profit: GHS {finance["gross_profit"]:.2f}',
+              self.style.SUCCESS if finance['gross_profit'] > 0 else self.style.WARNING)
+
+        write('\n' + '='*70)
+        write('Report generated successfully!', self.style.SUCCESS)
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from accounts.models import RevokedToken
+
+
+class Command(BaseCommand):
+    help = 'Delete revoked refresh tokens that have already expired'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Rows deleted per statement (default: 5000)',
+        )
+
+    def handle(self, *args, **kwargs):
+        batch_size = kwargs['batch_size']
+        now = timezone.now()
+        expired = RevokedToken.objects.filter(expires_at__lte=now).order_by('id')
+
+        # Small batches keep each DELETE short so logins and refreshes aren't blocked
+        deleted = 0
+        while True:
+            ids = list(expired.values_list('id', flat=True)[:batch_size])
+            if not ids:
+                break
+            deleted += RevokedToken.objects.filter(id__in=ids).delete()[0]
+
+        remaining = RevokedToken.objects.count()
+        self.stdout.write(self.style.SUCCESS(f'✓ Pruned {deleted} expired revoked tokens ({remaining} still active)'))
@@ -14,6 +14,7 @@ class User(AbstractUser):
     
     user_type = models.CharField(max_length=20, choices=USER_TYPE_CHOICES, default='CUSTOMER')
     profile_picture = models.ImageField(upload_to='profile_pictures/', null=True, blank=True)
+    profile_picture_variants = models.JSONField(default=dict, blank=True, editable=False)
     mobile_number = PhoneNumberField(unique=True, region='GH', help_text='Ghana phone number')
     whatsapp_number = PhoneNumberField(blank=True, null=True, region='GH')
     is_verified = models.BooleanField(default=False)
@@ -35,3 +36,20 @@ class User(AbstractUser):
     @property
     def full_name(self):
         return f"{self.first_name} {self.last_name}".strip() or self.username
+
+
+class RevokedToken(models.Model):
+    """Refresh token revoked by logout or rotation, kept until it expires"""
+    jti = models.CharField(max_length=255, unique=True)
+    expires_at = models.DateTimeField()
+    revoked_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'revoked_tokens'
+        ordering = ['-revoked_at']
+        indexes = [
+            models.Index(fields=['expires_at']),
+        ]
+    
+    def __str__(self):
+        return self.jti
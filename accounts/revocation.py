@@ -0,0 +1,117 @@
+"""
+Revocation store for refresh tokens.
+
+Revoked `jti`s live in the indexed RevokedToken table until their expiry.
+Each process keeps a compact Bloom filter of them plus a small dict of
+confirmed revocations, so the common case (a token that was never revoked)
+is answered in memory. Revocations made by other processes are picked up by
+an incremental `id > last_seen` query at most every REVOCATION_SYNC_INTERVAL
+seconds; only Bloom positives are confirmed against the database.
+"""
+from hashlib import blake2b
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import RevokedToken
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings using double hashing"""
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = max(capacity, 1)
+        self.size = max(int(-self.capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hash_count = max(int(round(self.size / self.capacity * math.log(2))), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value):
+        digest = blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class RevocationStore:
+
+    def __init__(self, capacity, error_rate, sync_interval):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self._lock = threading.Lock()
+        self._bloom = None
+        self._confirmed = {}  # jti -> expires_at
+        self._last_id = 0
+        self._synced_at = 0.0
+
+    def revoke(self, jti, expires_at):
+        """Record a revoked refresh token (idempotent, one INSERT)"""
+        RevokedToken.objects.bulk_create(
+            [RevokedToken(jti=jti, expires_at=expires_at)],
+            ignore_conflicts=True,
+        )
+        with self._lock:
+            self._confirmed[jti] = expires_at
+            if self._bloom is not None:
+                self._bloom.add(jti)
+
+    def is_revoked(self, jti):
+        if jti in self._confirmed:
+            return True
+        self._sync()
+        if jti not in self._bloom:
+            return False
+        # Possible false positive: confirm against the table
+        expires_at = RevokedToken.objects.filter(
+            jti=jti, expires_at__gt=timezone.now()
+        ).values_list('expires_at', flat=True).first()
+        if expires_at is None:
+            return False
+        with self._lock:
+            self._confirmed[jti] = expires_at
+        return True
+
+    def _sync(self):
+        now = time.monotonic()
+        if self._bloom is not None and now - self._synced_at < self.sync_interval:
+            return
+        with self._lock:
+            if self._bloom is None or self._bloom.count >= self.capacity:
+                self._rebuild()
+            else:
+                rows = RevokedToken.objects.filter(id__gt=self._last_id).order_by('id').values_list('id', 'jti')
+                for row_id, jti in rows.iterator():
+                    self._bloom.add(jti)
+                    self._last_id = row_id
+            self._synced_at = now
+
+    def _rebuild(self):
+        # Size for at least twice the live entries so the filter stays sparse
+        high_water = RevokedToken.objects.order_by('-id').values_list('id', flat=True).first() or 0
+        live = RevokedToken.objects.filter(id__lte=high_water, expires_at__gt=timezone.now())
+        self.capacity = max(self.capacity, live.count() * 2)
+        self._bloom = BloomFilter(self.capacity, self.error_rate)
+        for jti in live.values_list('jti', flat=True).iterator(chunk_size=10000):
+            self._bloom.add(jti)
+        self._last_id = high_water
+        current = timezone.now()
+        self._confirmed = {jti: exp for jti, exp in self._confirmed.items() if exp > current}
+
+
+revocation_store = RevocationStore(
+    capacity=getattr(settings, 'REVOCATION_BLOOM_CAPACITY', 100000),
+    error_rate=getattr(settings, 'REVOCATION_BLOOM_ERROR_RATE', 0.001),
+    sync_interval=getattr(settings, 'REVOCATION_SYNC_INTERVAL', 1),
+)
@@ -1,17 +1,22 @@
 from rest_framework import serializers
 from django.contrib.auth.password_validation import validate_password
 from django.contrib.auth import authenticate
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from images.serializers import ImageVariantsField
 from .models import User
+from .services import register_customer
+from .tokens import UserRefreshToken
 
 
 class UserSerializer(serializers.ModelSerializer):
     """Serializer for User model"""
     full_name = serializers.ReadOnlyField()
+    profile_picture_variants = ImageVariantsField()
     
     class Meta:
         model = User
         fields = ['id', 'username', 'email', 'first_name', 'last_name', 'full_name',
-                  'user_type', 'profile_picture', 'mobile_number', 'whatsapp_number',
+                  'user_type', 'profile_picture', 'profile_picture_variants', 'mobile_number', 'whatsapp_number',
                   'is_verified', 'is_active', 'created_at', 'updated_at']
         read_only_fields = ['id', 'user_type', 'is_verified', 'created_at', 'updated_at']
 
@@ -39,17 +44,7 @@ class RegisterSerializer(serializers.ModelSerializer):
     
     def create(self, validated_data):
         validated_data.pop('password2')
-        user = User.objects.create_user(
-            username=validated_data['username'],
-            email=validated_data['email'],
-            first_name=validated_data.get('first_name', ''),
-            last_name=validated_data.get('last_name', ''),
-            mobile_number=validated_data['mobile_number'],
-            whatsapp_number=validated_data.get('whatsapp_number'),
-            user_type='CUSTOMER',
-            password=validated_data['password']
-        )
-        return user
+        return register_customer(**validated_data)
 
 
 class LoginSerializer(serializers.Serializer):
@@ -74,6 +69,16 @@ class LoginSerializer(serializers.Serializer):
         return attrs
 
 
+class UserTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Login serializer issuing tokens with user_type and is_active claims"""
+    token_class = UserRefreshToken
+
+
+class UserTokenRefreshSerializer(TokenRefreshSerializer):
+    """Refresh serializer that checks and records revocations in the revocation store"""
+    token_class = UserRefreshToken
+
+
 class ChangePasswordSerializer(serializers.Serializer):
     """Serializer for changing password"""
     old_password = serializers.CharField(required=True, write_only=True)
@@ -0,0 +1,44 @@
+"""
+Account workflows that touch more than one model.
+"""
+from django.db import transaction
+
+from customers.models import Customer
+from notifications.tasks import queue_welcome_email
+from .models import User
+
+
+@transaction.atomic
+def register_customer(*, username, email, password, mobile_number,
+                      first_name='', last_name='', whatsapp_number=None):
+    """
+    Create a CUSTOMER user and their Customer profile in one transaction.
+    The welcome email is queued only once the transaction has committed, so a
+    rolled back registration never emails anyone and the request never waits
+    on SMTP.
+    """
+    user = User(
+        username=User.normalize_username(username),
+        email=User.objects.normalize_email(email),
+        first_name=first_name,
+        last_name=last_name,
+        mobile_number=mobile_number,
+        whatsapp_number=whatsapp_number,
+        user_type='CUSTOMER',
+    )
+    user.set_password(password)
+    user.save()
+    set_up_customer(user)
+    return user
+
+
+def set_up_customer(user, **profile):
+    """
+    Create the Customer profile of a new CUSTOMER user and queue their
+    welcome email for after the surrounding transaction commits. Every path
+    that creates customers (registration, the admin) calls this; nothing
+    happens implicitly on User.save().
+    """
+    customer = Customer.objects.create(user=user, **profile)
+    transaction.on_commit(lambda: queue_welcome_email(user.pk))
+    return customer
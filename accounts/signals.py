@@ -1,42 +1,18 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from django.core.mail import send_mail
-from django.conf import settings
 from .models import User
-import logging
-
-logger = logging.getLogger(__name__)
+from .authentication import user_cache
+from images.signals import variants_generated
 
 
 @receiver(post_save, sender=User)
-def send_registration_email(sender, instance, created, **kwargs):
-    """Send welcome email when a new customer registers"""
-    if created and instance.user_type == 'CUSTOMER':
-        try:
-            subject = 'Welcome to Maize Supply & Storage Enterprise'
-            message = f"""
-            Dear {instance.full_name},
-            
-            Welcome to Maize Supply & Storage Enterprise!
-            
-            Your account has been successfully created. You can now place orders and manage your profile.
-            
-            Username: {instance.username}
-            Email: {instance.email}
-            
-            If you have any questions, please don't hesitate to contact us.
-            
-            Best regards,
-            Maize Supply & Storage Team
-            """
-            
-            send_mail(
-                subject,
-                message,
-                settings.DEFAULT_FROM_EMAIL,
-                [instance.email],
-                fail_silently=False,
-            )
-            logger.info(f"Registration email sent to {instance.email}")
-        except Exception as e:
-            logger.error(f"Failed to send registration email to {instance.email}: {str(e)}")
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Drop the cached authentication row when a user is saved or deleted"""
+    user_cache.invalidate(instance.pk)
+
+
+@receiver(variants_generated, sender=User)
+def invalidate_cached_user_variants(sender, pk, **kwargs):
+    """Profile picture variants are written with update(), which sends no post_save"""
+    user_cache.invalidate(pk)
@@ -0,0 +1,62 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from customers.models import Customer
+from .authentication import UserCache
+from .models import User
+
+
+@mock.patch('accounts.services.queue_welcome_email')
+class CustomerCreationTests(TestCase):
+    """Customers get their profile and one welcome email from explicit calls, never from User.save()"""
+
+    def test_registration(self, queue_welcome_email):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/auth/register/', {
+                'username': 'ama', 'email': 'ama@example.com', 'password': 'Maize-harvest-24',
+                'password2': 'Maize-harvest-24', 'mobile_number': '+233241000001',
+            }, content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        user = User.objects.get(username='ama')
+        self.assertEqual(Customer.objects.filter(user=user).count(), 1)
+        queue_welcome_email.assert_called_once_with(user.pk)
+
+    def test_admin_add_user(self, queue_welcome_email):
+        self.client.force_login(User.objects.create_superuser(
+            username='admin', password='admin', email='admin@example.com', mobile_number='+233200000001',
+        ))
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/admin/accounts/user/add/', {
+                'username': 'kofi', 'password1': 'Maize-harvest-24', 'password2': 'Maize-harvest-24',
+                'user_type': 'CUSTOMER', 'mobile_number': '+233241000002',
+            })
+        self.assertEqual(response.status_code, 302)
+        user = User.objects.get(username='kofi')
+        self.assertEqual(Customer.objects.filter(user=user).count(), 1)
+        queue_welcome_email.assert_called_once_with(user.pk)
+
+    def test_plain_save_has_no_side_effects(self, queue_welcome_email):
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.create_user(
+                username='yaw', password='yaw-password', user_type='CUSTOMER', mobile_number='+233241000003',
+            )
+        self.assertFalse(Customer.objects.exists())
+        queue_welcome_email.assert_not_called()
+
+
+class UserCacheTests(TestCase):
+
+    def test_evicts_the_least_recently_used_user(self):
+        users = [
+            User.objects.create_user(username=f'user{i}', password='password', mobile_number=f'+23324100000{i}')
+            for i in range(3)
+        ]
+        cache = UserCache(ttl=60, max_size=2)
+        cache.set(users[0])
+        cache.set(users[1])
+        self.assertEqual(cache.get(users[0].pk).username, 'user0')
+        cache.set(users[2])
+        self.assertIsNotNone(cache.get(users[0].pk))
+        self.assertIsNone(cache.get(users[1].pk))
+        self.assertIsNotNone(cache.get(users[2].pk))
@@ -0,0 +1,38 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from .revocation import revocation_store
+
+
+class UserRefreshToken(RefreshToken):
+    """
+    Refresh token that carries the user's role and active flag.
+    Access tokens derived from it copy these claims, so authentication can
+    reject inactive users and permission checks can rely on the role without
+    reloading the user row.
+    
+    Revocation (logout and rotation) goes through the revocation store
+    instead of simplejwt's token_blacklist app, so issuing a token never
+    writes an OutstandingToken row.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token['user_type'] = user.user_type
+        token['is_active'] = user.is_active
+        return token
+
+    def verify(self):
+        super().verify()
+        if revocation_store.is_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_('Token is blacklisted'))
+
+    def blacklist(self):
+        revocation_store.revoke(
+            self.payload[api_settings.JTI_CLAIM],
+            datetime_from_epoch(self.payload['exp']),
+        )
@@ -0,0 +1,174 @@
+"""
+Group-by / filter / aggregate over a columnar snapshot.
+
+Filters become boolean masks (np.isin on dimension codes, comparisons on
+the day column). Group keys are packed into one int64 per row (mixed radix
+over each key's cardinality), np.unique turns them into dense group ids and
+np.bincount sums every measure per group in a single pass. Nothing touches
+the database.
+"""
+from datetime import date, timedelta
+
+import numpy as np
+
+from .snapshot import TABLES, get_snapshot
+
+AGGREGATES = ('count', 'sum', 'mean', 'min', 'max')
+INTERVALS = ('total', 'day', 'week', 'month', 'year')
+EPOCH = date(1970, 1, 1)
+
+
+class QueryError(Exception):
+    """A query the snapshot can't answer"""
+
+
+def _day_number(value):
+    return (value - EPOCH).days
+
+
+def _buckets(days, interval):
+    """Integer period per row: day, Monday-start week, month or year number"""
+    if interval == 'day':
+        return days.astype(np.int64)
+    if interval == 'week':
+        # 1970-01-01 was a Thursday
+        return ((days.astype(np.int64) + 3) // 7) * 7 - 3
+    if not len(days):
+        return days.astype(np.int64)
+    # Convert each distinct day in range once, then look rows up by offset
+    unit = 'M' if interval == 'month' else 'Y'
+    first = int(days.min())
+    calendar = np.arange(first, int(days.max()) + 1).astype('datetime64[D]').astype(f'datetime64[{unit}]')
+    return calendar.astype(np.int64)[days - first]
+
+
+def _period_label(value, interval):
+    if interval in ('day', 'week'):
+        return (EPOCH + timedelta(days=int(value))).isoformat()
+    unit = 'M' if interval == 'month' else 'Y'
+    return str(np.datetime64(int(value), unit))
+
+
+def _metric_value(aggregate, sums, counts, values, inverse, groups):
+    if aggregate == 'sum':
+        return sums
+    if aggregate == 'mean':
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(counts > 0, sums / np.maximum(counts, 1), 0.0)
+    result = np.full(groups, np.inf if aggregate == 'min' else -np.inf)
+    (np.minimum if aggregate == 'min' else np.maximum).at(result, inverse, values)
+    return np.where(counts > 0, result, 0.0)
+
+
+def run_query(table, metrics, group_by=(), interval='total', start=None, end=None, filters=None,
+              order_by=None, limit=None):
+    """
+    Aggregate one snapshot table. metrics are (aggregate, measure) pairs,
+    measure None for count; filters map dimension -> list of labels.
+    Returns {'table', 'snapshot', 'rows', 'matched'}.
+    """
+    if table not in TABLES:
+        raise QueryError(f"Unknown table '{table}'. Use: {', '.join(TABLES)}")
+    snapshot = get_snapshot(table)
+    if snapshot is None:
+        raise QueryError(f"No snapshot of '{table}' yet. Run build_analytics_snapshot.")
+    for name in [*group_by, *(filters or {})]:
+        if name not in snapshot.labels:
+            raise QueryError(f"Unknown dimension '{name}'. Use: {', '.join(snapshot.labels)}")
+    for aggregate, measure in metrics:
+        if aggregate != 'count' and measure not in snapshot.measures:
+            raise QueryError(f"Unknown measure '{measure}'. Use: {', '.join(snapshot.measures)}")
+
+    columns = snapshot.columns
+    mask = np.ones(snapshot.rows, dtype=bool)
+    if start:
+        mask &= columns['day'] >= _day_number(start)
+    if end:
+        mask &= columns['day'] <= _day_number(end)
+    for name, values in (filters or {}).items():
+        lookup = {label: code for code, label in enumerate(snapshot.labels[name])}
+        codes = [lookup[value] for value in values if value in lookup]
+        mask &= np.isin(columns[name], codes)
+    # Without filters every row is selected; skip the gather
+    selected = slice(None) if mask.all() else np.flatnonzero(mask)
+    matched = int(mask.sum())
+
+    # Pack every grouping key into one int64 per row
+    keys = []
+    if interval != 'total':
+        periods = _buckets(columns['day'][selected], interval)
+        offset = periods.min() if len(periods) else 0
+        keys.append((periods - offset, int(periods.max() - offset + 1) if len(periods) else 1, offset))
+    for name in group_by:
+        keys.append((columns[name][selected].astype(np.int64), len(snapshot.labels[name]), 0))
+    space = np.prod([float(cardinality) for _, cardinality, _ in keys])
+    if space >= 2**62:
+        raise QueryError('Too many distinct group combinations; group by fewer dimensions.')
+    packed = np.zeros(matched, dtype=np.int64)
+    for values, cardinality, _ in keys:
+        packed = packed * cardinality + values
+
+    if keys and space <= max(4 * matched, 2**20):
+        # Small key space: find the occupied keys with a counting pass instead of a sort
+        groups = np.flatnonzero(np.bincount(packed, minlength=int(space)))
+        dense = np.zeros(int(space), dtype=np.int64)
+        dense[groups] = np.arange(len(groups))
+        inverse = dense[packed]
+    elif keys:
+        groups, inverse = np.unique(packed, return_inverse=True)
+    else:
+        # Ungrouped: one row of totals, even when nothing matched
+        groups, inverse = np.zeros(1, dtype=np.int64), packed
+    group_count = len(groups)
+    counts = np.bincount(inverse, minlength=group_count)
+
+    results = {}
+    for aggregate, measure in metrics:
+        label = 'count' if aggregate == 'count' else f'{aggregate}_{measure}'
+        if aggregate == 'count':
+            results[label] = counts
+            continue
+        values = np.asarray(columns[measure][selected])
+        sums = np.bincount(inverse, weights=values, minlength=group_count)
+        results[label] = _metric_value(aggregate, sums, counts, values, inverse, group_count)
+
+    # Unpack the group keys back into labels, last key first
+    decoded = []
+    remainder = groups.copy()
+    for _, cardinality, offset in reversed(keys):
+        decoded.append(remainder % cardinality + offset)
+        remainder //= cardinality
+    decoded.reverse()
+    key_names = (['period'] if interval != 'total' else []) + list(group_by)
+
+    order = np.arange(group_count)
+    if order_by:
+        descending = order_by.startswith('-')
+        field = order_by.lstrip('-')
+        if field not in results:
+            raise QueryError(f"Can't order by '{field}'. Use one of: {', '.join(results)}")
+        order = np.argsort(results[field], kind='stable')
+        if descending:
+            order = order[::-1]
+    if limit:
+        order = order[:limit]
+
+    rows = []
+    for index in order:
+        row = {}
+        for name, values in zip(key_names, decoded):
+            if name == 'period':
+                row[name] = _period_label(values[index], interval)
+            else:
+                row[name] = snapshot.labels[name][values[index]]
+        for label, values in results.items():
+            value = values[index]
+            row[label] = int(value) if label == 'count' else round(float(value), 4)
+        rows.append(row)
+
+    return {
+        'table': table,
+        'snapshot': {'version': snapshot.version, 'built_at': snapshot.meta['built_at'], 'rows': snapshot.rows},
+        'matched': matched,
+        'rows': rows,
+    }
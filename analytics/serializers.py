@@ -0,0 +1,38 @@
+from rest_framework import serializers
+from .engine import AGGREGATES, INTERVALS
+from .snapshot import TABLES
+
+
+class AnalyticsQuerySerializer(serializers.Serializer):
+    """
+    Body of POST /api/analytics/query/. metrics are "count" or
+    "<aggregate>:<measure>" (e.g. "sum:quantity_bags"); filters map a
+    dimension to the labels to keep.
+    """
+    table = serializers.ChoiceField(choices=list(TABLES))
+    metrics = serializers.ListField(child=serializers.CharField(), min_length=1, default=['count'])
+    group_by = serializers.ListField(child=serializers.CharField(), required=False, default=list)
+    interval = serializers.ChoiceField(choices=INTERVALS, default='total')
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    filters = serializers.DictField(
+        child=serializers.ListField(child=serializers.CharField(allow_blank=True)), required=False, default=dict
+    )
+    order_by = serializers.CharField(required=False)
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=10000)
+
+    def validate_metrics(self, value):
+        metrics = []
+        for metric in value:
+            aggregate, _, measure = metric.partition(':')
+            if aggregate not in AGGREGATES or (aggregate == 'count') != (not measure):
+                raise serializers.ValidationError(
+                    f"Invalid metric '{metric}'. Use count or one of {', '.join(AGGREGATES[1:])} as '<aggregate>:<measure>'."
+                )
+            metrics.append((aggregate, measure or None))
+        return metrics
+
+    def validate(self, attrs):
+        if attrs.get('start') and attrs.get('end') and attrs['start'] > attrs['end']:
+            raise serializers.ValidationError({'start': 'Start must not be after end.'})
+        return attrs
@@ -0,0 +1,231 @@
+"""
+Columnar NumPy snapshots of orders, farmer supplies and stock movements.
+
+Each table is streamed once from the database and written as one .npy file
+per column: dimensions dictionary-encoded to int32 codes (labels kept in
+meta.json), the day as int32 days since 1970-01-01 in REPORTS_TIME_ZONE,
+and measures as float64. A build goes to a fresh version directory and the
+table's CURRENT pointer is swapped atomically, so queries never see a
+half-written snapshot. Readers memory-map the files, so every worker
+process shares one copy through the page cache.
+"""
+from datetime import datetime
+from itertools import islice
+import json
+import os
+import shutil
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from farmers.models import FarmerSupply
+from inventory.models import StockMovement
+from orders.models import Order
+from reports.rollups import report_timezone
+
+# Versions kept on disk besides the current one, for readers still mapping them
+KEEP_VERSIONS = 1
+
+
+class Table:
+    """How one snapshot table is read from the database"""
+
+    def __init__(self, name, model, date_field, dimensions, measures):
+        self.name = name
+        self.model = model
+        self.date_field = date_field
+        # column name -> ORM lookup
+        self.dimensions = dimensions
+        self.measures = measures
+
+    def queryset(self):
+        return self.model.objects.order_by().annotate(
+            snapshot_day=TruncDate(self.date_field, tzinfo=report_timezone())
+        ).values_list('snapshot_day', *self.dimensions.values(), *self.measures.values())
+
+
+TABLES = {
+    'orders': Table(
+        'orders', Order, 'created_at',
+        dimensions={
+            'product': 'product__name',
+            'order_status': 'order_status',
+            'payment_option': 'payment_option',
+            'delivery_method': 'delivery_method',
+            'pricing_tier': 'customer__pricing_tier',
+        },
+        measures={
+            'quantity_bags': 'quantity_bags',
+            'quantity_tons': 'quantity_tons',
+            'total_price': 'total_price',
+        },
+    ),
+    'supplies': Table(
+        'supplies', FarmerSupply, 'date_delivered',
+        dimensions={
+            'product': 'product__name',
+            'region': 'farmer__region',
+            'district': 'farmer__district',
+            'payment_status': 'payment_status',
+        },
+        measures={
+            'quantity_bags': 'quantity_bags',
+            'quantity_tons': 'quantity_tons',
+            'total_cost': 'total_cost',
+            'amount_paid': 'amount_paid',
+        },
+    ),
+    'movements': Table(
+        'movements', StockMovement, 'created_at',
+        dimensions={
+            'product': 'stock__product__name',
+            'warehouse_location': 'stock__warehouse_location',
+            'movement_type': 'movement_type',
+        },
+        measures={
+            'quantity_bags': 'quantity_bags',
+            'quantity_tons': 'quantity_tons',
+        },
+    ),
+}
+
+
+def _table_dir(name):
+    return os.path.join(settings.ANALYTICS_SNAPSHOT_DIR, name)
+
+
+def _days(values):
+    return np.array(values, dtype='datetime64[D]').astype(np.int32)
+
+
+def build_table(table, chunk_size=50000):
+    """Stream one table into a new snapshot version and make it current; returns its meta"""
+    started = time.perf_counter()
+    labels = {name: {} for name in table.dimensions}
+    columns = {name: [] for name in ['day', *table.dimensions, *table.measures]}
+
+    rows = table.queryset().iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        values = list(zip(*chunk))
+        columns['day'].append(_days(values[0]))
+        for offset, name in enumerate(table.dimensions, start=1):
+            # Encode the chunk's distinct values once, then map the whole chunk
+            uniques, inverse = np.unique(
+                np.array(['' if value is None else str(value) for value in values[offset]], dtype=object),
+                return_inverse=True,
+            )
+            codes = labels[name]
+            mapping = np.array([codes.setdefault(value, len(codes)) for value in uniques], dtype=np.int32)
+            columns[name].append(mapping[inverse])
+        for offset, name in enumerate(table.measures, start=1 + len(table.dimensions)):
+            columns[name].append(np.array(
+                [0.0 if value is None else float(value) for value in values[offset]], dtype=np.float64
+            ))
+
+    version = timezone.now().strftime('%Y%m%d%H%M%S%f')
+    directory = os.path.join(_table_dir(table.name), version)
+    os.makedirs(directory)
+    row_count = 0
+    for name, chunks in columns.items():
+        dtype = np.float64 if name in table.measures else np.int32
+        array = np.concatenate(chunks) if chunks else np.zeros(0, dtype=dtype)
+        row_count = len(array)
+        np.save(os.path.join(directory, f'{name}.npy'), array)
+
+    meta = {
+        'table': table.name,
+        'version': version,
+        'rows': row_count,
+        'built_at': timezone.now().isoformat(),
+        'build_seconds': round(time.perf_counter() - started, 3),
+        'dimensions': {name: sorted(codes, key=codes.get) for name, codes in labels.items()},
+        'measures': list(table.measures),
+    }
+    with open(os.path.join(directory, 'meta.json'), 'w') as file:
+        json.dump(meta, file)
+
+    pointer = os.path.join(_table_dir(table.name), 'CURRENT')
+    with open(pointer + '.tmp', 'w') as file:
+        file.write(version)
+    os.replace(pointer + '.tmp', pointer)
+    _prune(table.name, version)
+    return meta
+
+
+def _prune(name, current):
+    versions = sorted(
+        entry for entry in os.listdir(_table_dir(name))
+        if entry != current and os.path.isdir(os.path.join(_table_dir(name), entry))
+    )
+    for entry in versions[:max(len(versions) - KEEP_VERSIONS, 0)]:
+        shutil.rmtree(os.path.join(_table_dir(name), entry), ignore_errors=True)
+
+
+def build_snapshots(names=None):
+    """Rebuild the given tables (default: all); returns {table: meta}"""
+    return {name: build_table(TABLES[name]) for name in (names or TABLES)}
+
+
+class Snapshot:
+    """A loaded, memory-mapped snapshot version of one table"""
+
+    def __init__(self, directory):
+        with open(os.path.join(directory, 'meta.json')) as file:
+            self.meta = json.load(file)
+        self.version = self.meta['version']
+        self.labels = self.meta['dimensions']
+        self.measures = self.meta['measures']
+        self.columns = {
+            name: np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r')
+            for name in ['day', *self.labels, *self.measures]
+        }
+
+    @property
+    def rows(self):
+        return self.meta['rows']
+
+    @property
+    def built_at(self):
+        return datetime.fromisoformat(self.meta['built_at'])
+
+
+_loaded = {}
+_lock = threading.Lock()
+
+
+def get_snapshot(name, attempts=3):
+    """
+    The current snapshot of a table, or None before the first build. Re-reads
+    only when CURRENT changes. Builds in other processes may prune the version
+    read from CURRENT before it is loaded; the pointer has moved on by then,
+    so it is read again.
+    """
+    pointer = os.path.join(_table_dir(name), 'CURRENT')
+    for attempt in range(attempts):
+        try:
+            with open(pointer) as file:
+                version = file.read().strip()
+        except FileNotFoundError:
+            return None
+        snapshot = _loaded.get(name)
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        with _lock:
+            snapshot = _loaded.get(name)
+            if snapshot is not None and snapshot.version == version:
+                return snapshot
+            try:
+                snapshot = Snapshot(os.path.join(_table_dir(name), version))
+            except FileNotFoundError:
+                if attempt == attempts - 1:
+                    raise
+                continue
+            _loaded[name] = snapshot
+            return snapshot
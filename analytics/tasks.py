@@ -0,0 +1,8 @@
+from celery import shared_task
+from .snapshot import build_snapshots
+
+
+@shared_task
+def build_analytics_snapshot():
+    """Periodic rebuild of the columnar analytics snapshots (see CELERY_BEAT_SCHEDULE)"""
+    return {name: meta['rows'] for name, meta in build_snapshots().items()}
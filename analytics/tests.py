@@ -0,0 +1,37 @@
+import tempfile
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from . import snapshot
+from .snapshot import TABLES, build_table, get_snapshot
+
+
+class GetSnapshotTests(TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(ANALYTICS_SNAPSHOT_DIR=directory.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        snapshot._loaded.clear()
+        self.addCleanup(snapshot._loaded.clear)
+
+    def test_version_pruned_while_loading(self):
+        build_table(TABLES['orders'])
+        load = snapshot.Snapshot
+        rebuilt = []
+
+        def load_after_two_builds(directory):
+            # Two builds in other processes prune the version this reader took from CURRENT
+            if not rebuilt:
+                rebuilt.extend(build_table(TABLES['orders'])['version'] for _ in range(2))
+            return load(directory)
+
+        with mock.patch.object(snapshot, 'Snapshot', side_effect=load_after_two_builds):
+            current = get_snapshot('orders')
+        self.assertEqual(current.version, rebuilt[-1])
+
+    def test_before_first_build(self):
+        self.assertIsNone(get_snapshot('orders'))
@@ -0,0 +1,47 @@
+from rest_framework import viewsets, permissions, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from .engine import QueryError, run_query
+from .serializers import AnalyticsQuerySerializer
+from .snapshot import TABLES, get_snapshot
+
+
+class IsAdminOrStaff(permissions.BasePermission):
+    """Only admin and staff can access"""
+    
+    def has_permission(self, request, view):
+        return request.user.is_authenticated and request.user.user_type in ['ADMIN', 'STAFF']
+
+
+class AnalyticsViewSet(viewsets.ViewSet):
+    """Ad-hoc aggregates over the in-memory columnar snapshots; never queries the database"""
+    permission_classes = [IsAdminOrStaff]
+    
+    @action(detail=False, methods=['post'])
+    def query(self, request):
+        """Group, filter and aggregate one snapshot table"""
+        query = AnalyticsQuerySerializer(data=request.data)
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            return Response(run_query(**query.validated_data))
+        except QueryError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    @action(detail=False, methods=['get'])
+    def tables(self, request):
+        """Dimensions (with their labels), measures and freshness of each snapshot"""
+        tables = {}
+        for name in TABLES:
+            snapshot = get_snapshot(name)
+            if snapshot is None:
+                tables[name] = None
+                continue
+            tables[name] = {
+                'rows': snapshot.rows,
+                'version': snapshot.version,
+                'built_at': snapshot.meta['built_at'],
+                'dimensions': snapshot.labels,
+                'measures': snapshot.measures,
+            }
+        return Response(tables)
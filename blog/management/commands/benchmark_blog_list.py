@@ -0,0 +1,77 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.renderers import JSONRenderer
+from blog.models import BlogPost
+from blog.serializers import BlogPostSerializer, BlogPostListSerializer
+from blog.views import BlogPostViewSet
+import statistics
+import time
+
+
+class Command(BaseCommand):
+    help = 'Compare payload size and latency of full vs list-mode blog pages'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--page-size',
+            type=int,
+            default=20,
+            help='Posts per page (default: 20)',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=50,
+            help='Timed runs per mode (default: 50)',
+        )
+
+    def handle(self, *args, **kwargs):
+        page_size = kwargs['page_size']
+        repeat = kwargs['repeat']
+        published = BlogPost.objects.filter(is_published=True).order_by('-published_at')
+        if not published.exists():
+            raise CommandError('No published posts. Run create_sample_data or import_blog_posts first.')
+
+        # Before: every column including content, full serializer
+        def full_page():
+            posts = list(published.select_related('author')[:page_size])
+            return JSONRenderer().render(BlogPostSerializer(posts, many=True).data)
+
+        # After: the list view's deferred queryset and teaser serializer
+        def list_page():
+            posts = list(published.select_related('author').only(*BlogPostViewSet.list_only_fields)[:page_size])
+            return JSONRenderer().render(BlogPostListSerializer(posts, many=True).data)
+
+        self.stdout.write(f'Page of {page_size} published posts, {repeat} runs each\n')
+        results = {}
+        for label, render in (('full content', full_page), ('list mode', list_page)):
+            render()  # warm up
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                payload = render()
+                timings.append(time.perf_counter() - started)
+            results[label] = (len(payload), statistics.median(timings))
+            self.stdout.write(
+                f'{label:<13} {len(payload) / 1024:9.1f} KB  {statistics.median(timings) * 1000:7.2f} ms median'
+            )
+
+        (full_size, full_time), (list_size, list_time) = results['full content'], results['list mode']
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ List mode sends {full_size / max(list_size, 1):.1f}x less data, '
+            f'{full_time / max(list_time, 1e-9):.1f}x faster to build'
+        ))
+
+        # End to end through the view
+        with override_settings(ALLOWED_HOSTS=['*']):
+            client = Client()
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = client.get('/api/blog/', {'page_size': page_size})
+                elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f'\nGET /api/blog/: {response.status_code}, {len(response.content) / 1024:.1f} KB, '
+            f'{elapsed * 1000:.1f} ms, {len(queries)} queries'
+        )
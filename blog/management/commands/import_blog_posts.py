@@ -0,0 +1,71 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth import get_user_model
+from django.utils.dateparse import parse_datetime
+from blog.models import BlogPost
+import csv
+import json
+import os
+import time
+
+User = get_user_model()
+
+TRUE_VALUES = {'1', 'true', 'yes', 'y'}
+
+
+class Command(BaseCommand):
+    help = 'Bulk import blog posts from a JSON list or CSV file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='JSON or CSV file with title, content and category columns')
+        parser.add_argument(
+            '--author',
+            help='Username recorded as the author of the imported posts',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Posts inserted per bulk_create (default: 500)',
+        )
+
+    def handle(self, *args, **kwargs):
+        path = kwargs['path']
+        if not os.path.exists(path):
+            raise CommandError(f'File not found: {path}')
+
+        author = None
+        if kwargs['author']:
+            try:
+                author = User.objects.get(username=kwargs['author'])
+            except User.DoesNotExist:
+                raise CommandError(f'User "{kwargs["author"]}" not found.')
+
+        with open(path, encoding='utf-8-sig', newline='') as file:
+            if path.lower().endswith('.json'):
+                records = json.load(file)
+            else:
+                records = list(csv.DictReader(file))
+
+        posts = []
+        for number, record in enumerate(records, start=1):
+            missing = [field for field in ('title', 'content', 'category') if not record.get(field)]
+            if missing:
+                raise CommandError(f'Record {number} is missing: {", ".join(missing)}')
+            published_at = record.get('published_at')
+            posts.append(BlogPost(
+                title=record['title'][:255],
+                slug=record.get('slug') or '',
+                content=record['content'],
+                category=record['category'][:100],
+                image_alt_text=record.get('image_alt_text', '')[:200],
+                is_published=str(record.get('is_published', '')).lower() in TRUE_VALUES,
+                published_at=parse_datetime(published_at) if published_at else None,
+                author=author,
+            ))
+
+        started = time.perf_counter()
+        created = BlogPost.objects.bulk_import(posts, batch_size=kwargs['batch_size'])
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(f'Imported in {elapsed:.2f}s')
+        self.stdout.write(self.style.SUCCESS(f'✓ Imported {len(created)} blog posts'))
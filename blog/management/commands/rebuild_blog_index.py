@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from blog.search import get_backend
+import time
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index for blog posts'
+
+    def handle(self, *args, **kwargs):
+        backend = get_backend()
+        started = time.perf_counter()
+        with transaction.atomic():
+            count = backend.rebuild()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ Indexed {count} blog posts with {type(backend).__name__} in {elapsed:.2f}s'
+        ))
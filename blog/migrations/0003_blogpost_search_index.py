@@ -0,0 +1,50 @@
+from django.db import migrations
+
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS blog_posts_fts USING fts5("
+    "title, content, category, tokenize = 'porter unicode61')",
+    "INSERT INTO blog_posts_fts (rowid, title, content, category) "
+    "SELECT id, title, content, category FROM blog_posts",
+]
+SQLITE_BACKWARD = [
+    "DROP TABLE IF EXISTS blog_posts_fts",
+]
+
+POSTGRES_FORWARD = [
+    "ALTER TABLE blog_posts ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(category, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'C')) STORED",
+    "CREATE INDEX blog_posts_search_vector_idx ON blog_posts USING GIN (search_vector)",
+]
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS blog_posts_search_vector_idx",
+    "ALTER TABLE blog_posts DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def run_for_vendor(statements):
+    def operation(apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        for sql in statements.get(vendor, []):
+            schema_editor.execute(sql)
+    return operation
+
+
+class Migration(migrations.Migration):
+    """
+    Full-text index for blog search (see blog/search.py). Other databases get
+    no index and search falls back to icontains.
+    """
+
+    dependencies = [
+        ('blog', '0002_blogpost_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_for_vendor({'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRES_FORWARD}),
+            run_for_vendor({'sqlite': SQLITE_BACKWARD, 'postgresql': POSTGRES_BACKWARD}),
+        ),
+    ]
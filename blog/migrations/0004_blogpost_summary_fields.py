@@ -0,0 +1,42 @@
+# Generated by Django 4.2.30 on 2026-10-19 18:11
+
+from django.db import migrations, models
+from blog.utils import summarise
+
+
+def backfill_summary_fields(apps, schema_editor):
+    BlogPost = apps.get_model('blog', 'BlogPost')
+    posts = list(BlogPost.objects.only('id', 'content'))
+    for post in posts:
+        post.excerpt, post.word_count, post.reading_time = summarise(post.content)
+    BlogPost.objects.bulk_update(posts, ['excerpt', 'word_count', 'reading_time'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0003_blogpost_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=280),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='reading_time',
+            field=models.PositiveSmallIntegerField(default=1, editable=False, help_text='Minutes'),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['published_at'], name='blog_posts_publish_fc0698_idx'),
+        ),
+        migrations.RunPython(backfill_summary_fields, migrations.RunPython.noop),
+    ]
@@ -1,14 +1,90 @@
-from django.db import models
+from django.db import models, transaction, IntegrityError
+from django.db.models import Q
 from django.conf import settings
+from django.utils import timezone
 from django.utils.text import slugify
+from .search import get_backend
+from .utils import EXCERPT_LENGTH, summarise
+
+# Attempts at saving a post whose generated slug was taken concurrently
+SLUG_RETRIES = 3
+SLUG_MAX_LENGTH = 300
+
+
+class BlogPostQuerySet(models.QuerySet):
+    
+    def _taken_suffixes(self, bases):
+        """Map each slug base to the suffixes already used (0 = the bare base) in one query"""
+        taken = {base: set() for base in bases}
+        if not bases:
+            return taken
+        query = Q()
+        for base in bases:
+            query |= Q(slug=base) | Q(slug__startswith=f'{base}-')
+        for slug in BlogPost.objects.filter(query).values_list('slug', flat=True):
+            for base in bases:
+                if slug == base:
+                    taken[base].add(0)
+                elif slug.startswith(f'{base}-') and slug[len(base) + 1:].isdigit():
+                    taken[base].add(int(slug[len(base) + 1:]))
+        return taken
+    
+    @staticmethod
+    def slug_base(title):
+        # Leave room for a "-<n>" suffix within the column length
+        return slugify(title)[:SLUG_MAX_LENGTH - 8].strip('-') or 'post'
+    
+    def next_slug(self, title):
+        """First free slug for `title`: the bare slug, else one past the highest suffix"""
+        base = self.slug_base(title)
+        taken = self._taken_suffixes([base])[base]
+        if not taken:
+            return base
+        return f'{base}-{max(taken) + 1}'
+    
+    def bulk_import(self, posts, batch_size=500):
+        """
+        Insert unsaved BlogPosts with bulk_create, assigning slugs for the whole
+        batch in memory from one lookup of the existing slugs.
+        """
+        pending = [post for post in posts if not post.slug]
+        bases = sorted({self.slug_base(post.title) for post in pending})
+        taken = {}
+        # Keep the OR of prefixes to a reasonable size per query
+        for start in range(0, len(bases), 100):
+            taken.update(self._taken_suffixes(bases[start:start + 100]))
+        
+        for post in pending:
+            base = self.slug_base(post.title)
+            used = taken[base]
+            suffix = max(used) + 1 if used else 0
+            used.add(suffix)
+            post.slug = f'{base}-{suffix}' if suffix else base
+        
+        now = timezone.now()
+        for post in posts:
+            post.set_summary_fields()
+            if post.is_published and not post.published_at:
+                post.published_at = now
+        
+        with transaction.atomic():
+            created = self.bulk_create(posts, batch_size=batch_size)
+            # bulk_create sends no post_save, so index the batch here
+            get_backend().index_many(created)
+        return created
 
 
 class BlogPost(models.Model):
     """Blog post model for content management"""
     title = models.CharField(max_length=255)
-    slug = models.SlugField(max_length=300, unique=True, blank=True)
+    slug = models.SlugField(max_length=SLUG_MAX_LENGTH, unique=True, blank=True)
     content = models.TextField()
+    # Derived from content on save so list views never need to load it
+    excerpt = models.CharField(max_length=EXCERPT_LENGTH, blank=True, editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_time = models.PositiveSmallIntegerField(default=1, editable=False, help_text='Minutes')
     featured_image = models.ImageField(upload_to='blog_images/', null=True, blank=True)
+    featured_image_variants = models.JSONField(default=dict, blank=True, editable=False)
     image_alt_text = models.CharField(max_length=200, blank=True)
     category = models.CharField(max_length=100)
     is_published = models.BooleanField(default=False)
@@ -17,25 +93,43 @@ class BlogPost(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = BlogPostQuerySet.as_manager()
+    
     class Meta:
         db_table = 'blog_posts'
         ordering = ['-published_at', '-created_at']
         indexes = [
             models.Index(fields=['slug']),
             models.Index(fields=['is_published', 'published_at']),
+            # Lets the newest-first list walk the index and stop at the page size
+            models.Index(fields=['published_at']),
             models.Index(fields=['category']),
+            models.Index(fields=['updated_at']),
         ]
     
+    def set_summary_fields(self):
+        self.excerpt, self.word_count, self.reading_time = summarise(self.content)
+    
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = slugify(self.title)
-            # Ensure unique slug
-            original_slug = self.slug
-            counter = 1
-            while BlogPost.objects.filter(slug=self.slug).exists():
-                self.slug = f"{original_slug}-{counter}"
-                counter += 1
-        super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'content' in update_fields:
+            self.set_summary_fields()
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'excerpt', 'word_count', 'reading_time'}
+        
+        if self.slug:
+            return super().save(*args, **kwargs)
+        
+        # Another writer can take the same slug between lookup and insert; look again and retry
+        for attempt in range(SLUG_RETRIES):
+            self.slug = BlogPost.objects.next_slug(self.title)
+            try:
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                self.slug = ''
+                if attempt == SLUG_RETRIES - 1:
+                    raise
     
     def __str__(self):
         return self.title
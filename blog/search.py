@@ -0,0 +1,202 @@
+"""
+Full-text search over blog posts.
+
+SQLite uses an FTS5 table (blog_posts_fts) kept in sync by the signals in
+blog/signals.py. PostgreSQL uses a generated, weighted tsvector column with a
+GIN index, which the database keeps up to date itself. Other databases fall
+back to icontains without ranking or snippets.
+
+Both index-backed backends answer in two steps: ranked ids for the whole
+match set (index only), then snippets for the requested page. `?search=` on
+the list endpoint (FullTextSearchFilter) goes through the same index, as a
+subquery, and keeps the list's ordering.
+"""
+import re
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
+
+HIGHLIGHT_START = '<mark>'
+HIGHLIGHT_END = '</mark>'
+SNIPPET_WORDS = 32
+
+
+class SearchBackend:
+    """icontains fallback for databases without a full-text index"""
+
+    def search_ids(self, query, published_only):
+        from .models import BlogPost
+        posts = BlogPost.objects.filter(
+            Q(title__icontains=query) | Q(content__icontains=query) | Q(category__icontains=query)
+        )
+        if published_only:
+            posts = posts.filter(is_published=True)
+        return list(posts.order_by('-published_at').values_list('id', flat=True))
+
+    def filter(self, queryset, query):
+        """queryset narrowed to the posts matching query, in its own order"""
+        return queryset.filter(
+            Q(title__icontains=query) | Q(content__icontains=query) | Q(category__icontains=query)
+        )
+
+    def highlights(self, query, ids):
+        """{id: (rank, highlighted title, snippet)} for the given ids"""
+        return {}
+
+    def index(self, post):
+        pass
+
+    def index_many(self, posts):
+        pass
+
+    def remove(self, post_id):
+        pass
+
+    def rebuild(self):
+        return 0
+
+
+class SQLiteSearchBackend(SearchBackend):
+    table = 'blog_posts_fts'
+    # bm25 column weights: title, content, category
+    weights = (10.0, 1.0, 4.0)
+
+    @staticmethod
+    def match_expression(query):
+        # Quote every term so user input can't inject FTS5 syntax; prefix-match the last one
+        terms = re.findall(r'\w+', query)
+        if not terms:
+            return None
+        quoted = [f'"{term}"' for term in terms]
+        quoted[-1] += '*'
+        return ' '.join(quoted)
+
+    def search_ids(self, query, published_only):
+        expression = self.match_expression(query)
+        if expression is None:
+            return []
+        sql = (
+            f'SELECT f.rowid FROM {self.table} f JOIN blog_posts p ON p.id = f.rowid '
+            f'WHERE {self.table} MATCH %s {"AND p.is_published" if published_only else ""} '
+            f'ORDER BY bm25({self.table}, %s, %s, %s)'
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [expression, *self.weights])
+            return [row[0] for row in cursor.fetchall()]
+
+    def filter(self, queryset, query):
+        expression = self.match_expression(query)
+        if expression is None:
+            return queryset.none()
+        return queryset.filter(pk__in=RawSQL(
+            f'SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s', [expression]
+        ))
+
+    def highlights(self, query, ids):
+        expression = self.match_expression(query)
+        if expression is None or not ids:
+            return {}
+        placeholders = ', '.join(['%s'] * len(ids))
+        sql = (
+            f'SELECT rowid, bm25({self.table}, %s, %s, %s), '
+            f'highlight({self.table}, 0, %s, %s), '
+            f'snippet({self.table}, 1, %s, %s, %s, %s) '
+            f'FROM {self.table} WHERE {self.table} MATCH %s AND rowid IN ({placeholders})'
+        )
+        params = [*self.weights, HIGHLIGHT_START, HIGHLIGHT_END,
+                  HIGHLIGHT_START, HIGHLIGHT_END, '…', SNIPPET_WORDS, expression, *ids]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            # bm25 is lower-is-better; flip it so a higher rank means more relevant
+            return {row[0]: (-row[1], row[2], row[3]) for row in cursor.fetchall()}
+
+    def index(self, post):
+        self.index_many([post])
+
+    def index_many(self, posts):
+        rows = [(post.pk, post.title, post.content, post.category) for post in posts]
+        if not rows:
+            return
+        with connection.cursor() as cursor:
+            cursor.executemany(f'DELETE FROM {self.table} WHERE rowid = %s', [(row[0],) for row in rows])
+            cursor.executemany(
+                f'INSERT INTO {self.table} (rowid, title, content, category) VALUES (%s, %s, %s, %s)', rows
+            )
+
+    def remove(self, post_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE rowid = %s', [post_id])
+
+    def rebuild(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table}')
+            cursor.execute(
+                f'INSERT INTO {self.table} (rowid, title, content, category) '
+                f'SELECT id, title, content, category FROM blog_posts'
+            )
+            count = cursor.rowcount
+            cursor.execute(f"INSERT INTO {self.table} ({self.table}) VALUES ('optimize')")
+        return count
+
+
+class PostgresSearchBackend(SearchBackend):
+    """Uses the generated blog_posts.search_vector column (title A, category B, content C)"""
+
+    def search_ids(self, query, published_only):
+        sql = (
+            "SELECT id FROM blog_posts, websearch_to_tsquery('english', %s) q "
+            f"WHERE search_vector @@ q {'AND is_published' if published_only else ''} "
+            "ORDER BY ts_rank_cd(search_vector, q) DESC, published_at DESC NULLS LAST"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [query])
+            return [row[0] for row in cursor.fetchall()]
+
+    def filter(self, queryset, query):
+        return queryset.filter(pk__in=RawSQL(
+            "SELECT id FROM blog_posts WHERE search_vector @@ websearch_to_tsquery('english', %s)", [query]
+        ))
+
+    def highlights(self, query, ids):
+        if not ids:
+            return {}
+        options = (f'StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, '
+                   f'MaxWords={SNIPPET_WORDS}, MinWords=12, FragmentDelimiter=…, MaxFragments=2')
+        sql = (
+            "SELECT id, ts_rank_cd(search_vector, q), "
+            "ts_headline('english', title, q, %s), "
+            "ts_headline('english', content, q, %s) "
+            "FROM blog_posts, websearch_to_tsquery('english', %s) q WHERE id = ANY(%s)"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [f'{options}, HighlightAll=true', options, query, list(ids)])
+            return {row[0]: (row[1], row[2], row[3]) for row in cursor.fetchall()}
+
+    def rebuild(self):
+        # The column is generated by the database; only the index may need rebuilding
+        with connection.cursor() as cursor:
+            cursor.execute('REINDEX INDEX blog_posts_search_vector_idx')
+            cursor.execute('SELECT COUNT(*) FROM blog_posts')
+            return cursor.fetchone()[0]
+
+
+def get_backend():
+    if connection.vendor == 'sqlite':
+        return SQLiteSearchBackend()
+    if connection.vendor == 'postgresql':
+        return PostgresSearchBackend()
+    return SearchBackend()
+
+
+class FullTextSearchFilter(BaseFilterBackend):
+    """`?search=` for list views, answered by the full-text index rather than icontains over every body"""
+    search_param = api_settings.SEARCH_PARAM
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '').strip()
+        if not query:
+            return queryset
+        return get_backend().filter(queryset, query)
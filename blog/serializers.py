@@ -1,14 +1,44 @@
 from rest_framework import serializers
+from images.serializers import ImageVariantsField
 from .models import BlogPost
 
 
 class BlogPostSerializer(serializers.ModelSerializer):
     """Serializer for BlogPost model"""
     author_name = serializers.CharField(source='author.full_name', read_only=True)
+    featured_image_variants = ImageVariantsField()
     
     class Meta:
         model = BlogPost
-        fields = ['id', 'title', 'slug', 'content', 'featured_image', 'image_alt_text',
-                  'category', 'is_published', 'author', 'author_name', 'published_at',
-                  'created_at', 'updated_at']
-        read_only_fields = ['id', 'slug', 'author', 'published_at', 'created_at', 'updated_at']
+        fields = ['id', 'title', 'slug', 'content', 'excerpt', 'word_count', 'reading_time',
+                  'featured_image', 'featured_image_variants', 'image_alt_text', 'category', 'is_published', 'author',
+                  'author_name', 'published_at', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'slug', 'excerpt', 'word_count', 'reading_time', 'author',
+                            'published_at', 'created_at', 'updated_at']
+
+
+class BlogPostListSerializer(serializers.ModelSerializer):
+    """Teaser serializer for blog post lists: excerpt instead of the full content"""
+    author_name = serializers.CharField(source='author.full_name', read_only=True)
+    featured_image_variants = ImageVariantsField()
+    
+    class Meta:
+        model = BlogPost
+        fields = ['id', 'title', 'slug', 'excerpt', 'word_count', 'reading_time',
+                  'featured_image', 'featured_image_variants', 'image_alt_text', 'category', 'is_published',
+                  'author_name', 'published_at']
+        read_only_fields = fields
+
+
+class BlogPostSearchSerializer(serializers.ModelSerializer):
+    """Serializer for a ranked blog search hit with highlighted title and snippet"""
+    author_name = serializers.CharField(source='author.full_name', read_only=True)
+    featured_image_variants = ImageVariantsField()
+    rank = serializers.FloatField(source='search_rank', read_only=True)
+    title_highlight = serializers.CharField(read_only=True)
+    snippet = serializers.CharField(read_only=True)
+    
+    class Meta:
+        model = BlogPost
+        fields = ['id', 'title', 'slug', 'category', 'featured_image', 'featured_image_variants', 'image_alt_text',
+                  'author_name', 'published_at', 'reading_time', 'rank', 'title_highlight', 'snippet']
@@ -0,0 +1,20 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import BlogPost
+from .search import get_backend
+from maize_point.caching import track_deletions
+
+# Deleted posts change the blog's ETags
+track_deletions(BlogPost)
+
+
+@receiver(post_save, sender=BlogPost)
+def index_blog_post(sender, instance, **kwargs):
+    """Keep the full-text index in step with the post"""
+    get_backend().index(instance)
+
+
+@receiver(post_delete, sender=BlogPost)
+def unindex_blog_post(sender, instance, **kwargs):
+    """Drop a deleted post from the full-text index"""
+    get_backend().remove(instance.pk)
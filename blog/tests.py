@@ -0,0 +1,41 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from .models import BlogPost
+
+
+class ListSearchTests(TestCase):
+    """?search= on the list endpoint goes through the full-text index"""
+
+    def setUp(self):
+        cache.clear()
+        author = get_user_model().objects.create_user(
+            username='editor', password='editor', user_type='ADMIN', mobile_number='+233200000001',
+        )
+        for title, content, published in [
+            ('Harvest update', 'Prices are steady across Techiman this week.', True),
+            ('Storage tips', 'Dry maize below 14% moisture before storing it.', True),
+            ('Draft', 'Prices will rise next month.', False),
+        ]:
+            BlogPost.objects.create(
+                title=title, content=content, category='Market', is_published=published,
+                published_at=timezone.now(), author=author,
+            )
+
+    def search(self, query):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/blog/', {'search': query})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([query for query in queries if ' LIKE ' in query['sql']])
+        return [post['title'] for post in response.json()['results']]
+
+    def test_matches_content_of_published_posts(self):
+        self.assertEqual(self.search('prices'), ['Harvest update'])
+
+    def test_prefix_and_no_match(self):
+        self.assertEqual(self.search('moist'), ['Storage tips'])
+        self.assertEqual(self.search('drought'), [])
@@ -0,0 +1,15 @@
+from django.utils.html import strip_tags
+
+EXCERPT_LENGTH = 280
+WORDS_PER_MINUTE = 200
+
+
+def summarise(content):
+    """(excerpt, word count, reading time in minutes) of a post body"""
+    text = ' '.join(strip_tags(content or '').split())
+    word_count = len(text.split())
+    reading_time = max(1, -(-word_count // WORDS_PER_MINUTE))
+    if len(text) > EXCERPT_LENGTH:
+        # Cut on a word boundary and leave room for the ellipsis
+        text = text[:EXCERPT_LENGTH - 1].rsplit(' ', 1)[0].rstrip('.,;:') + '…'
+    return text, word_count, reading_time
@@ -1,9 +1,13 @@
-from rest_framework import viewsets, permissions
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework import viewsets, permissions, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.filters import OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils import timezone
+from maize_point.caching import ConditionalGetMixin
 from .models import BlogPost
-from .serializers import BlogPostSerializer
+from .serializers import BlogPostSerializer, BlogPostListSerializer, BlogPostSearchSerializer
+from .search import FullTextSearchFilter, get_backend
 
 
 class IsAdminOrReadOnly(permissions.BasePermission):
@@ -15,23 +19,64 @@ class IsAdminOrReadOnly(permissions.BasePermission):
         return request.user.is_authenticated and request.user.user_type == 'ADMIN'
 
 
-class BlogPostViewSet(viewsets.ModelViewSet):
+class BlogPostViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """ViewSet for BlogPost model"""
+    conditional_sources = [(BlogPost, 'updated_at')]
+    conditional_actions = ('list', 'retrieve', 'search')
     queryset = BlogPost.objects.select_related('author').all()
     serializer_class = BlogPostSerializer
     permission_classes = [IsAdminOrReadOnly]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter, OrderingFilter]
     filterset_fields = ['category', 'is_published']
-    search_fields = ['title', 'content', 'category']
     ordering_fields = ['published_at', 'created_at']
     ordering = ['-published_at']
     lookup_field = 'slug'
     
+    # Columns the list serializer reads; content stays in the database
+    list_only_fields = [
+        'id', 'title', 'slug', 'excerpt', 'word_count', 'reading_time', 'featured_image',
+        'featured_image_variants', 'image_alt_text', 'category', 'is_published', 'published_at', 'created_at',
+        'author', 'author__username', 'author__first_name', 'author__last_name',
+    ]
+    
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return BlogPostListSerializer
+        return BlogPostSerializer
+    
     def get_queryset(self):
+        queryset = self.queryset
+        if self.action == 'list':
+            queryset = queryset.only(*self.list_only_fields)
         if self.request.user.is_authenticated and self.request.user.user_type == 'ADMIN':
-            return self.queryset
+            return queryset
         # Public users see only published posts
-        return self.queryset.filter(is_published=True)
+        return queryset.filter(is_published=True)
+    
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """Full-text search ranked by relevance, with highlighted snippets"""
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({'error': 'q is required.'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        backend = get_backend()
+        is_admin = request.user.is_authenticated and request.user.user_type == 'ADMIN'
+        ids = backend.search_ids(query, published_only=not is_admin)
+        page_ids = self.paginate_queryset(ids)
+        
+        # Only the page's posts are loaded and get snippets
+        highlights = backend.highlights(query, page_ids)
+        posts = BlogPost.objects.select_related('author').only(*self.list_only_fields).in_bulk(page_ids)
+        results = []
+        for post_id in page_ids:
+            post = posts.get(post_id)
+            if post is None:
+                continue
+            post.search_rank, post.title_highlight, post.snippet = highlights.get(post_id, (None, post.title, ''))
+            results.append(post)
+        
+        return self.get_paginated_response(BlogPostSearchSerializer(results, many=True).data)
     
     def perform_create(self, serializer):
         blog_post = serializer.save(author=self.request.user)
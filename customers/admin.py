@@ -1,23 +1,36 @@
 from django.contrib import admin
-from .models import Customer
+from .models import Customer, CustomerSegment
 
 
 @admin.register(Customer)
 class CustomerAdmin(admin.ModelAdmin):
-    list_display = ['customer_id', 'user', 'location', 'is_active', 'total_orders', 'created_at']
-    list_filter = ['is_active', 'created_at']
+    list_display = ['customer_id', 'user', 'location', 'pricing_tier', 'is_active', 'total_orders', 'created_at']
+    list_filter = ['is_active', 'pricing_tier', 'created_at']
     search_fields = ['customer_id', 'user__username', 'user__email', 'user__first_name', 'user__last_name', 'location']
-    readonly_fields = ['customer_id', 'created_at', 'updated_at', 'total_orders', 'total_spent']
+    readonly_fields = ['customer_id', 'created_at', 'updated_at', 'total_orders', 'total_spent', 'last_order_at']
     ordering = ['-created_at']
     
     fieldsets = (
         ('Customer Information', {
-            'fields': ('customer_id', 'user', 'location', 'is_active')
+            'fields': ('customer_id', 'user', 'location', 'pricing_tier', 'is_active')
         }),
         ('Statistics', {
-            'fields': ('total_orders', 'total_spent')
+            'fields': ('total_orders', 'total_spent', 'last_order_at')
         }),
         ('Timestamps', {
             'fields': ('created_at', 'updated_at')
         }),
     )
+
+
+@admin.register(CustomerSegment)
+class CustomerSegmentAdmin(admin.ModelAdmin):
+    list_display = ['customer', 'segment', 'recency_days', 'frequency', 'monetary', 'trend',
+                    'recency_score', 'frequency_score', 'monetary_score', 'computed_at']
+    list_filter = ['segment', 'recency_score', 'frequency_score', 'monetary_score']
+    search_fields = ['customer__customer_id', 'customer__user__first_name', 'customer__user__last_name']
+    list_select_related = ['customer__user']
+    ordering = ['segment', '-monetary']
+    
+    def has_add_permission(self, request):
+        return False
@@ -0,0 +1,83 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Sum, Count, Max, Q
+from customers.models import Customer
+from orders.models import Order
+from decimal import Decimal
+
+
+class Command(BaseCommand):
+    help = 'Backfill and reconcile the stored customer order counters'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report mismatches without writing them',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Customers updated per bulk_update (default: 1000)',
+        )
+
+    def handle(self, *args, **kwargs):
+        dry_run = kwargs['dry_run']
+        batch_size = kwargs['batch_size']
+
+        # One grouped query for the true values of every customer
+        expected = {
+            row['customer']: row
+            for row in Order.objects.order_by().values('customer').annotate(
+                count=Count('id'),
+                revenue=Sum('total_price', filter=Q(order_status='DELIVERED')),
+                last=Max('created_at'),
+            )
+        }
+
+        fields = ['order_count', 'delivered_revenue', 'last_order_at']
+        checked = 0
+        mismatched = []
+        batch = []
+        customers = Customer.objects.only('id', 'customer_id', *fields).order_by('id')
+
+        for customer in customers.iterator(chunk_size=batch_size):
+            checked += 1
+            row = expected.get(customer.id, {})
+            count = row.get('count', 0)
+            revenue = row.get('revenue') or Decimal('0.00')
+            last = row.get('last')
+
+            if (customer.order_count, customer.delivered_revenue, customer.last_order_at) == (count, revenue, last):
+                continue
+
+            mismatched.append(customer.customer_id)
+            self.stdout.write(
+                f'  {customer.customer_id}: orders {customer.order_count} -> {count}, '
+                f'revenue {customer.delivered_revenue} -> {revenue}, '
+                f'last order {customer.last_order_at} -> {last}'
+            )
+            customer.order_count = count
+            customer.delivered_revenue = revenue
+            customer.last_order_at = last
+            batch.append(customer)
+
+            if len(batch) >= batch_size:
+                self._flush(batch, fields, dry_run)
+                batch = []
+
+        self._flush(batch, fields, dry_run)
+
+        self.stdout.write(f'Customers checked: {checked}')
+        if not mismatched:
+            self.stdout.write(self.style.SUCCESS('✓ All customer counters are consistent'))
+        elif dry_run:
+            self.stdout.write(self.style.WARNING(f'Mismatched customers: {len(mismatched)} (dry run, nothing written)'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'✓ Corrected {len(mismatched)} customers'))
+
+    def _flush(self, batch, fields, dry_run):
+        if batch and not dry_run:
+            with transaction.atomic():
+                Customer.objects.bulk_update(batch, fields)
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from customers.segmentation import rebuild_segments
+
+
+class Command(BaseCommand):
+    help = 'Recompute RFM customer segments from all orders'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Segments inserted per bulk_create batch (default: 5000)',
+        )
+
+    def handle(self, *args, **kwargs):
+        self.stdout.write('Computing customer segments...')
+        summary = rebuild_segments(batch_size=kwargs['batch_size'])
+
+        self.stdout.write(f'Orders scanned: {summary["orders"]}')
+        self.stdout.write(f'Customers segmented: {summary["customers"]}')
+        for segment, count in summary['segments'].items():
+            self.stdout.write(f'  {segment}: {count}')
+        timings = summary['timings']
+        self.stdout.write(
+            f'Load {timings["load"]:.2f}s, compute {timings["compute"]:.2f}s, '
+            f'write {timings["write"]:.2f}s'
+        )
+        self.stdout.write(self.style.SUCCESS('✓ Customer segments updated'))
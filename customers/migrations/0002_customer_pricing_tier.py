@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 17:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customer',
+            name='pricing_tier',
+            field=models.CharField(choices=[('STANDARD', 'Standard'), ('WHOLESALE', 'Wholesale'), ('DISTRIBUTOR', 'Distributor')], default='STANDARD', help_text='Negotiated pricing tier used when quoting orders', max_length=20),
+        ),
+    ]
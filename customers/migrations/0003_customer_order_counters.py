@@ -0,0 +1,47 @@
+# Generated by Django 4.2.30 on 2026-10-19 17:50
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Q, Sum
+
+
+def backfill_order_counters(apps, schema_editor):
+    Customer = apps.get_model('customers', 'Customer')
+    Order = apps.get_model('orders', 'Order')
+    rows = Order.objects.order_by().values('customer').annotate(
+        count=Count('id'),
+        revenue=Sum('total_price', filter=Q(order_status='DELIVERED')),
+        last=Max('created_at'),
+    )
+    for row in rows:
+        Customer.objects.filter(pk=row['customer']).update(
+            order_count=row['count'],
+            delivered_revenue=row['revenue'] or 0,
+            last_order_at=row['last'],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0002_customer_pricing_tier'),
+        ('orders', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customer',
+            name='delivered_revenue',
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, max_digits=14),
+        ),
+        migrations.AddField(
+            model_name='customer',
+            name='last_order_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='customer',
+            name='order_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_order_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-19 17:52
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0003_customer_order_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CustomerSegment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('segment', models.CharField(choices=[('CHAMPION', 'Champion'), ('LOYAL', 'Loyal'), ('NEW', 'New'), ('GROWING', 'Growing'), ('AT_RISK', 'At Risk'), ('LAPSING', 'Lapsing'), ('LOST', 'Lost'), ('OCCASIONAL', 'Occasional')], max_length=20)),
+                ('recency_days', models.PositiveIntegerField(help_text='Days since the last non-cancelled order')),
+                ('frequency', models.PositiveIntegerField(help_text='Number of non-cancelled orders')),
+                ('monetary', models.DecimalField(decimal_places=2, help_text='Value of non-cancelled orders (GHS)', max_digits=14)),
+                ('trend', models.FloatField(help_text='Recent vs previous period spend, from -1 (stopped) to 1 (new spend)')),
+                ('recency_score', models.PositiveSmallIntegerField()),
+                ('frequency_score', models.PositiveSmallIntegerField()),
+                ('monetary_score', models.PositiveSmallIntegerField()),
+                ('computed_at', models.DateTimeField()),
+                ('customer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='segment', to='customers.customer')),
+            ],
+            options={
+                'db_table': 'customer_segments',
+                'ordering': ['segment', '-monetary'],
+                'indexes': [models.Index(fields=['segment', 'monetary'], name='customer_se_segment_668d00_idx'), models.Index(fields=['recency_score', 'frequency_score', 'monetary_score'], name='customer_se_recency_55b1aa_idx')],
+            },
+        ),
+    ]
@@ -5,6 +5,13 @@ import uuid
 
 class Customer(models.Model):
     """Customer model linked to User"""
+    
+    PRICING_TIER_CHOICES = (
+        ('STANDARD', 'Standard'),
+        ('WHOLESALE', 'Wholesale'),
+        ('DISTRIBUTOR', 'Distributor'),
+    )
+    
     user = models.OneToOneField(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -12,7 +19,17 @@ class Customer(models.Model):
     )
     customer_id = models.CharField(max_length=20, unique=True, editable=False)
     location = models.CharField(max_length=255, help_text='Customer location/address')
+    pricing_tier = models.CharField(
+        max_length=20,
+        choices=PRICING_TIER_CHOICES,
+        default='STANDARD',
+        help_text='Negotiated pricing tier used when quoting orders'
+    )
     is_active = models.BooleanField(default=True)
+    # Denormalized order statistics, maintained by orders.signals
+    order_count = models.PositiveIntegerField(default=0, editable=False)
+    delivered_revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0, editable=False)
+    last_order_at = models.DateTimeField(null=True, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -35,11 +52,45 @@ class Customer(models.Model):
     
     @property
     def total_orders(self):
-        return self.orders.count()
+        return self.order_count
     
     @property
     def total_spent(self):
-        from orders.models import Order
-        return self.orders.filter(
-            order_status__in=['DELIVERED']
-        ).aggregate(total=models.Sum('total_price'))['total'] or 0
+        return self.delivered_revenue
+
+
+class CustomerSegment(models.Model):
+    """RFM segmentation result for a customer, rebuilt in batch"""
+    
+    SEGMENT_CHOICES = (
+        ('CHAMPION', 'Champion'),
+        ('LOYAL', 'Loyal'),
+        ('NEW', 'New'),
+        ('GROWING', 'Growing'),
+        ('AT_RISK', 'At Risk'),
+        ('LAPSING', 'Lapsing'),
+        ('LOST', 'Lost'),
+        ('OCCASIONAL', 'Occasional'),
+    )
+    
+    customer = models.OneToOneField(Customer, on_delete=models.CASCADE, related_name='segment')
+    segment = models.CharField(max_length=20, choices=SEGMENT_CHOICES)
+    recency_days = models.PositiveIntegerField(help_text='Days since the last non-cancelled order')
+    frequency = models.PositiveIntegerField(help_text='Number of non-cancelled orders')
+    monetary = models.DecimalField(max_digits=14, decimal_places=2, help_text='Value of non-cancelled orders (GHS)')
+    trend = models.FloatField(help_text='Recent vs previous period spend, from -1 (stopped) to 1 (new spend)')
+    recency_score = models.PositiveSmallIntegerField()
+    frequency_score = models.PositiveSmallIntegerField()
+    monetary_score = models.PositiveSmallIntegerField()
+    computed_at = models.DateTimeField()
+    
+    class Meta:
+        db_table = 'customer_segments'
+        ordering = ['segment', '-monetary']
+        indexes = [
+            models.Index(fields=['segment', 'monetary']),
+            models.Index(fields=['recency_score', 'frequency_score', 'monetary_score']),
+        ]
+    
+    def __str__(self):
+        return f"{self.customer.customer_id} - {self.get_segment_display()}"
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Customer
+from .models import Customer, CustomerSegment
 from accounts.serializers import UserSerializer
 
 
@@ -11,9 +11,9 @@ class CustomerSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Customer
-        fields = ['id', 'user', 'customer_id', 'location', 'is_active',
-                  'total_orders', 'total_spent', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'customer_id', 'created_at', 'updated_at']
+        fields = ['id', 'user', 'customer_id', 'location', 'pricing_tier', 'is_active',
+                  'total_orders', 'total_spent', 'last_order_at', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'customer_id', 'pricing_tier', 'created_at', 'updated_at']
 
 
 class CustomerUpdateSerializer(serializers.ModelSerializer):
@@ -22,3 +22,15 @@ class CustomerUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Customer
         fields = ['location']
+
+
+class CustomerSegmentSerializer(serializers.ModelSerializer):
+    """Serializer for CustomerSegment model"""
+    customer_code = serializers.CharField(source='customer.customer_id', read_only=True)
+    customer_name = serializers.CharField(source='customer.user.full_name', read_only=True)
+    
+    class Meta:
+        model = CustomerSegment
+        fields = ['customer', 'customer_code', 'customer_name', 'segment', 'recency_days',
+                  'frequency', 'monetary', 'trend', 'recency_score', 'frequency_score',
+                  'monetary_score', 'computed_at']
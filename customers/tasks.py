@@ -0,0 +1,9 @@
+from celery import shared_task
+from .segmentation import rebuild_segments
+
+
+@shared_task
+def rebuild_customer_segments():
+    """Full RFM rebuild queued by POST /api/customers/segments/, off the web worker"""
+    summary = rebuild_segments()
+    return {name: summary[name] for name in ('orders', 'customers', 'segments')}
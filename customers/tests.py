@@ -0,0 +1,67 @@
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from monitoring.benchmarks import api_client
+from orders.models import Order
+from products.models import Product
+from .models import Customer, CustomerSegment
+from .tasks import rebuild_customer_segments
+
+
+class SegmentationTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.product = Product.objects.create(name='Yellow Maize', description='Test', packaging_sizes=['50kg bag'])
+        self.customers = 0
+
+    def customer_with_orders(self, *days_ago, bags=10):
+        """A customer with one order of `bags` bags placed each of days_ago"""
+        self.customers += 1
+        user = get_user_model().objects.create_user(
+            username=f'customer{self.customers}', password='customer', user_type='CUSTOMER',
+            mobile_number=f'+23324100{self.customers:04d}',
+        )
+        customer = Customer.objects.create(user=user, location='Accra')
+        for days in days_ago:
+            order = Order.objects.create(
+                customer=customer, product=self.product, quantity_bags=bags, quantity_tons=Decimal('0.050') * bags,
+                unit_price=Decimal('250.00'), delivery_method='PICKUP', payment_option='MOBILE_MONEY',
+                order_status='DELIVERED',
+            )
+            Order.objects.filter(pk=order.pk).update(created_at=timezone.now() - timedelta(days=days))
+        return customer
+
+    def test_scores_customers_into_segments(self):
+        customers = {
+            'champion': self.customer_with_orders(1, 5, 10, 20, 30, 40, 50, 60, bags=40),
+            'new': self.customer_with_orders(3),
+            'at_risk': self.customer_with_orders(200, 220, 240, 260, 280, 300),
+            'lost': self.customer_with_orders(500),
+            'occasional': self.customer_with_orders(60, 120),
+        }
+        summary = rebuild_customer_segments()
+        self.assertEqual(summary['customers'], 5)
+        labels = dict(CustomerSegment.objects.values_list('customer_id', 'segment'))
+        self.assertEqual({name: labels[customer.pk] for name, customer in customers.items()}, {
+            'champion': 'CHAMPION', 'new': 'NEW', 'at_risk': 'AT_RISK', 'lost': 'LOST', 'occasional': 'OCCASIONAL',
+        })
+        champion = CustomerSegment.objects.get(customer=customers['champion'])
+        self.assertEqual((champion.recency_days, champion.frequency, champion.monetary), (1, 8, Decimal('80000.00')))
+
+    @mock.patch('customers.views.rebuild_customer_segments')
+    def test_post_queues_the_rebuild(self, task):
+        task.delay.return_value.id = 'task-1'
+        admin = get_user_model().objects.create_user(
+            username='admin', password='admin', user_type='ADMIN', mobile_number='+233200000001',
+        )
+        response = api_client(admin).post('/api/customers/segments/')
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()['task_id'], 'task-1')
+        task.delay.assert_called_once_with()
@@ -1,8 +1,12 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from .models import Customer
-from .serializers import CustomerSerializer, CustomerUpdateSerializer
+from .models import Customer, CustomerSegment
+from .serializers import CustomerSerializer, CustomerUpdateSerializer, CustomerSegmentSerializer
+from .tasks import rebuild_customer_segments
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class IsAdminOrOwner(permissions.BasePermission):
@@ -55,3 +59,36 @@ class CustomerViewSet(viewsets.ModelViewSet):
             serializer.is_valid(raise_exception=True)
             serializer.save()
             return Response(CustomerSerializer(customer).data)
+    
+    @action(detail=False, methods=['get', 'post'])
+    def segments(self, request):
+        """List RFM customer segments (GET) or queue their recomputation (POST), admin only"""
+        if request.user.user_type != 'ADMIN':
+            return Response(
+                {'error': 'Only admins can view customer segments.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        if request.method == 'POST':
+            # A full-table rebuild takes seconds at production volume: run it on a Celery worker
+            try:
+                task = rebuild_customer_segments.delay()
+            except Exception as e:
+                logger.error(f"Failed to queue customer segment rebuild: {str(e)}")
+                return Response(
+                    {'error': 'Could not queue the segment rebuild. Try again or run segment_customers.'},
+                    status=status.HTTP_503_SERVICE_UNAVAILABLE
+                )
+            return Response(
+                {'message': 'Customer segment rebuild queued.', 'task_id': task.id},
+                status=status.HTTP_202_ACCEPTED
+            )
+        
+        segments = CustomerSegment.objects.select_related('customer__user')
+        segment = request.query_params.get('segment')
+        if segment:
+            segments = segments.filter(segment=segment.upper())
+        
+        page = self.paginate_queryset(segments)
+        serializer = CustomerSegmentSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
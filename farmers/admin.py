@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Farmer, FarmerSupply
+from .models import Farmer, FarmerSupply, FarmerMergeSuggestion
 
 
 @admin.register(Farmer)
@@ -53,3 +53,19 @@ class FarmerSupplyAdmin(admin.ModelAdmin):
             'fields': ('created_at', 'updated_at')
         }),
     )
+
+
+@admin.register(FarmerMergeSuggestion)
+class FarmerMergeSuggestionAdmin(admin.ModelAdmin):
+    list_display = ['farmer', 'duplicate', 'score', 'name_similarity', 'distance_km', 'status', 'reviewed_by', 'created_at']
+    list_filter = ['status', 'created_at']
+    search_fields = ['farmer__full_name', 'duplicate__full_name', 'farmer__mobile_number', 'duplicate__mobile_number']
+    list_select_related = ['farmer', 'duplicate', 'reviewed_by']
+    raw_id_fields = ['farmer', 'duplicate']
+    readonly_fields = ['score', 'name_similarity', 'distance_km', 'created_at', 'updated_at']
+    ordering = ['-score']
+    
+    def save_model(self, request, obj, form, change):
+        if 'status' in form.changed_data:
+            obj.reviewed_by = request.user
+        super().save_model(request, obj, form, change)
@@ -0,0 +1,175 @@
+"""
+Fuzzy duplicate detection for farmers.
+
+Candidate pairs are limited with blocking keys so we never compare every
+farmer with every other one: the same district and community (ignoring
+case), the same geohash cell (~5 km), or the same phonetic name key. The
+keys are stored on Farmer, so the request path and the batch command block
+the same way. Candidates are then scored on name similarity and GPS distance.
+"""
+from collections import defaultdict, namedtuple
+from difflib import SequenceMatcher
+from itertools import combinations
+import math
+import re
+
+from django.db.models import Q
+
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+GEOHASH_PRECISION = 7
+# Blocking cell: 5 characters is roughly 4.9 km x 4.9 km
+GEOHASH_BLOCK = 5
+NAME_WEIGHT = 0.7
+# Farmers further apart than this get no location credit
+DISTANCE_CUTOFF_KM = 5.0
+
+SOUNDEX_CODES = {
+    **dict.fromkeys('bfpv', '1'), **dict.fromkeys('cgjkqsxz', '2'),
+    **dict.fromkeys('dt', '3'), 'l': '4', **dict.fromkeys('mn', '5'), 'r': '6',
+}
+
+
+def normalise_name(name):
+    """Lowercase name tokens in sorted order, so 'Mensah Kwame' matches 'Kwame Mensah'"""
+    return ' '.join(sorted(re.findall(r'[a-z]+', (name or '').lower())))
+
+
+def soundex(word):
+    if not word:
+        return ''
+    code = word[0].upper()
+    previous = SOUNDEX_CODES.get(word[0], '')
+    for letter in word[1:]:
+        digit = SOUNDEX_CODES.get(letter, '')
+        if digit and digit != previous:
+            code += digit
+        if letter not in 'hw':
+            previous = digit
+    return (code + '000')[:4]
+
+
+def name_key(name):
+    """Phonetic key of the first and last name, independent of their order"""
+    tokens = re.findall(r'[a-z]+', (name or '').lower())
+    if not tokens:
+        return ''
+    return ' '.join(sorted({soundex(tokens[0]), soundex(tokens[-1])}))
+
+
+def place_key(district, community):
+    """District and community, case and whitespace folded, so 'Ejisu' and ' ejisu' block together"""
+    return '|'.join(' '.join((part or '').lower().split()) for part in (district, community))
+
+
+def geohash(latitude, longitude, precision=GEOHASH_PRECISION):
+    if latitude is None or longitude is None:
+        return ''
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    latitude, longitude = float(latitude), float(longitude)
+    code, bits, bit_count, even = [], 0, 0, True
+    while len(code) < precision:
+        window, value = (lon_range, longitude) if even else (lat_range, latitude)
+        middle = (window[0] + window[1]) / 2
+        bits <<= 1
+        if value >= middle:
+            bits |= 1
+            window[0] = middle
+        else:
+            window[1] = middle
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            code.append(GEOHASH_ALPHABET[bits])
+            bits, bit_count = 0, 0
+    return ''.join(code)
+
+
+def _haversine_radians(lat1, lon1, lat2, lon2):
+    a = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 6371.0 * 2 * math.asin(math.sqrt(a))
+
+
+class DedupeRecord(namedtuple('DedupeRecord', 'id name latitude longitude')):
+    """A farmer reduced to what scoring needs: normalised name and coordinates in radians"""
+
+    @classmethod
+    def build(cls, id, full_name, latitude, longitude):
+        return cls(id, normalise_name(full_name), math.radians(float(latitude)), math.radians(float(longitude)))
+
+
+def score_pair(first, second, threshold=0.0):
+    """
+    Score two DedupeRecords. Returns (score, name_similarity, distance_km),
+    or None as soon as the pair provably can't reach `threshold`.
+    """
+    distance = _haversine_radians(first.latitude, first.longitude, second.latitude, second.longitude)
+    location = max(0.0, 1 - distance / DISTANCE_CUTOFF_KM)
+    needed = (threshold - (1 - NAME_WEIGHT) * location) / NAME_WEIGHT
+
+    # ratio() is the expensive part; its cheap upper bounds reject most pairs first
+    matcher = SequenceMatcher(None, first.name, second.name)
+    if matcher.real_quick_ratio() < needed or matcher.quick_ratio() < needed:
+        return None
+    name_similarity = matcher.ratio()
+    if name_similarity < needed:
+        return None
+    return NAME_WEIGHT * name_similarity + (1 - NAME_WEIGHT) * location, name_similarity, distance
+
+
+def blocking_filter(data):
+    """Q matching farmers that share at least one blocking key with `data`"""
+    query = Q(place_key=place_key(data['district'], data['community']))
+    cell = geohash(data['gps_latitude'], data['gps_longitude'])[:GEOHASH_BLOCK]
+    if cell:
+        query |= Q(geohash__startswith=cell)
+    key = name_key(data['full_name'])
+    if key:
+        query |= Q(name_key=key)
+    return query
+
+
+def find_duplicates(data, queryset, threshold, limit=500):
+    """
+    Farmers in `queryset` that look like the farmer described by `data`,
+    as [(score, name_similarity, distance_km, farmer)] best first.
+    Cheap enough for the request path: one indexed query, at most `limit` rows.
+    """
+    candidates = queryset.filter(blocking_filter(data)).only(
+        'id', 'full_name', 'mobile_number', 'ghana_card_number', 'community',
+        'district', 'gps_latitude', 'gps_longitude',
+    )[:limit]
+    record = DedupeRecord.build(None, data['full_name'], data['gps_latitude'], data['gps_longitude'])
+    matches = []
+    for farmer in candidates:
+        result = score_pair(record, DedupeRecord.build(
+            farmer.id, farmer.full_name, farmer.gps_latitude, farmer.gps_longitude
+        ), threshold)
+        if result is not None:
+            matches.append((*result, farmer))
+    matches.sort(key=lambda match: -match[0])
+    return matches
+
+
+def candidate_pairs(rows, max_block_size):
+    """
+    Unique (id, id) pairs sharing a blocking key, from rows of
+    (id, place_key, geohash, name_key). Blocks larger than max_block_size
+    are skipped and returned separately.
+    """
+    blocks = defaultdict(list)
+    for farmer_id, place, cell, key in rows:
+        blocks[('place', place)].append(farmer_id)
+        if cell:
+            blocks[('cell', cell[:GEOHASH_BLOCK])].append(farmer_id)
+        if key:
+            blocks[('name', key)].append(farmer_id)
+
+    pairs = set()
+    oversized = []
+    for block, ids in blocks.items():
+        if len(ids) > max_block_size:
+            oversized.append((block, len(ids)))
+            continue
+        pairs.update(combinations(sorted(ids), 2))
+    return pairs, oversized
@@ -0,0 +1,51 @@
+import django_filters
+
+from maize_point.exports import ExportError
+from .models import FarmerSupply
+
+# (header, values_list lookup)
+SUPPLY_EXPORT_COLUMNS = [
+    ('id', 'id'),
+    ('date_delivered', 'date_delivered'),
+    ('farmer', 'farmer__full_name'),
+    ('region', 'farmer__region'),
+    ('district', 'farmer__district'),
+    ('product', 'product__name'),
+    ('quantity_bags', 'quantity_bags'),
+    ('quantity_tons', 'quantity_tons'),
+    ('cost_per_bag', 'cost_per_bag'),
+    ('total_cost', 'total_cost'),
+    ('amount_paid', 'amount_paid'),
+    ('payment_status', 'payment_status'),
+]
+
+# query parameter: lookup
+SUPPLY_EXPORT_FILTERS = {
+    'farmer': 'farmer',
+    'product': 'product',
+    'payment_status': 'payment_status',
+    'region': 'farmer__region',
+    'district': 'farmer__district',
+}
+
+
+class SupplyExportFilter(django_filters.FilterSet):
+    """SUPPLY_EXPORT_FILTERS, validated like the list endpoints' filterset_fields"""
+    region = django_filters.CharFilter(field_name='farmer__region')
+    district = django_filters.CharFilter(field_name='farmer__district')
+
+    class Meta:
+        model = FarmerSupply
+        fields = ['farmer', 'product', 'payment_status', 'region', 'district']
+
+
+def supply_export_queryset(params=None):
+    supplies = FarmerSupply.objects.order_by('-date_delivered')
+    if not params:
+        return supplies
+    filterset = SupplyExportFilter({name: params.get(name) for name in SUPPLY_EXPORT_FILTERS}, queryset=supplies)
+    if not filterset.is_valid():
+        raise ExportError('; '.join(
+            f'Invalid {name}: {" ".join(messages)}' for name, messages in filterset.errors.items()
+        ))
+    return filterset.qs
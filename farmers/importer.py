@@ -0,0 +1,245 @@
+"""
+Bulk farmer import from CSV or XLSX.
+
+Rows are streamed from the file in chunks. Each chunk is validated (Ghana
+Card format, phone number parse, GPS range), in a process pool when the
+import_farmers command asks for one and the file is large enough to pay
+for it, then checked against the existing unique keys held in memory as
+sets, and inserted with bulk_create. Rows that fail are collected with
+their line number for a downloadable error report.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal, InvalidOperation
+import csv
+import io
+import os
+import re
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from phonenumber_field.phonenumber import PhoneNumber, to_python
+
+from .models import Farmer
+
+GHANA_CARD_PATTERN = re.compile(r'^GHA-\d{9}-\d$')
+
+REQUIRED_COLUMNS = [
+    'full_name', 'mobile_number', 'ghana_card_number', 'gps_latitude',
+    'gps_longitude', 'region', 'district', 'community',
+]
+OPTIONAL_COLUMNS = ['maize_types_supplied', 'notes']
+REPORT_COLUMNS = ['row', 'field', 'error'] + REQUIRED_COLUMNS + OPTIONAL_COLUMNS
+
+
+class ImportFileError(Exception):
+    """The uploaded file cannot be read as a farmer import"""
+
+
+def _normalise_header(value):
+    return str(value or '').strip().lower().replace(' ', '_')
+
+
+def _check_columns(columns):
+    missing = [column for column in REQUIRED_COLUMNS if column not in columns]
+    if missing:
+        raise ImportFileError(f"Missing required columns: {', '.join(missing)}")
+
+
+def read_rows(file, filename):
+    """Yield (row_number, row dict) from a CSV or XLSX upload without loading it all"""
+    extension = os.path.splitext(filename or '')[1].lower()
+
+    if extension == '.xlsx':
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ImportFileError('XLSX import requires openpyxl. Install it or upload a CSV file.')
+        try:
+            workbook = load_workbook(file, read_only=True, data_only=True)
+        except Exception:
+            raise ImportFileError('File is not a valid XLSX workbook.')
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [_normalise_header(value) for value in next(rows, ())]
+        _check_columns(header)
+        for number, values in enumerate(rows, start=2):
+            if not any(value not in (None, '') for value in values):
+                continue
+            yield number, {
+                column: '' if value is None else str(value).strip()
+                for column, value in zip(header, values) if column
+            }
+        workbook.close()
+
+    elif extension in ('.csv', ''):
+        text = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+        reader = csv.reader(text)
+        header = [_normalise_header(value) for value in next(reader, [])]
+        _check_columns(header)
+        for values in reader:
+            if not any(value.strip() for value in values):
+                continue
+            yield reader.line_num, {
+                column: value.strip() for column, value in zip(header, values) if column
+            }
+
+    else:
+        raise ImportFileError('Unsupported file type. Upload a .csv or .xlsx file.')
+
+
+def validate_row(item):
+    """
+    Validate one (row_number, row) pair.
+    Returns (row_number, cleaned fields or None, [(field, error), ...]).
+    Module level and free of ORM access so it can run in worker processes.
+    """
+    number, row = item
+    errors = []
+    cleaned = {}
+
+    for column in REQUIRED_COLUMNS:
+        if not row.get(column):
+            errors.append((column, 'This field is required.'))
+
+    for column in ('full_name', 'region', 'district', 'community'):
+        value = row.get(column, '')
+        if len(value) > 255 or (column != 'full_name' and len(value) > 100):
+            errors.append((column, 'Value is too long.'))
+        cleaned[column] = value
+
+    card = row.get('ghana_card_number', '').upper()
+    if card and not GHANA_CARD_PATTERN.match(card):
+        errors.append(('ghana_card_number', 'Invalid Ghana Card format. Use: GHA-123456789-0'))
+    cleaned['ghana_card_number'] = card
+
+    mobile = row.get('mobile_number', '')
+    if mobile:
+        # A parsed PhoneNumber pickles back to the parent, which then doesn't parse it again
+        phone = to_python(mobile, region='GH')
+        if isinstance(phone, PhoneNumber) and phone.is_valid():
+            cleaned['mobile_number'] = phone
+        else:
+            errors.append(('mobile_number', 'Enter a valid phone number.'))
+
+    for column, limit in (('gps_latitude', 90), ('gps_longitude', 180)):
+        value = row.get(column, '')
+        if not value:
+            continue
+        try:
+            coordinate = Decimal(value).quantize(Decimal('0.000001'))
+        except InvalidOperation:
+            errors.append((column, 'Enter a number.'))
+            continue
+        if not -limit <= coordinate <= limit:
+            errors.append((column, f'Must be between -{limit} and {limit}'))
+        cleaned[column] = coordinate
+
+    maize_types = row.get('maize_types_supplied', '')
+    cleaned['maize_types_supplied'] = [value.strip() for value in re.split(r'[;,]', maize_types) if value.strip()]
+    cleaned['notes'] = row.get('notes', '')
+
+    return number, (None if errors else cleaned), errors
+
+
+class FarmerImporter:
+    """
+    Validate and insert farmers from rows produced by read_rows(). Validation
+    runs inline unless `workers` > 1; only the import_farmers command asks
+    for a process pool, as forking inside a web worker mid-request is unsafe.
+    """
+
+    def __init__(self, created_by=None, workers=1, batch_size=1000, dry_run=False):
+        self.created_by = created_by
+        self.workers = workers
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.total = 0
+        self.created = 0
+        self.errors = []  # (row_number, field, error, row)
+
+    def run(self, rows):
+        # Existing unique keys, loaded once; accepted rows are added as we go
+        self.mobiles = set(str(value) for value in Farmer.objects.values_list('mobile_number', flat=True))
+        self.cards = set(Farmer.objects.values_list('ghana_card_number', flat=True))
+
+        pool = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            chunk = []
+            for item in rows:
+                chunk.append(item)
+                if len(chunk) >= settings.FARMER_IMPORT_CHUNK_SIZE:
+                    self._process(chunk, pool)
+                    chunk = []
+            if chunk:
+                self._process(chunk, pool)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        self.errors.sort(key=lambda error: error[0])
+        return self
+
+    def _process(self, chunk, pool):
+        self.total += len(chunk)
+        if pool is not None and len(chunk) >= settings.FARMER_IMPORT_PARALLEL_THRESHOLD:
+            results = pool.map(validate_row, chunk, chunksize=max(len(chunk) // (self.workers * 4), 1))
+        else:
+            results = map(validate_row, chunk)
+
+        rows = dict(chunk)
+        farmers = []
+        for number, cleaned, errors in results:
+            if cleaned is not None:
+                mobile = cleaned['mobile_number'].as_e164
+                if mobile in self.mobiles:
+                    errors.append(('mobile_number', 'A farmer with this mobile number already exists.'))
+                if cleaned['ghana_card_number'] in self.cards:
+                    errors.append(('ghana_card_number', 'A farmer with this Ghana Card number already exists.'))
+            if errors:
+                self.errors.extend((number, field, message, rows[number]) for field, message in errors)
+                continue
+            self.mobiles.add(cleaned['mobile_number'].as_e164)
+            self.cards.add(cleaned['ghana_card_number'])
+            farmer = Farmer(created_by=self.created_by, **cleaned)
+            # bulk_create skips save(), which normally fills the dedupe keys
+            farmer.set_dedupe_keys()
+            farmers.append((number, farmer))
+
+        for start in range(0, len(farmers), self.batch_size):
+            self._insert(farmers[start:start + self.batch_size], rows)
+
+    def _insert(self, batch, rows):
+        if self.dry_run:
+            self.created += len(batch)
+            return
+        try:
+            with transaction.atomic():
+                Farmer.objects.bulk_create([farmer for _, farmer in batch])
+            self.created += len(batch)
+        except IntegrityError:
+            # Someone else inserted a clashing farmer meanwhile; find the rows one by one
+            for number, farmer in batch:
+                try:
+                    with transaction.atomic():
+                        farmer.save()
+                    self.created += 1
+                except IntegrityError as e:
+                    self.errors.append((number, '', f'Could not save: {e}', rows[number]))
+
+    @property
+    def failed_rows(self):
+        return len({error[0] for error in self.errors})
+
+    def write_report(self, stream):
+        """Write one CSV line per row error, with the submitted values"""
+        writer = csv.writer(stream)
+        writer.writerow(REPORT_COLUMNS)
+        for number, field, message, row in self.errors:
+            writer.writerow([number, field, message] + [row.get(column, '') for column in REPORT_COLUMNS[3:]])
+
+    def summary(self):
+        return {
+            'total_rows': self.total,
+            'created': self.created,
+            'failed_rows': self.failed_rows,
+            'dry_run': self.dry_run,
+        }
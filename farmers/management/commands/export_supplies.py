@@ -0,0 +1,13 @@
+from maize_point.exports import ExportCommand
+from farmers.exports import SUPPLY_EXPORT_COLUMNS, SUPPLY_EXPORT_FILTERS, supply_export_queryset
+
+
+class Command(ExportCommand):
+    help = 'Export farmer supplies to CSV or XLSX, streamed in chunks'
+    columns = SUPPLY_EXPORT_COLUMNS
+    filters = SUPPLY_EXPORT_FILTERS
+    date_field = 'date_delivered'
+    title = 'Supplies'
+
+    def get_queryset(self, params):
+        return supply_export_queryset(params)
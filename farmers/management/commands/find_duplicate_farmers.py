@@ -0,0 +1,78 @@
+from django.core.management.base import BaseCommand
+from django.conf import settings
+from decimal import Decimal
+from farmers.dedupe import DedupeRecord, candidate_pairs, score_pair
+from farmers.models import Farmer, FarmerMergeSuggestion
+import time
+
+
+class Command(BaseCommand):
+    help = 'Scan all farmers for likely duplicates and record merge suggestions'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=settings.FARMER_DUPLICATE_THRESHOLD,
+            help=f'Minimum score to suggest a merge (default: {settings.FARMER_DUPLICATE_THRESHOLD})',
+        )
+        parser.add_argument(
+            '--max-block-size',
+            type=int,
+            default=1000,
+            help='Skip blocking keys shared by more farmers than this (default: 1000)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report suggestions without saving them',
+        )
+
+    def handle(self, *args, **kwargs):
+        started = time.perf_counter()
+        rows = list(Farmer.objects.filter(is_active=True).values_list(
+            'id', 'full_name', 'gps_latitude', 'gps_longitude',
+            'place_key', 'geohash', 'name_key',
+        ))
+        farmers = {row[0]: DedupeRecord.build(*row[:4]) for row in rows}
+        names = {row[0]: row[1] for row in rows}
+        pairs, oversized = candidate_pairs(
+            [(row[0], row[4], row[5], row[6]) for row in rows],
+            kwargs['max_block_size'],
+        )
+        for block, size in oversized:
+            self.stdout.write(self.style.WARNING(f'  Skipped block {block} with {size} farmers'))
+
+        suggestions = []
+        threshold = kwargs['threshold']
+        for first_id, second_id in pairs:
+            result = score_pair(farmers[first_id], farmers[second_id], threshold)
+            if result is None:
+                continue
+            score, name_similarity, distance = result
+            suggestions.append(FarmerMergeSuggestion(
+                farmer_id=first_id,
+                duplicate_id=second_id,
+                score=Decimal(score).quantize(Decimal('0.001')),
+                name_similarity=Decimal(name_similarity).quantize(Decimal('0.001')),
+                distance_km=Decimal(min(distance, 99999)).quantize(Decimal('0.001')),
+            ))
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(f'Farmers: {len(farmers)}')
+        self.stdout.write(f'Candidate pairs: {len(pairs)} (of {len(farmers) * (len(farmers) - 1) // 2} possible)')
+        self.stdout.write(f'Scored in {elapsed:.2f}s')
+
+        if kwargs['dry_run']:
+            for suggestion in sorted(suggestions, key=lambda s: -s.score)[:20]:
+                self.stdout.write(
+                    f'  {names[suggestion.farmer_id]} ~ {names[suggestion.duplicate_id]}: '
+                    f'{suggestion.score} (name {suggestion.name_similarity}, {suggestion.distance_km} km)'
+                )
+            self.stdout.write(self.style.WARNING(f'{len(suggestions)} suggestions (dry run, nothing saved)'))
+            return
+
+        # Pairs already reviewed (or suggested) keep their existing row
+        FarmerMergeSuggestion.objects.bulk_create(suggestions, batch_size=1000, ignore_conflicts=True)
+        pending = FarmerMergeSuggestion.objects.filter(status='PENDING').count()
+        self.stdout.write(self.style.SUCCESS(f'✓ {len(suggestions)} likely duplicates found, {pending} pending review'))
@@ -0,0 +1,80 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth import get_user_model
+from django.conf import settings
+from farmers.importer import FarmerImporter, ImportFileError, read_rows
+import os
+import time
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Bulk import farmers from a CSV or XLSX file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or XLSX file to import')
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=settings.FARMER_IMPORT_WORKERS,
+            help=f'Validation processes; 1 validates inline (default: {settings.FARMER_IMPORT_WORKERS})',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Farmers inserted per bulk_create (default: 1000)',
+        )
+        parser.add_argument(
+            '--report',
+            help='Where to write the per-row error report (default: <file>.errors.csv)',
+        )
+        parser.add_argument(
+            '--created-by',
+            help='Username recorded as the creator of imported farmers',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Validate only, insert nothing',
+        )
+
+    def handle(self, *args, **kwargs):
+        path = kwargs['path']
+        if not os.path.exists(path):
+            raise CommandError(f'File not found: {path}')
+
+        created_by = None
+        if kwargs['created_by']:
+            try:
+                created_by = User.objects.get(username=kwargs['created_by'])
+            except User.DoesNotExist:
+                raise CommandError(f'User "{kwargs["created_by"]}" not found.')
+
+        importer = FarmerImporter(
+            created_by=created_by,
+            workers=kwargs['workers'],
+            batch_size=kwargs['batch_size'],
+            dry_run=kwargs['dry_run'],
+        )
+        started = time.perf_counter()
+        try:
+            with open(path, 'rb') as file:
+                importer.run(read_rows(file, path))
+        except ImportFileError as e:
+            raise CommandError(str(e))
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(f'Rows read: {importer.total} in {elapsed:.2f}s')
+        self.stdout.write(f'Rows failed: {importer.failed_rows}')
+
+        if importer.errors:
+            report = kwargs['report'] or f'{os.path.splitext(path)[0]}.errors.csv'
+            with open(report, 'w', newline='', encoding='utf-8') as stream:
+                importer.write_report(stream)
+            self.stdout.write(self.style.WARNING(f'Error report: {report}'))
+
+        if kwargs['dry_run']:
+            self.stdout.write(self.style.SUCCESS(f'✓ {importer.created} farmers valid (dry run, nothing written)'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'✓ Imported {importer.created} farmers'))
@@ -0,0 +1,88 @@
+# Generated by Django 4.2.30 on 2026-10-19 18:03
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from farmers.dedupe import geohash, name_key
+
+
+def backfill_dedupe_keys(apps, schema_editor):
+    Farmer = apps.get_model('farmers', 'Farmer')
+    farmers = list(Farmer.objects.only('id', 'full_name', 'gps_latitude', 'gps_longitude'))
+    for farmer in farmers:
+        farmer.name_key = name_key(farmer.full_name)
+        farmer.geohash = geohash(farmer.gps_latitude, farmer.gps_longitude)
+    Farmer.objects.bulk_update(farmers, ['name_key', 'geohash'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('farmers', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FarmerMergeSuggestion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.DecimalField(decimal_places=3, max_digits=4)),
+                ('name_similarity', models.DecimalField(decimal_places=3, max_digits=4)),
+                ('distance_km', models.DecimalField(decimal_places=3, max_digits=8)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending Review'), ('MERGED', 'Merged'), ('DISMISSED', 'Not a Duplicate')], default='PENDING', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'farmer_merge_suggestions',
+                'ordering': ['-score'],
+            },
+        ),
+        migrations.AddField(
+            model_name='farmer',
+            name='geohash',
+            field=models.CharField(blank=True, editable=False, max_length=12),
+        ),
+        migrations.AddField(
+            model_name='farmer',
+            name='name_key',
+            field=models.CharField(blank=True, editable=False, max_length=16),
+        ),
+        migrations.AddIndex(
+            model_name='farmer',
+            index=models.Index(fields=['district', 'community'], name='farmers_distric_1c4c5a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='farmer',
+            index=models.Index(fields=['name_key'], name='farmers_name_ke_6770ad_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='farmer',
+            index=models.Index(fields=['geohash'], name='farmers_geohash_3fb6c0_idx'),
+        ),
+        migrations.AddField(
+            model_name='farmermergesuggestion',
+            name='duplicate',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='farmers.farmer'),
+        ),
+        migrations.AddField(
+            model_name='farmermergesuggestion',
+            name='farmer',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='merge_suggestions', to='farmers.farmer'),
+        ),
+        migrations.AddField(
+            model_name='farmermergesuggestion',
+            name='reviewed_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='farmermergesuggestion',
+            index=models.Index(fields=['status', '-score'], name='farmer_merg_status_1fd0c9_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='farmermergesuggestion',
+            unique_together={('farmer', 'duplicate')},
+        ),
+        migrations.RunPython(backfill_dedupe_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 18:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('farmers', '0003_farmer_dedupe'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='farmer',
+            name='profile_picture_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-19 19:14
+
+from django.db import migrations, models
+from farmers.dedupe import place_key
+
+
+def backfill_place_keys(apps, schema_editor):
+    Farmer = apps.get_model('farmers', 'Farmer')
+    farmers = list(Farmer.objects.only('id', 'district', 'community'))
+    for farmer in farmers:
+        farmer.place_key = place_key(farmer.district, farmer.community)
+    Farmer.objects.bulk_update(farmers, ['place_key'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('farmers', '0004_farmer_profile_picture_variants'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='farmer',
+            name='farmers_distric_1c4c5a_idx',
+        ),
+        migrations.AddField(
+            model_name='farmer',
+            name='place_key',
+            field=models.CharField(blank=True, editable=False, max_length=201),
+        ),
+        migrations.AddIndex(
+            model_name='farmer',
+            index=models.Index(fields=['place_key'], name='farmers_place_k_468640_idx'),
+        ),
+        migrations.RunPython(backfill_place_keys, migrations.RunPython.noop),
+    ]
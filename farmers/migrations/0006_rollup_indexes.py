@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-19 19:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('farmers', '0005_farmer_place_key'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='farmer',
+            index=models.Index(fields=['updated_at'], name='farmers_updated_af4184_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='farmersupply',
+            index=models.Index(fields=['updated_at'], name='farmer_supp_updated_e66605_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='farmersupply',
+            index=models.Index(fields=['date_delivered'], name='farmer_supp_date_de_83a2b7_idx'),
+        ),
+    ]
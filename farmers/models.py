@@ -1,14 +1,16 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
 from phonenumber_field.modelfields import PhoneNumberField
 from products.models import Product
+from .dedupe import geohash, name_key, place_key
 import re
 
 
 class Farmer(models.Model):
     """Farmer model for managing farmer information"""
     profile_picture = models.ImageField(upload_to='farmer_profiles/', null=True, blank=True)
+    profile_picture_variants = models.JSONField(default=dict, blank=True, editable=False)
     full_name = models.CharField(max_length=255)
     mobile_number = PhoneNumberField(unique=True, region='GH')
     ghana_card_number = models.CharField(
@@ -36,6 +38,10 @@ class Farmer(models.Model):
         help_text='List of maize types supplied (e.g., ["Yellow Maize", "White Maize"])'
     )
     notes = models.TextField(blank=True)
+    # Blocking keys for duplicate detection (see farmers/dedupe.py)
+    name_key = models.CharField(max_length=16, blank=True, editable=False)
+    geohash = models.CharField(max_length=12, blank=True, editable=False)
+    place_key = models.CharField(max_length=201, blank=True, editable=False)
     is_approved = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, related_name='farmers_created')
@@ -50,11 +56,28 @@ class Farmer(models.Model):
             models.Index(fields=['ghana_card_number']),
             models.Index(fields=['region', 'district']),
             models.Index(fields=['is_approved', 'is_active']),
+            models.Index(fields=['place_key']),
+            models.Index(fields=['name_key']),
+            models.Index(fields=['geohash']),
+            # Report rollups look up farmers changed since their last refresh
+            models.Index(fields=['updated_at']),
         ]
     
     def __str__(self):
         return f"{self.full_name} - {self.community}, {self.district}"
     
+    def set_dedupe_keys(self):
+        self.name_key = name_key(self.full_name)
+        self.geohash = geohash(self.gps_latitude, self.gps_longitude)
+        self.place_key = place_key(self.district, self.community)
+    
+    def save(self, *args, **kwargs):
+        self.set_dedupe_keys()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | {'name_key', 'geohash', 'place_key'}
+        super().save(*args, **kwargs)
+    
     def clean(self):
         from django.core.exceptions import ValidationError
         # Validate Ghana Card format
@@ -66,6 +89,37 @@ class Farmer(models.Model):
                 })
 
 
+class FarmerMergeSuggestion(models.Model):
+    """Pair of farmers that look like the same person, found by the dedupe job"""
+    
+    STATUS_CHOICES = (
+        ('PENDING', 'Pending Review'),
+        ('MERGED', 'Merged'),
+        ('DISMISSED', 'Not a Duplicate'),
+    )
+    
+    farmer = models.ForeignKey(Farmer, on_delete=models.CASCADE, related_name='merge_suggestions')
+    duplicate = models.ForeignKey(Farmer, on_delete=models.CASCADE, related_name='+')
+    score = models.DecimalField(max_digits=4, decimal_places=3)
+    name_similarity = models.DecimalField(max_digits=4, decimal_places=3)
+    distance_km = models.DecimalField(max_digits=8, decimal_places=3)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
+    reviewed_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'farmer_merge_suggestions'
+        ordering = ['-score']
+        unique_together = ['farmer', 'duplicate']
+        indexes = [
+            models.Index(fields=['status', '-score']),
+        ]
+    
+    def __str__(self):
+        return f"{self.farmer_id} ~ {self.duplicate_id} ({self.score})"
+
+
 class FarmerSupply(models.Model):
     """Model for recording farmer supply deliveries"""
     
@@ -97,6 +151,9 @@ class FarmerSupply(models.Model):
             models.Index(fields=['farmer', 'date_delivered']),
             models.Index(fields=['payment_status']),
             models.Index(fields=['product']),
+            # Report rollups: changed rows since the last refresh, then every supply of the affected days
+            models.Index(fields=['updated_at']),
+            models.Index(fields=['date_delivered']),
         ]
         verbose_name_plural = 'Farmer Supplies'
     
@@ -111,4 +168,17 @@ class FarmerSupply(models.Model):
         # Auto-calculate total_cost
         if self.cost_per_bag and self.quantity_bags:
             self.total_cost = self.cost_per_bag * self.quantity_bags
-        super().save(*args, **kwargs)
+        
+        if self._state.adding:
+            self._stored_date_delivered = None
+            super().save(*args, **kwargs)
+            return
+        
+        using = kwargs.get('using') or self._state.db
+        with transaction.atomic(using=using):
+            # Read the stored delivery date under a row lock, so the report rollups requeue the day each
+            # concurrent save actually moves the supply away from, whatever this instance loaded
+            self._stored_date_delivered = FarmerSupply.objects.using(using).select_for_update().filter(
+                pk=self.pk
+            ).values_list('date_delivered', flat=True).first()
+            super().save(*args, **kwargs)
@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from .models import Farmer, FarmerSupply
+from images.serializers import ImageVariantsField
+from .models import Farmer, FarmerSupply, FarmerMergeSuggestion
 from products.serializers import ProductSerializer
 import re
 
@@ -7,15 +8,28 @@ import re
 class FarmerSerializer(serializers.ModelSerializer):
     """Serializer for Farmer model"""
     created_by_name = serializers.CharField(source='created_by.full_name', read_only=True)
+    profile_picture_variants = ImageVariantsField()
+    allow_duplicate = serializers.BooleanField(
+        write_only=True, required=False, default=False,
+        help_text='Register even if the farmer looks like an existing one'
+    )
     
     class Meta:
         model = Farmer
-        fields = ['id', 'profile_picture', 'full_name', 'mobile_number', 'ghana_card_number',
+        fields = ['id', 'profile_picture', 'profile_picture_variants', 'full_name', 'mobile_number', 'ghana_card_number',
                   'gps_latitude', 'gps_longitude', 'region', 'district', 'community',
                   'maize_types_supplied', 'notes', 'is_approved', 'is_active',
-                  'created_by', 'created_by_name', 'created_at', 'updated_at']
+                  'created_by', 'created_by_name', 'created_at', 'updated_at', 'allow_duplicate']
         read_only_fields = ['id', 'created_by', 'created_at', 'updated_at']
     
+    def create(self, validated_data):
+        validated_data.pop('allow_duplicate', None)
+        return super().create(validated_data)
+    
+    def update(self, instance, validated_data):
+        validated_data.pop('allow_duplicate', None)
+        return super().update(instance, validated_data)
+    
     def validate_ghana_card_number(self, value):
         pattern = r'^GHA-\d{9}-\d$'
         if not re.match(pattern, value):
@@ -33,6 +47,44 @@ class FarmerSerializer(serializers.ModelSerializer):
         return value
 
 
+class FarmerDuplicateSerializer(serializers.Serializer):
+    """Serializer for a possible duplicate of a farmer"""
+    id = serializers.IntegerField()
+    full_name = serializers.CharField()
+    mobile_number = serializers.CharField()
+    community = serializers.CharField()
+    district = serializers.CharField()
+    score = serializers.FloatField()
+    name_similarity = serializers.FloatField()
+    distance_km = serializers.FloatField()
+    
+    @staticmethod
+    def from_match(match):
+        score, name_similarity, distance, farmer = match
+        return FarmerDuplicateSerializer({
+            'id': farmer.id,
+            'full_name': farmer.full_name,
+            'mobile_number': str(farmer.mobile_number),
+            'community': farmer.community,
+            'district': farmer.district,
+            'score': round(score, 3),
+            'name_similarity': round(name_similarity, 3),
+            'distance_km': round(distance, 3),
+        }).data
+
+
+class FarmerMergeSuggestionSerializer(serializers.ModelSerializer):
+    """Serializer for FarmerMergeSuggestion model"""
+    farmer_name = serializers.CharField(source='farmer.full_name', read_only=True)
+    duplicate_name = serializers.CharField(source='duplicate.full_name', read_only=True)
+    
+    class Meta:
+        model = FarmerMergeSuggestion
+        fields = ['id', 'farmer', 'farmer_name', 'duplicate', 'duplicate_name', 'score',
+                  'name_similarity', 'distance_km', 'status', 'reviewed_by', 'created_at', 'updated_at']
+        read_only_fields = fields
+
+
 class FarmerSupplySerializer(serializers.ModelSerializer):
     """Serializer for FarmerSupply model"""
     farmer_name = serializers.CharField(source='farmer.full_name', read_only=True)
@@ -64,3 +116,14 @@ class RecordPaymentSerializer(serializers.Serializer):
         if value <= 0:
             raise serializers.ValidationError("Payment amount must be greater than 0")
         return value
+
+
+class FarmerImportSerializer(serializers.Serializer):
+    """Serializer for a farmer bulk import upload"""
+    file = serializers.FileField()
+    dry_run = serializers.BooleanField(default=False)
+    
+    def validate_file(self, value):
+        if not value.name.lower().endswith(('.csv', '.xlsx')):
+            raise serializers.ValidationError("Upload a .csv or .xlsx file.")
+        return value
@@ -0,0 +1,88 @@
+from decimal import Decimal
+from io import BytesIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from monitoring.benchmarks import api_client
+from products.models import Product
+from .dedupe import blocking_filter, candidate_pairs
+from .models import Farmer, FarmerSupply
+
+
+class BlockingTests(TestCase):
+    """Duplicate checks on create and the batch command block farmers the same way"""
+
+    def setUp(self):
+        self.farmer = Farmer.objects.create(
+            full_name='Kwame Boateng', mobile_number='+233501000001', ghana_card_number='GHA-000000001-0',
+            gps_latitude=Decimal('6.700000'), gps_longitude=Decimal('-1.450000'), region='Ashanti',
+            district='Ejisu', community='Onwe',
+        )
+        # Different name and location: only the place can block it with the farmer above
+        self.data = {
+            'full_name': 'Ama Serwaa', 'gps_latitude': Decimal('9.400000'), 'gps_longitude': Decimal('-0.850000'),
+            'district': 'ejisu ', 'community': 'ONWE',
+        }
+
+    def test_create_blocks_case_insensitively(self):
+        self.assertEqual(list(Farmer.objects.filter(blocking_filter(self.data))), [self.farmer])
+
+    def test_batch_blocks_case_insensitively(self):
+        other = Farmer.objects.create(
+            mobile_number='+233501000002', ghana_card_number='GHA-000000002-0', region='Northern', **self.data,
+        )
+        rows = Farmer.objects.values_list('id', 'place_key', 'geohash', 'name_key')
+        pairs, _ = candidate_pairs(rows, max_block_size=100)
+        self.assertEqual(pairs, {(self.farmer.id, other.id)})
+
+
+class SupplyExportTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.client = api_client(get_user_model().objects.create_user(
+            username='admin', password='admin', user_type='ADMIN', mobile_number='+233200000001',
+        ))
+        self.farmer = Farmer.objects.create(
+            full_name='Kwame Boateng', mobile_number='+233501000001', ghana_card_number='GHA-000000001-0',
+            gps_latitude=Decimal('6.700000'), gps_longitude=Decimal('-1.450000'), region='Ashanti',
+            district='Ejisu', community='Onwe', is_approved=True,
+        )
+        self.product = Product.objects.create(name='Yellow Maize', description='Test', packaging_sizes=['50kg bag'])
+        FarmerSupply.objects.create(
+            farmer=self.farmer, product=self.product, quantity_bags=10, quantity_tons=Decimal('0.500'),
+            date_delivered=timezone.now(), cost_per_bag=Decimal('210.00'),
+        )
+
+    def export(self, query):
+        response = self.client.get(f'/api/farmers/supplies/export/?{query}')
+        body = b''.join(response.streaming_content).decode() if response.streaming else response.json()
+        return response.status_code, body
+
+    def test_filters(self):
+        status, body = self.export(f'product={self.product.pk}&region=Ashanti')
+        self.assertEqual(status, 200)
+        self.assertIn('Kwame Boateng', body)
+        status, body = self.export(f'product={self.product.pk + 1}')
+        self.assertEqual(status, 400)
+
+    def test_invalid_ids_are_rejected(self):
+        for query in ('product=abc', 'farmer=abc', 'payment_status=SOMETIMES'):
+            status, body = self.export(query)
+            self.assertEqual(status, 400, query)
+            self.assertIn('Invalid', body['error'])
+
+    def test_formulas_are_written_as_text(self):
+        Farmer.objects.filter(pk=self.farmer.pk).update(full_name='=HYPERLINK("http://x.example")', district='@SUM(1)')
+        status, body = self.export('')
+        self.assertIn('"\'=HYPERLINK(""http://x.example"")",Ashanti,\'@SUM(1),Yellow Maize,10,0.500', body)
+
+        from openpyxl import load_workbook
+        response = self.client.get('/api/farmers/supplies/export/?file_type=xlsx')
+        row = next(load_workbook(BytesIO(b''.join(response.streaming_content))).active.iter_rows(min_row=2))
+        self.assertEqual([(cell.value, cell.data_type) for cell in row[2:5]], [
+            ('\'=HYPERLINK("http://x.example")', 's'), ('Ashanti', 's'), ("'@SUM(1)", 's'),
+        ])
@@ -1,12 +1,26 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
+from django.conf import settings
 from django.db.models import Sum, Q
-from .models import Farmer, FarmerSupply
-from .serializers import FarmerSerializer, FarmerSupplySerializer, RecordPaymentSerializer
+from django.http import FileResponse, Http404
+from django.urls import reverse
+from .models import Farmer, FarmerSupply, FarmerMergeSuggestion
+from .serializers import (
+    FarmerSerializer, FarmerSupplySerializer, RecordPaymentSerializer, FarmerImportSerializer,
+    FarmerDuplicateSerializer, FarmerMergeSuggestionSerializer
+)
+from .dedupe import find_duplicates
+from .importer import FarmerImporter, ImportFileError, read_rows
+from .exports import SUPPLY_EXPORT_COLUMNS, supply_export_queryset
 from inventory.models import Stock
+from maize_point.exports import ExportError, export_response, filter_date_range
+from reports.models import DailySupplyFact
+import os
+import uuid
 
 
 class IsAdminOrStaff(permissions.BasePermission):
@@ -27,6 +41,24 @@ class FarmerViewSet(viewsets.ModelViewSet):
     ordering_fields = ['full_name', 'created_at']
     ordering = ['-created_at']
     
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        # Catch the same farmer registered again under another spelling or phone
+        if not serializer.validated_data.get('allow_duplicate'):
+            matches = find_duplicates(serializer.validated_data, Farmer.objects.all(), settings.FARMER_DUPLICATE_THRESHOLD)
+            if matches:
+                return Response({
+                    'error': 'This farmer looks like an existing one. '
+                             'Resubmit with allow_duplicate=true if they are a different person.',
+                    'possible_duplicates': [FarmerDuplicateSerializer.from_match(match) for match in matches[:5]],
+                }, status=status.HTTP_409_CONFLICT)
+        
+        self.perform_create(serializer)
+        headers = self.get_success_headers(serializer.data)
+        return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
+    
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
     
@@ -35,6 +67,50 @@ class FarmerViewSet(viewsets.ModelViewSet):
         instance.is_active = False
         instance.save()
     
+    @action(detail=False, methods=['post'], url_path='import', parser_classes=[MultiPartParser, FormParser])
+    def import_farmers(self, request):
+        """Bulk import farmers from an uploaded CSV or XLSX file"""
+        serializer = FarmerImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data['file']
+        
+        # Validated inline: no process pool inside a web worker; large files go through import_farmers
+        importer = FarmerImporter(created_by=request.user, dry_run=serializer.validated_data['dry_run'])
+        try:
+            importer.run(read_rows(upload, upload.name))
+        except ImportFileError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        data = importer.summary()
+        data['errors'] = [
+            {'row': number, 'field': field, 'error': message}
+            for number, field, message, _ in importer.errors[:100]
+        ]
+        data['report_url'] = None
+        if importer.errors:
+            report_id = uuid.uuid4().hex
+            os.makedirs(settings.IMPORT_REPORT_DIR, exist_ok=True)
+            with open(self._report_path(report_id), 'w', newline='', encoding='utf-8') as stream:
+                importer.write_report(stream)
+            data['report_url'] = request.build_absolute_uri(
+                reverse('farmers:farmer-import-report', kwargs={'report_id': report_id})
+            )
+        
+        created = importer.created and not importer.dry_run
+        return Response(data, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
+    
+    @action(detail=False, methods=['get'], url_path=r'import/(?P<report_id>[0-9a-f]{32})/report')
+    def import_report(self, request, report_id=None):
+        """Download the per-row error report of a farmer import"""
+        path = self._report_path(report_id)
+        if not os.path.exists(path):
+            raise Http404('Import report not found.')
+        return FileResponse(open(path, 'rb'), as_attachment=True,
+                            filename=f'farmer-import-errors-{report_id[:8]}.csv', content_type='text/csv')
+    
+    def _report_path(self, report_id):
+        return os.path.join(settings.IMPORT_REPORT_DIR, f'farmers-{report_id}.csv')
+    
     @action(detail=True, methods=['patch'])
     def approve(self, request, pk=None):
         """Approve a farmer"""
@@ -43,14 +119,51 @@ class FarmerViewSet(viewsets.ModelViewSet):
         farmer.save()
         return Response({'message': 'Farmer approved successfully.'})
     
+    @action(detail=True, methods=['get'])
+    def duplicates(self, request, pk=None):
+        """Farmers that look like the same person as this one"""
+        farmer = self.get_object()
+        data = {
+            'full_name': farmer.full_name,
+            'district': farmer.district,
+            'community': farmer.community,
+            'gps_latitude': farmer.gps_latitude,
+            'gps_longitude': farmer.gps_longitude,
+        }
+        try:
+            threshold = float(request.query_params.get('threshold', settings.FARMER_DUPLICATE_THRESHOLD))
+        except ValueError:
+            return Response({'error': 'threshold must be a number.'}, status=status.HTTP_400_BAD_REQUEST)
+        matches = find_duplicates(data, Farmer.objects.exclude(pk=farmer.pk), threshold)
+        return Response([FarmerDuplicateSerializer.from_match(match) for match in matches])
+    
+    @action(detail=False, methods=['get'])
+    def merge_suggestions(self, request):
+        """Pending duplicate pairs found by the find_duplicate_farmers job"""
+        suggestions = FarmerMergeSuggestion.objects.select_related('farmer', 'duplicate').filter(
+            status=request.query_params.get('status', 'PENDING')
+        )
+        page = self.paginate_queryset(suggestions)
+        serializer = FarmerMergeSuggestionSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+    
     @action(detail=True, methods=['get'])
     def supply_history(self, request, pk=None):
         """Get farmer supply history"""
         farmer = self.get_object()
-        supplies = FarmerSupply.objects.filter(farmer=farmer).select_related('product', 'recorded_by')
+        supplies = FarmerSupply.objects.filter(farmer=farmer).select_related('farmer', 'product', 'recorded_by')
         serializer = FarmerSupplySerializer(supplies, many=True)
         return Response(serializer.data)
     
+    @action(detail=False, methods=['get'], url_path='supplies/export')
+    def export_supplies(self, request):
+        """Stream supplies as CSV or XLSX (?file_type=xlsx, ?start=&end=, ?farmer=, ?product=, ?region=, ...)"""
+        try:
+            supplies = filter_date_range(supply_export_queryset(request.query_params), 'date_delivered', request.query_params)
+            return export_response(supplies, SUPPLY_EXPORT_COLUMNS, 'supplies', request.query_params.get('file_type', 'csv'))
+        except ExportError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
     @action(detail=True, methods=['post'])
     def record_supply(self, request, pk=None):
         """Record farmer supply and automatically create stock"""
@@ -145,8 +258,8 @@ class FarmerViewSet(viewsets.ModelViewSet):
         approved_farmers = farmers.filter(is_approved=True).count()
         active_farmers = farmers.filter(is_active=True).count()
         
-        # Supplies summary
-        supplies_summary = FarmerSupply.objects.aggregate(
+        # Supplies summary, from the daily rollups rather than every supply row
+        supplies_summary = DailySupplyFact.objects.aggregate(
             total_supplies=Sum('quantity_bags'),
             total_cost=Sum('total_cost'),
             total_paid=Sum('amount_paid')
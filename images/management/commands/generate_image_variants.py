@@ -0,0 +1,71 @@
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+from images.pipeline import get_model, IMAGE_FIELDS, needs_variants, render_variants, variants_field
+from images.tasks import save_variants
+import time
+
+
+def _render(source_name):
+    try:
+        return render_variants(source_name), None
+    except (OSError, ValueError) as e:
+        return None, str(e)
+
+
+class Command(BaseCommand):
+    help = 'Render missing thumbnail and medium image variants for existing uploads'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            choices=[label for label, _ in IMAGE_FIELDS],
+            help='Only process one model (default: all)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Re-render images that already have variants',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Render threads; Pillow releases the GIL while resizing and encoding (default: 4)',
+        )
+
+    def handle(self, *args, **kwargs):
+        if kwargs['workers'] < 1:
+            raise CommandError('--workers must be at least 1')
+
+        started = time.perf_counter()
+        rendered = failed = 0
+        with ThreadPoolExecutor(max_workers=kwargs['workers']) as pool:
+            for model_label, field_name in IMAGE_FIELDS:
+                if kwargs['model'] and kwargs['model'] != model_label:
+                    continue
+                model = get_model(model_label)
+                instances = model.objects.exclude(Q(**{field_name: ''}) | Q(**{f'{field_name}__isnull': True})).only(
+                    'pk', field_name, variants_field(field_name)
+                )
+                pending = [
+                    (instance.pk, getattr(instance, field_name).name) for instance in instances.iterator()
+                    if kwargs['force'] or needs_variants(instance, field_name)
+                ]
+                self.stdout.write(f'{model_label}.{field_name}: {len(pending)} images to render')
+
+                # Render in threads; database writes stay on this thread
+                for (pk, source_name), (variants, error) in zip(
+                    pending, pool.map(_render, [source for _, source in pending])
+                ):
+                    if error:
+                        failed += 1
+                        self.stdout.write(self.style.WARNING(f'  {model_label} {pk} {source_name}: {error}'))
+                        continue
+                    save_variants(model, pk, field_name, source_name, variants)
+                    rendered += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ Rendered variants for {rendered} images in {time.perf_counter() - started:.1f}s'
+            + (f' ({failed} unreadable)' if failed else '')
+        ))
@@ -0,0 +1,101 @@
+"""
+Image derivatives for uploaded photos.
+
+Each source image is rendered to a small square thumbnail and a medium size,
+in WebP and JPEG. Outputs are stored content-addressed (named by the SHA-256
+of their bytes) under IMAGE_VARIANTS_DIR, so identical renders are stored
+once and the files can be cached forever by clients.
+
+The owning models and their `<field>_variants` JSON fields are listed in
+IMAGE_FIELDS. The stored JSON looks like:
+
+    {"source": "farmer_profiles/a.jpg",
+     "thumb": {"width": 160, "height": 160, "webp": "derived/ab/cd/abcd....webp", "jpeg": "..."},
+     "medium": {...}}
+"""
+from hashlib import sha256
+import io
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+# (app_label.Model, image field); variants live in "<field>_variants"
+IMAGE_FIELDS = [
+    ('accounts.User', 'profile_picture'),
+    ('farmers.Farmer', 'profile_picture'),
+    ('blog.BlogPost', 'featured_image'),
+]
+
+# name: (width, height, crop to fill)
+VARIANTS = {
+    'thumb': (160, 160, True),
+    'medium': (800, 800, False),
+}
+
+FORMATS = {
+    'webp': ('WEBP', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+
+def variants_field(field_name):
+    return f'{field_name}_variants'
+
+
+def image_fields_for(model):
+    label = model._meta.label
+    return [field for model_label, field in IMAGE_FIELDS if model_label == label]
+
+
+def get_model(label):
+    return apps.get_model(label)
+
+
+def needs_variants(instance, field_name):
+    """True when the image changed since its variants were rendered"""
+    name = getattr(instance, field_name).name or ''
+    return (getattr(instance, variants_field(field_name)) or {}).get('source', '') != name
+
+
+def _store(data, extension):
+    digest = sha256(data).hexdigest()
+    name = f'{settings.IMAGE_VARIANTS_DIR}/{digest[:2]}/{digest[2:4]}/{digest}.{extension}'
+    if not default_storage.exists(name):
+        default_storage.save(name, ContentFile(data))
+    return name
+
+
+def render_variants(source_name):
+    """Render and store every variant of a stored image; returns the variants JSON"""
+    with default_storage.open(source_name, 'rb') as file:
+        image = Image.open(file)
+        image = ImageOps.exif_transpose(image)
+        image.load()
+
+    has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+    image = image.convert('RGBA' if has_alpha else 'RGB')
+
+    result = {'source': source_name}
+    for name, (width, height, crop) in VARIANTS.items():
+        if crop:
+            resized = ImageOps.fit(image, (width, height), Image.LANCZOS)
+        else:
+            resized = image.copy()
+            resized.thumbnail((width, height), Image.LANCZOS)
+
+        entry = {'width': resized.width, 'height': resized.height}
+        for extension, (pil_format, options) in FORMATS.items():
+            output = resized
+            if pil_format == 'JPEG' and output.mode != 'RGB':
+                # JPEG has no alpha: flatten onto white
+                background = Image.new('RGB', output.size, (255, 255, 255))
+                background.paste(output, mask=output.getchannel('A'))
+                output = background
+            buffer = io.BytesIO()
+            output.save(buffer, pil_format, **options)
+            entry[extension] = _store(buffer.getvalue(), extension)
+        result[name] = entry
+    return result
@@ -0,0 +1,26 @@
+from django.core.files.storage import default_storage
+from rest_framework import serializers
+from .pipeline import VARIANTS
+
+
+class ImageVariantsField(serializers.ReadOnlyField):
+    """URLs of an image's thumbnail and medium WebP/JPEG derivatives"""
+
+    def to_representation(self, value):
+        if not value:
+            return None
+        request = self.context.get('request')
+
+        def url(name):
+            location = default_storage.url(name)
+            return request.build_absolute_uri(location) if request else location
+
+        return {
+            size: {
+                'width': value[size]['width'],
+                'height': value[size]['height'],
+                'webp': url(value[size]['webp']),
+                'jpeg': url(value[size]['jpeg']),
+            }
+            for size in VARIANTS if size in value
+        }
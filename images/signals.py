@@ -0,0 +1,22 @@
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import Signal
+from .pipeline import get_model, IMAGE_FIELDS, needs_variants
+
+# Sent with pk and field_name after new variants (and updated_at) are stored with a queryset update
+variants_generated = Signal()
+
+
+def queue_changed_images(sender, instance, **kwargs):
+    """Render derivatives off the request path once an image upload is committed"""
+    from .tasks import queue_image_variants
+    deferred = instance.get_deferred_fields()
+    for model_label, field_name in IMAGE_FIELDS:
+        if sender._meta.label != model_label or field_name in deferred:
+            continue
+        if needs_variants(instance, field_name):
+            transaction.on_commit(lambda field_name=field_name: queue_image_variants(instance, field_name))
+
+
+for model_label in {label for label, _ in IMAGE_FIELDS}:
+    post_save.connect(queue_changed_images, sender=get_model(model_label), dispatch_uid=f'images-{model_label}')
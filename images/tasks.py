@@ -0,0 +1,55 @@
+from celery import shared_task
+from django.db import transaction
+from django.utils import timezone
+from .pipeline import get_model, needs_variants, render_variants, variants_field
+from .signals import variants_generated
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def generate_image_variants(self, model_label, pk, field_name):
+    """Render thumbnail and medium derivatives of one model image"""
+    model = get_model(model_label)
+    try:
+        instance = model.objects.only('pk', field_name, variants_field(field_name)).get(pk=pk)
+    except model.DoesNotExist:
+        return
+
+    if not needs_variants(instance, field_name):
+        return
+
+    image = getattr(instance, field_name)
+    if image:
+        try:
+            variants = render_variants(image.name)
+        except (OSError, ValueError) as exc:
+            # Unreadable or non-image upload: retrying won't help
+            logger.error(f"Cannot render variants of {model_label} {pk} {image.name}: {exc}")
+            return
+    else:
+        variants = {}
+
+    save_variants(model, pk, field_name, image.name or '', variants)
+
+
+def save_variants(model, pk, field_name, source_name, variants):
+    """Store variants unless the image was replaced while they were rendering"""
+    fields = {variants_field(field_name): variants}
+    # update() skips auto_now; ETags and Last-Modified are built from updated_at
+    if any(field.name == 'updated_at' for field in model._meta.concrete_fields):
+        fields['updated_at'] = timezone.now()
+    with transaction.atomic():
+        updated = model.objects.filter(pk=pk, **{field_name: source_name}).update(**fields)
+    if updated:
+        variants_generated.send(sender=model, pk=pk, field_name=field_name)
+    return updated
+
+
+def queue_image_variants(instance, field_name):
+    """Hand an image to the task queue without failing the caller"""
+    try:
+        generate_image_variants.delay(instance._meta.label, instance.pk, field_name)
+    except Exception as e:
+        logger.error(f"Failed to queue image variants for {instance._meta.label} {instance.pk}: {str(e)}")
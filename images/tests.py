@@ -0,0 +1,33 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from blog.models import BlogPost
+from .tasks import save_variants
+
+
+class SaveVariantsTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        author = get_user_model().objects.create_user(
+            username='editor', password='editor', user_type='ADMIN', mobile_number='+233200000001',
+        )
+        self.post = BlogPost.objects.create(
+            title='Harvest update', content='Prices are steady.', category='Market', is_published=True,
+            published_at=timezone.now(), author=author, featured_image='blog_images/harvest.jpg',
+        )
+
+    def test_conditional_get_sees_new_variants(self):
+        response = self.client.get('/api/blog/')
+        self.assertIsNone(response.json()['results'][0]['featured_image_variants'])
+
+        variants = {'source': 'blog_images/harvest.jpg', 'thumb': {
+            'width': 160, 'height': 90, 'webp': 'derived/ab/harvest.webp', 'jpeg': 'derived/ab/harvest.jpg',
+        }}
+        self.assertEqual(save_variants(BlogPost, self.post.pk, 'featured_image', 'blog_images/harvest.jpg', variants), 1)
+
+        response = self.client.get('/api/blog/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'][0]['featured_image_variants']['thumb']['width'], 160)
@@ -0,0 +1,30 @@
+from .models import StockMovement
+
+# (header, values_list lookup)
+MOVEMENT_EXPORT_COLUMNS = [
+    ('id', 'id'),
+    ('created_at', 'created_at'),
+    ('product', 'stock__product__name'),
+    ('warehouse_location', 'stock__warehouse_location'),
+    ('movement_type', 'movement_type'),
+    ('quantity_bags', 'quantity_bags'),
+    ('quantity_tons', 'quantity_tons'),
+    ('order_id', 'order__order_id'),
+    ('performed_by', 'performed_by__username'),
+    ('reason', 'reason'),
+]
+
+
+# query parameter: lookup, matching the list endpoint's filterset_fields
+MOVEMENT_EXPORT_FILTERS = {
+    'stock': 'stock',
+    'movement_type': 'movement_type',
+}
+
+
+def movement_export_queryset(params=None):
+    movements = StockMovement.objects.order_by('-created_at')
+    for name, lookup in MOVEMENT_EXPORT_FILTERS.items():
+        if params and params.get(name):
+            movements = movements.filter(**{lookup: params[name]})
+    return movements
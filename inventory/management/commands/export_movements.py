@@ -0,0 +1,12 @@
+from maize_point.exports import ExportCommand
+from inventory.exports import MOVEMENT_EXPORT_COLUMNS, MOVEMENT_EXPORT_FILTERS, movement_export_queryset
+
+
+class Command(ExportCommand):
+    help = 'Export stock movements to CSV or XLSX, streamed in chunks'
+    columns = MOVEMENT_EXPORT_COLUMNS
+    filters = MOVEMENT_EXPORT_FILTERS
+    title = 'Stock Movements'
+
+    def get_queryset(self, params):
+        return movement_export_queryset(params)
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-19 17:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='stock',
+            index=models.Index(fields=['updated_at'], name='stock_updated_0fd6cb_idx'),
+        ),
+    ]
@@ -34,6 +34,7 @@ class Stock(models.Model):
             models.Index(fields=['product', 'warehouse_location']),
             models.Index(fields=['date_received']),
             models.Index(fields=['expiry_alert_date']),
+            models.Index(fields=['updated_at']),
         ]
     
     def __str__(self):
@@ -1,10 +1,14 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-from .models import StockMovement
+from .models import Stock, StockMovement
+from maize_point.caching import track_deletions
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Deleted stock lots change the catalog's ETags
+track_deletions(Stock)
+
 
 @receiver(post_save, sender=StockMovement)
 def log_stock_movement(sender, instance, created, **kwargs):
@@ -5,6 +5,8 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django.utils import timezone
 from datetime import timedelta
+from maize_point.exports import ExportError, export_response, filter_date_range
+from .exports import MOVEMENT_EXPORT_COLUMNS
 from .models import Stock, StockMovement
 from .serializers import StockSerializer, StockMovementSerializer
 
@@ -124,3 +126,14 @@ class StockMovementViewSet(viewsets.ReadOnlyModelViewSet):
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = ['stock', 'movement_type']
     ordering = ['-created_at']
+    
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """Stream the filtered movements as CSV or XLSX (?file_type=xlsx, ?start=&end=)"""
+        try:
+            movements = filter_date_range(self.filter_queryset(self.get_queryset()), 'created_at', request.query_params)
+            return export_response(
+                movements, MOVEMENT_EXPORT_COLUMNS, 'stock-movements', request.query_params.get('file_type', 'csv')
+            )
+        except ExportError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
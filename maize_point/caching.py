@@ -0,0 +1,150 @@
+"""
+HTTP caching helpers for public, rarely changing read endpoints.
+"""
+from datetime import timezone as dt_timezone
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models.signals import post_delete
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.dateparse import parse_datetime
+from django.utils.http import http_date
+from rest_framework.exceptions import APIException
+
+
+class NotModified(APIException):
+    """Short-circuits a view once the conditional request has matched"""
+    status_code = 304
+
+    def __init__(self, response):
+        super().__init__()
+        self.response = response
+
+
+def _to_datetime(value):
+    # SQLite hands back raw strings for aggregates over datetime columns
+    if isinstance(value, str):
+        value = parse_datetime(value)
+    if value is not None and value.tzinfo is None:
+        value = value.replace(tzinfo=dt_timezone.utc)
+    return value
+
+
+def _deletions_key(model):
+    return f'caching:deletions:{model._meta.db_table}'
+
+
+def bump_deletions(model):
+    try:
+        cache.incr(_deletions_key(model))
+    except ValueError:
+        # Seeded from the clock, so a counter lost to eviction or a restart never repeats an old value
+        cache.set(_deletions_key(model), time.time_ns(), None)
+
+
+def track_deletions(model):
+    """Bump the model's deletion counter once each delete commits; call from the app's signals module"""
+    def deleted(sender, **kwargs):
+        transaction.on_commit(lambda: bump_deletions(model))
+
+    post_delete.connect(deleted, sender=model, weak=False, dispatch_uid=f'track_deletions:{model._meta.label}')
+
+
+def get_deletion_counts(models):
+    keys = [_deletions_key(model) for model in models]
+    counts = cache.get_many(keys)
+    for key in keys:
+        if key not in counts:
+            cache.add(key, time.time_ns(), None)
+            counts[key] = cache.get(key)
+    return [counts[key] for key in keys]
+
+
+def get_change_markers(sources):
+    """
+    Return (latest timestamp, deletion counter) for each (model, field) source.
+    The timestamps are read in a single statement of indexed MAX subqueries;
+    deletes leave no timestamp behind, so they are counted in the cache by
+    track_deletions() instead of scanning the tables.
+    """
+    quote = connection.ops.quote_name
+    selects = []
+    for model, field_name in sources:
+        table = quote(model._meta.db_table)
+        column = quote(model._meta.get_field(field_name).column)
+        selects.append(f'(SELECT MAX({column}) FROM {table})')
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT {', '.join(selects)}")
+        row = cursor.fetchone()
+
+    deletions = get_deletion_counts([model for model, _ in sources])
+    return [(_to_datetime(value), count) for value, count in zip(row, deletions)]
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified support for viewsets whose payload only changes when
+    the tables listed in `conditional_sources` change. Matching requests get a
+    304 before any queryset or serializer work is done.
+    """
+    conditional_sources = ()
+    conditional_actions = ('list', 'retrieve')
+
+    def get_conditional_variant(self, request):
+        # Admins may see more rows (e.g. unpublished posts) than everyone else
+        user = request.user
+        return user.user_type if user.is_authenticated else 'anonymous'
+
+    def get_conditional_validators(self, request):
+        markers = get_change_markers(self.conditional_sources)
+        timestamps = [ts for ts, _ in markers if ts is not None]
+        last_modified = int(max(timestamps).timestamp()) if timestamps else None
+
+        fingerprint = repr((request.get_full_path(), self.get_conditional_variant(request), markers))
+        etag = '"%s"' % hashlib.md5(fingerprint.encode()).hexdigest()
+        return etag, last_modified
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._conditional = None
+        if request.method in ('GET', 'HEAD') and self.action in self.conditional_actions:
+            etag, last_modified = self.get_conditional_validators(request)
+            self._conditional = (etag, last_modified)
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is not None:
+                raise NotModified(response)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        conditional = getattr(self, '_conditional', None)
+        if conditional and response.status_code in (200, 304):
+            etag, last_modified = conditional
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+            self.patch_cache_headers(request, response)
+        return response
+
+    def patch_cache_headers(self, request, response):
+        max_age = settings.CATALOG_CACHE_MAX_AGE
+        if request.user.is_authenticated:
+            # Per-user responses: clients keep them but always revalidate
+            patch_cache_control(response, private=True, max_age=0, must_revalidate=True)
+        elif settings.CATALOG_CACHE_SHARED:
+            # Let a reverse proxy or CDN answer anonymous reads
+            patch_cache_control(
+                response, public=True, max_age=max_age,
+                s_maxage=settings.CATALOG_CACHE_S_MAXAGE,
+            )
+        else:
+            patch_cache_control(response, private=True, max_age=max_age)
+        patch_vary_headers(response, ('Accept', 'Authorization'))
@@ -0,0 +1,15 @@
+"""
+Celery application for background work (emails, notifications).
+
+Start a worker with:
+    celery -A maize_point worker -l info
+"""
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'maize_point.settings')
+
+app = Celery('maize_point')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
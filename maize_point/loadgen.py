@@ -0,0 +1,609 @@
+"""
+Synthetic data at production scale, for load tests and benchmarks.
+
+Everything is drawn from NumPy generators seeded from one --seed, with an
+independent stream per table, so the same arguments always produce the
+same rows, and changing --orders doesn't reshuffle farmers. Rows are
+generated chunk by chunk in timestamp order. Users, customers, farmers and
+stock lots go through bulk_create, with auto_now/auto_now_add switched off
+so they keep their historical timestamps. Orders, supplies and movements
+(the millions) are built column-wise in NumPy and inserted with
+insert_rows(), the same INSERT without the per-value ORM work. Neither sends
+signals; the denormalised data they would have maintained (customer order
+stats, report rollups) is rebuilt once at the end.
+
+Shapes follow Ghana's maize trade: farmers spread over the producing
+regions by output share, supplies peak with the bimodal southern harvest
+(July-August, November-December) or the northern one (September-November),
+prices follow a mean-reverting daily walk around a seasonal curve that
+peaks in the lean season, and orders grow over the period with quiet
+Sundays, tier-dependent sizes and a status mix that depends on their age.
+"""
+from contextlib import contextmanager
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+import math
+
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.utils import timezone
+
+from customers.models import Customer
+from farmers.dedupe import geohash, name_key, place_key
+from farmers.models import Farmer, FarmerSupply
+from inventory.models import Stock, StockMovement
+from orders.models import Order
+from products.models import Product
+
+User = get_user_model()
+
+LOAD_PASSWORD = 'loadtest123'
+BAG_TONS = 0.05  # 50kg bags
+# Rows drawn per random generator for orders, supplies and movements
+BLOCK_ROWS = 10000
+
+# region: (share of farmers, harvest pattern, [(district, latitude, longitude)])
+REGIONS = {
+    'Bono East': (0.14, 'south', [('Techiman', 7.59, -1.94), ('Kintampo', 8.05, -1.73), ('Nkoranza', 7.56, -1.71)]),
+    'Eastern': (0.13, 'south', [('Fanteakwa North', 6.39, -0.38), ('Kwahu Afram Plains', 6.92, -0.47), ('Yilo Krobo', 6.11, -0.02)]),
+    'Ashanti': (0.12, 'south', [('Ejisu', 6.72, -1.47), ('Offinso', 7.06, -1.67), ('Mampong', 7.06, -1.40)]),
+    'Northern': (0.12, 'north', [('Tamale', 9.40, -0.84), ('Yendi', 9.44, -0.01), ('Savelugu', 9.62, -0.82)]),
+    'Bono': (0.08, 'south', [('Wenchi', 7.74, -2.10), ('Sunyani', 7.34, -2.33)]),
+    'Volta': (0.06, 'south', [('Hohoe', 7.15, 0.47), ('Ho', 6.60, 0.47)]),
+    'Upper West': (0.06, 'north', [('Wa', 10.06, -2.50), ('Nadowli', 10.37, -2.66)]),
+    'Oti': (0.05, 'south', [('Nkwanta', 8.26, 0.52), ('Krachi', 7.80, -0.05)]),
+    'Upper East': (0.05, 'north', [('Bolgatanga', 10.79, -0.85), ('Bawku', 11.06, -0.24)]),
+    'Savannah': (0.05, 'north', [('Damongo', 9.08, -1.82), ('Bole', 9.03, -2.49)]),
+    'North East': (0.04, 'north', [('Nalerigu', 10.53, -0.37), ('Walewale', 10.35, -0.80)]),
+    'Central': (0.04, 'south', [('Assin Fosu', 5.70, -1.28), ('Agona Swedru', 5.53, -0.70)]),
+    'Western': (0.02, 'south', [('Tarkwa', 5.30, -1.99)]),
+    'Western North': (0.02, 'south', [('Sefwi Wiawso', 6.21, -2.49)]),
+    'Ahafo': (0.01, 'south', [('Goaso', 6.80, -2.52)]),
+    'Greater Accra': (0.01, 'south', [('Shai-Osudoku', 5.91, 0.05)]),
+}
+# Share of the year's deliveries in each month, January first
+HARVEST_MONTHS = {
+    'south': [3, 2, 2, 2, 3, 5, 18, 22, 10, 6, 12, 15],
+    'north': [4, 2, 1, 1, 1, 1, 2, 5, 20, 30, 25, 8],
+}
+COMMUNITIES = [
+    'Asokore', 'Nkwanta', 'Akuse', 'Gbullung', 'Kpalsi', 'Zangbalun', 'Tolon', 'Sang', 'Kumbungu', 'Nsuta',
+    'Adidome', 'Juaso', 'Konongo', 'Abofour', 'Amantin', 'Kajaji', 'Atebubu', 'Yeji', 'Bonwire', 'Afienya',
+]
+FIRST_NAMES = [
+    'Kwame', 'Kofi', 'Kwaku', 'Yaw', 'Kwabena', 'Kwasi', 'Kojo', 'Ama', 'Akosua', 'Abena', 'Adwoa', 'Yaa',
+    'Afua', 'Esi', 'Abdul', 'Fuseini', 'Alhassan', 'Mahama', 'Amina', 'Fatima', 'Zenabu', 'Selorm', 'Edem',
+]
+SURNAMES = [
+    'Mensah', 'Asante', 'Owusu', 'Boateng', 'Osei', 'Adjei', 'Agyeman', 'Amoah', 'Danso', 'Appiah', 'Tetteh',
+    'Quaye', 'Addo', 'Ofori', 'Sarpong', 'Abubakar', 'Issah', 'Iddrisu', 'Yakubu', 'Dery', 'Kuuire', 'Agbeko',
+]
+CUSTOMER_CITIES = {
+    'Accra': 30, 'Kumasi': 22, 'Tema': 8, 'Tamale': 8, 'Takoradi': 7, 'Techiman': 6,
+    'Cape Coast': 5, 'Sunyani': 5, 'Koforidua': 5, 'Ho': 4,
+}
+WAREHOUSES = ['Kumasi Central', 'Techiman Depot', 'Tamale Depot', 'Tema Port']
+# Customers get the first four, farmers the rest; create_sample_data uses 20, 24 and 50
+MOBILE_PREFIXES = ['54', '55', '59', '53', '56', '57', '25', '28']
+
+# tier: (share of customers, price multiplier, median bags per order)
+TIERS = {'STANDARD': (0.80, 1.00, 8), 'WHOLESALE': (0.15, 0.95, 60), 'DISTRIBUTOR': (0.05, 0.90, 250)}
+PAYMENT_OPTIONS = {'MOBILE_MONEY': 0.55, 'BANK_TRANSFER': 0.25, 'CASH': 0.20}
+# Status mix by order age: under 2 days, under a week, older
+ORDER_STATUSES = ['PENDING', 'PROCESSING', 'DISPATCHED', 'DELIVERED', 'CANCELLED']
+STATUS_BY_AGE = [
+    (2, [0.60, 0.30, 0.10, 0.00, 0.00]),
+    (7, [0.15, 0.25, 0.30, 0.25, 0.05]),
+    (None, [0.02, 0.00, 0.00, 0.90, 0.08]),
+]
+# movement type: (share, median bags)
+MOVEMENTS = {'DEDUCTION': (0.55, 15), 'ADDITION': (0.35, 40), 'TRANSFER': (0.07, 0), 'DAMAGE': (0.03, 3)}
+# Per-bag base price of each default product, GHS
+BASE_PRICES = {'Yellow Maize': 260.0, 'White Maize': 250.0, 'Mixed Maize': 240.0}
+FARMGATE_SHARE = 0.85
+
+
+class LoadDataError(Exception):
+    """The database can't take the generated data"""
+
+
+@contextmanager
+def historical_timestamps(*models):
+    """Let bulk_create keep explicit created_at/updated_at values instead of stamping now()"""
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def _scramble(index, modulus, salt):
+    """Distinct, random-looking numbers below modulus for distinct indexes (an affine bijection)"""
+    multiplier = 2654435761 % modulus
+    while math.gcd(multiplier, modulus) != 1:
+        multiplier += 1
+    return (index * multiplier + salt) % modulus
+
+
+def _lognormal_bags(rng, median, size, sigma=0.6):
+    return np.maximum(1, np.rint(rng.lognormal(math.log(median), sigma, size))).astype(np.int64)
+
+
+def _decimals(values, places):
+    """DecimalField values as the fixed-point strings Django itself sends to the database"""
+    return np.char.mod(f'%.{places}f', values).tolist()
+
+
+def insert_rows(model, batch_size, columns):
+    """
+    INSERT rows given as {attname: list of database-ready values}, batch_size per statement.
+
+    The same statement bulk_create sends, minus building a model instance and
+    preparing every value one at a time, which is most of bulk_create's cost
+    at millions of rows. Every concrete field must be given, so a new column
+    fails here rather than silently defaulting.
+    """
+    missing = [field.attname for field in model._meta.concrete_fields if field.attname not in columns]
+    if missing and missing != [model._meta.pk.attname]:
+        raise LoadDataError(f"{model.__name__} rows lack {', '.join(missing)}")
+    quote = connection.ops.quote_name
+    fields = [model._meta.get_field(name) for name in columns]
+    sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+        quote(model._meta.db_table),
+        ', '.join(quote(field.column) for field in fields),
+        ', '.join(['%s'] * len(fields)),
+    )
+    rows = list(zip(*columns.values()))
+    with transaction.atomic(), connection.cursor() as cursor:
+        for start in range(0, len(rows), batch_size):
+            cursor.executemany(sql, rows[start:start + batch_size])
+
+
+def reset_sequences(*models):
+    """Move primary key sequences past explicitly inserted ids (a no-op on SQLite)"""
+    statements = connection.ops.sequence_reset_sql(no_style(), models)
+    if statements:
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
+
+
+def _chunks(total, size):
+    for start in range(0, total, size):
+        yield start, min(start + size, total)
+
+
+class LoadGenerator:
+    """Generates one consistent dataset; call run() once"""
+
+    def __init__(self, seed=0, days=730, end=None, chunk_size=5000, log=None):
+        self.seed = seed
+        self.days = days
+        self.chunk_size = chunk_size
+        self.log = log or (lambda message: None)
+        # Midnight, so a given --seed and --end always give the same rows
+        self.end = timezone.make_aware(datetime.combine(end or timezone.localdate(), time.min))
+        self.start = self.end - timedelta(days=days)
+        self.streams = dict(zip(
+            ['customers', 'farmers', 'prices', 'orders', 'supplies', 'stock', 'movements'],
+            np.random.SeedSequence(seed).spawn(7),
+        ))
+
+    def rng(self, name):
+        return np.random.default_rng(self.streams[name])
+
+    def _blocks(self, name, total):
+        """(start, stop, generator) per BLOCK_ROWS rows; a generator per block keeps rows independent of --chunk-size"""
+        stream = self.streams[name]
+        for block, (start, stop) in enumerate(_chunks(total, BLOCK_ROWS)):
+            sequence = np.random.SeedSequence(stream.entropy, spawn_key=(*stream.spawn_key, block))
+            yield start, stop, np.random.default_rng(sequence)
+
+    # Time helpers; all timestamps are seconds since self.start
+
+    def _day_weights(self, growth=math.log(2), sunday=0.3):
+        """Relative volume per day: doubling over the period, quiet Sundays"""
+        days = np.arange(self.days)
+        weekdays = (self.start.weekday() + days) % 7
+        return np.exp(growth * days / self.days) * np.where(weekdays == 6, sunday, 1.0)
+
+    def _times(self, rng, count, day_weights):
+        """Sorted offsets in seconds, day drawn from day_weights, hour around early afternoon"""
+        day = rng.choice(len(day_weights), size=count, p=day_weights / day_weights.sum())
+        hours = np.clip(rng.normal(13, 3, count), 6, 20.99)
+        return np.sort(day * 86400 + (hours * 3600).astype(np.int64))
+
+    def _datetime(self, seconds):
+        return self.start + timedelta(seconds=int(seconds))
+
+    def _datetimes(self, seconds, mask=None):
+        """Database values of start + seconds, None where mask is False"""
+        start = np.datetime64(self.start.astimezone(dt_timezone.utc).replace(tzinfo=None), 's')
+        values = (start + seconds.astype('timedelta64[s]')).tolist()
+        adapt = connection.ops.adapt_datetimefield_value
+        if mask is None:
+            return [adapt(value.replace(tzinfo=dt_timezone.utc)) for value in values]
+        return [adapt(value.replace(tzinfo=dt_timezone.utc)) if keep else None for value, keep in zip(values, mask.tolist())]
+
+    def _dates(self, seconds):
+        """Database values of the local dates of start + seconds"""
+        start = np.datetime64(self.start.replace(tzinfo=None), 's')
+        days = (start + seconds.astype('timedelta64[s]')).astype('datetime64[D]').tolist()
+        return [connection.ops.adapt_datefield_value(day) for day in days]
+
+    def _harvest_weights(self, pattern):
+        days = np.arange(self.days)
+        months = (np.datetime64(self.start.date()) + days).astype('datetime64[M]').astype(np.int64) % 12
+        shares = np.array(HARVEST_MONTHS[pattern], dtype=float)
+        return shares[months] * np.exp(0.2 * days / self.days)
+
+    def _price_walk(self, rng, base):
+        """Daily per-bag price: seasonal curve peaking in the May lean season, plus an AR(1) walk"""
+        days = np.arange(self.days)
+        day_of_year = (np.datetime64(self.start.date()) + days - np.datetime64(f'{self.start.year}-01-01')).astype(np.int64)
+        seasonal = 0.15 * np.cos(2 * np.pi * (day_of_year - 135) / 365.25)
+        shocks = rng.normal(0, 0.012, self.days)
+        walk = np.empty(self.days)
+        level = 0.0
+        for day, shock in enumerate(shocks):
+            level = 0.985 * level + shock
+            walk[day] = level
+        return base * np.exp(seasonal + walk)
+
+    # Tables
+
+    def products(self):
+        products = list(Product.objects.order_by('id'))
+        if not products:
+            products = [
+                Product.objects.create(
+                    name=name, description=f'{name} (generated)', packaging_sizes=['50kg bag', '100kg bag'],
+                )
+                for name in BASE_PRICES
+            ]
+        rng = self.rng('prices')
+        self.product_ids = np.array([product.id for product in products])
+        self.product_names = [product.name for product in products]
+        self.prices = np.vstack([
+            self._price_walk(rng, BASE_PRICES.get(product.name, 250.0)) for product in products
+        ])
+        return products
+
+    def staff_user(self):
+        user = User.objects.filter(user_type__in=['ADMIN', 'STAFF']).order_by('id').first()
+        if user is None:
+            user = User.objects.create_user(
+                username='loadgen_staff', password=LOAD_PASSWORD, user_type='STAFF', mobile_number='+233200000099',
+            )
+            User.objects.filter(pk=user.pk).update(date_joined=self.start, created_at=self.start, updated_at=self.start)
+        self.staff_id = user.id
+        return user
+
+    def customers(self, count):
+        if not count:
+            return
+        rng = self.rng('customers')
+        password = make_password(LOAD_PASSWORD)
+        # 10% of customers predate the period; the rest sign up steadily
+        offsets = np.sort(rng.uniform(-0.1, 0.95, count) * self.days * 86400).astype(np.int64)
+        tiers = rng.choice(list(TIERS), size=count, p=[share for share, _, _ in TIERS.values()])
+        cities = rng.choice(list(CUSTOMER_CITIES), size=count, p=np.array(list(CUSTOMER_CITIES.values())) / 100)
+        firsts = rng.integers(len(FIRST_NAMES), size=count)
+        lasts = rng.integers(len(SURNAMES), size=count)
+        salt = int(rng.integers(10**7))
+
+        self.customer_ids = np.zeros(count, dtype=np.int64)
+        self.customer_times = offsets
+        self.customer_tiers = tiers
+        for start, stop in _chunks(count, self.chunk_size):
+            users, customers = [], []
+            for index in range(start, stop):
+                created = self._datetime(offsets[index])
+                number = _scramble(index, 10**7, salt)
+                users.append(User(
+                    username=f'load_customer_{index}',
+                    email=f'load_customer_{index}@example.com',
+                    password=password,
+                    first_name=FIRST_NAMES[firsts[index]],
+                    last_name=SURNAMES[lasts[index]],
+                    mobile_number=f'+233{MOBILE_PREFIXES[index // 10**7 % 4]}{number:07d}',
+                    user_type='CUSTOMER',
+                    date_joined=created,
+                    created_at=created,
+                    updated_at=created,
+                ))
+            with transaction.atomic():
+                User.objects.bulk_create(users)
+                for index, user in zip(range(start, stop), users):
+                    created = self._datetime(offsets[index])
+                    customers.append(Customer(
+                        user=user,
+                        customer_id=f'CUST{_scramble(index, 16**8, salt):08X}',
+                        location=cities[index],
+                        pricing_tier=tiers[index],
+                        created_at=created,
+                        updated_at=created,
+                    ))
+                Customer.objects.bulk_create(customers)
+            self.customer_ids[start:stop] = [customer.id for customer in customers]
+            self.log(f'customers {stop}/{count}')
+
+    def farmers(self, count):
+        if not count:
+            return
+        rng = self.rng('farmers')
+        names = list(REGIONS)
+        regions = rng.choice(len(names), size=count, p=[REGIONS[name][0] for name in names])
+        offsets = np.sort(rng.uniform(-0.3, 0.9, count) * self.days * 86400).astype(np.int64)
+        jitter = rng.uniform(-0.15, 0.15, (count, 2))
+        picks = rng.integers(1 << 30, size=(count, 5))
+        approved = rng.random(count) < 0.92
+        salt = int(rng.integers(10**9))
+
+        self.farmer_ids = np.zeros(count, dtype=np.int64)
+        self.farmer_patterns = np.array([REGIONS[names[region]][1] for region in regions])
+        # Farm sizes: most deliveries come from a minority of larger farms
+        self.farmer_weights = rng.pareto(2.5, count) + 1
+        self.farmer_products = picks[:, 4] % 3
+        for start, stop in _chunks(count, self.chunk_size):
+            farmers = []
+            for index in range(start, stop):
+                region = names[regions[index]]
+                district, latitude, longitude = REGIONS[region][2][picks[index, 0] % len(REGIONS[region][2])]
+                created = self._datetime(offsets[index])
+                full_name = f'{FIRST_NAMES[picks[index, 1] % len(FIRST_NAMES)]} {SURNAMES[picks[index, 2] % len(SURNAMES)]}'
+                community = COMMUNITIES[picks[index, 3] % len(COMMUNITIES)]
+                gps_latitude = Decimal(f'{latitude + jitter[index, 0]:.6f}')
+                gps_longitude = Decimal(f'{longitude + jitter[index, 1]:.6f}')
+                number = _scramble(index, 10**9, salt)
+                mobile = _scramble(index, 10**7, salt)
+                farmers.append(Farmer(
+                    full_name=full_name,
+                    mobile_number=f'+233{MOBILE_PREFIXES[4 + index // 10**7 % 4]}{mobile:07d}',
+                    ghana_card_number=f'GHA-{number:09d}-{index % 10}',
+                    gps_latitude=gps_latitude,
+                    gps_longitude=gps_longitude,
+                    region=region,
+                    district=district,
+                    community=community,
+                    maize_types_supplied=self.product_names[:1 + int(self.farmer_products[index]) % len(self.product_names)],
+                    # bulk_create skips save(), which normally fills the dedupe keys
+                    name_key=name_key(full_name),
+                    geohash=geohash(gps_latitude, gps_longitude),
+                    place_key=place_key(district, community),
+                    is_approved=bool(approved[index]),
+                    created_by_id=self.staff_id,
+                    created_at=created,
+                    updated_at=created,
+                ))
+            Farmer.objects.bulk_create(farmers)
+            self.farmer_ids[start:stop] = [farmer.id for farmer in farmers]
+            self.log(f'farmers {stop}/{count}')
+
+    def stock(self):
+        """One intake lot per product, warehouse and month, received early in the month"""
+        rng = self.rng('stock')
+        months = max(1, math.ceil(self.days / 30.44))
+        lots = []
+        for month in range(months):
+            for product_index, product_id in enumerate(self.product_ids):
+                for warehouse in WAREHOUSES:
+                    offset = int((month * 30.44 + rng.uniform(0, 5)) * 86400)
+                    if offset >= self.days * 86400:
+                        continue
+                    received = self._datetime(offset)
+                    # Current levels: most lots drawn down, some nearly empty (low stock alerts)
+                    bags = int(rng.choice([rng.integers(0, 100), rng.integers(100, 2000)], p=[0.2, 0.8]))
+                    lots.append((offset, Stock(
+                        product_id=product_id,
+                        quantity_bags=bags,
+                        quantity_tons=Decimal(f'{bags * BAG_TONS:.3f}'),
+                        source_type='FARMER' if rng.random() < 0.7 else 'MARKET_PURCHASE',
+                        quality_grade=str(rng.choice(['Premium', 'Standard', 'Standard', 'Grade B'])),
+                        moisture_content=Decimal(f'{rng.uniform(11.5, 14.5):.2f}'),
+                        warehouse_location=warehouse,
+                        cost_price=Decimal(f'{self.prices[product_index, offset // 86400] * FARMGATE_SHARE:.2f}'),
+                        date_received=received,
+                        expiry_alert_date=(received + timedelta(days=int(rng.integers(150, 270)))).date(),
+                        created_at=received,
+                        updated_at=received,
+                    )))
+        lots.sort(key=lambda lot: lot[0])
+        Stock.objects.bulk_create([stock for _, stock in lots], batch_size=self.chunk_size)
+        self.stock_times = np.array([offset for offset, _ in lots])
+        self.stock_ids = np.array([stock.id for _, stock in lots])
+        self.log(f'stock lots {len(lots)}')
+
+    def _status(self, rng, ages):
+        statuses = np.empty(len(ages), dtype=object)
+        lower = 0
+        for limit, shares in STATUS_BY_AGE:
+            upper = np.inf if limit is None else limit
+            selected = (ages >= lower) & (ages < upper)
+            statuses[selected] = rng.choice(ORDER_STATUSES, size=int(selected.sum()), p=shares)
+            lower = upper
+        return statuses
+
+    def orders(self, count):
+        if not count:
+            return
+        rng = self.rng('orders')
+        times = self._times(rng, count, self._day_weights())
+        salt = int(rng.integers(1 << 40))
+        first_id = (Order.objects.order_by('-id').values_list('id', flat=True).first() or 0) + 1
+        self.order_ids = np.arange(first_id, first_id + count, dtype=np.int64)
+        self.order_times = times
+        tier_index = {tier: position for position, tier in enumerate(TIERS)}
+        multipliers = np.array([multiplier for _, multiplier, _ in TIERS.values()])
+        medians = np.array([median for _, _, median in TIERS.values()])
+        payment_options = list(PAYMENT_OPTIONS)
+
+        for start, stop, rng in self._blocks('orders', count):
+            size = stop - start
+            chunk_times = times[start:stop]
+            # Longstanding customers order more: pick among those signed up by then, skewed to the earliest
+            eligible = np.maximum(np.searchsorted(self.customer_times, chunk_times, side='right'), 1)
+            customers = np.minimum((eligible * rng.random(size) ** 2).astype(np.int64), eligible - 1)
+            products = rng.integers(len(self.product_ids), size=size)
+            tiers = np.array([tier_index[tier] for tier in self.customer_tiers[customers]])
+            bags = np.maximum(1, np.rint(rng.lognormal(np.log(medians[tiers]), 0.6))).astype(np.int64)
+            unit_cents = np.rint(self.prices[products, chunk_times // 86400] * multipliers[tiers] * 100).astype(np.int64)
+            ages = (self.days * 86400 - chunk_times) / 86400
+            statuses = self._status(rng, ages)
+            delivery = rng.random(size) < 0.6
+            payments = rng.choice(len(payment_options), size=size, p=list(PAYMENT_OPTIONS.values()))
+            lead_days = rng.integers(1, 6, size)
+            approve_seconds = (rng.uniform(0.5, 8, size) * 3600).astype(np.int64)
+            approved = ~np.isin(statuses, ['PENDING', 'CANCELLED'])
+            delivery_dates = self._dates(chunk_times + lead_days * 86400)
+            created = self._datetimes(chunk_times)
+
+            insert_rows(Order, self.chunk_size, {
+                'id': self.order_ids[start:stop].tolist(),
+                'order_id': [f'ORD{_scramble(index, 16**10, salt):010X}' for index in range(start, stop)],
+                'customer_id': self.customer_ids[customers].tolist(),
+                'product_id': self.product_ids[products].tolist(),
+                'quantity_bags': bags.tolist(),
+                'quantity_tons': _decimals(bags * BAG_TONS, 3),
+                'unit_price': _decimals(unit_cents / 100, 2),
+                'total_price': _decimals(unit_cents * bags / 100, 2),
+                'delivery_method': np.where(delivery, 'DELIVERY', 'PICKUP').tolist(),
+                'delivery_address': np.where(delivery, 'Generated delivery address', '').tolist(),
+                'delivery_date': [day if chosen else None for day, chosen in zip(delivery_dates, delivery.tolist())],
+                'payment_option': [payment_options[payment] for payment in payments.tolist()],
+                'order_status': statuses.tolist(),
+                'customer_notes': [''] * size,
+                'admin_notes': [''] * size,
+                'approved_by_id': np.where(approved, self.staff_id, None).tolist(),
+                'approved_at': self._datetimes(chunk_times + approve_seconds, mask=approved),
+                'created_at': created,
+                'updated_at': created,
+            })
+            if stop % (BLOCK_ROWS * 10) == 0 or stop == count:
+                self.log(f'orders {stop}/{count}')
+        reset_sequences(Order)
+
+    def supplies(self, count):
+        if not count:
+            return
+        rng = self.rng('supplies')
+        patterns = {pattern: self._harvest_weights(pattern) for pattern in HARVEST_MONTHS}
+        weights = self.farmer_weights / self.farmer_weights.sum()
+        farmers = rng.choice(len(self.farmer_ids), size=count, p=weights)
+        times = np.empty(count, dtype=np.int64)
+        for pattern, day_weights in patterns.items():
+            selected = np.flatnonzero(self.farmer_patterns[farmers] == pattern)
+            times[selected] = self._times(rng, len(selected), day_weights)
+        order = np.argsort(times, kind='stable')
+        farmers, times = farmers[order], times[order]
+
+        for start, stop, rng in self._blocks('supplies', count):
+            size = stop - start
+            chunk_times = times[start:stop]
+            chunk_farmers = farmers[start:stop]
+            products = rng.integers(len(self.product_ids), size=size) % (self.farmer_products[chunk_farmers] + 1)
+            products = products % len(self.product_ids)
+            bags = _lognormal_bags(rng, 30, size, sigma=0.8)
+            cost_cents = np.rint(self.prices[products, chunk_times // 86400] * FARMGATE_SHARE * 100).astype(np.int64)
+            total_cents = cost_cents * bags
+            ages = (self.days * 86400 - chunk_times) / 86400
+            # Older deliveries are mostly settled
+            paid_share = np.clip(ages / 60, 0, 1)
+            status_roll = rng.random(size)
+            paid = status_roll < paid_share * 0.9
+            partial = ~paid & (status_roll < paid_share * 0.9 + 0.15)
+            partial_share = np.round(0.2 + 0.6 * status_roll, 2)
+            paid_cents = np.where(paid, total_cents, np.where(partial, np.rint(total_cents * partial_share), 0))
+            lots = np.maximum(np.searchsorted(self.stock_times, chunk_times, side='right') - 1, 0)
+
+            created = self._datetimes(chunk_times)
+            insert_rows(FarmerSupply, self.chunk_size, {
+                'farmer_id': self.farmer_ids[chunk_farmers].tolist(),
+                'product_id': self.product_ids[products].tolist(),
+                'quantity_bags': bags.tolist(),
+                'quantity_tons': _decimals(bags * BAG_TONS, 3),
+                'date_delivered': created,
+                'cost_per_bag': _decimals(cost_cents / 100, 2),
+                'total_cost': _decimals(total_cents / 100, 2),
+                'payment_status': np.where(paid, 'PAID', np.where(partial, 'PARTIAL', 'PENDING')).tolist(),
+                'amount_paid': _decimals(paid_cents / 100, 2),
+                'stock_id': self.stock_ids[lots].tolist() if len(self.stock_ids) else [None] * size,
+                'notes': [''] * size,
+                'recorded_by_id': [self.staff_id] * size,
+                'created_at': created,
+                'updated_at': created,
+            })
+            if stop % (BLOCK_ROWS * 10) == 0 or stop == count:
+                self.log(f'supplies {stop}/{count}')
+        reset_sequences(FarmerSupply)
+
+    def movements(self, count):
+        if not count:
+            return
+        rng = self.rng('movements')
+        times = self._times(rng, count, self._day_weights())
+        types = np.array(list(MOVEMENTS))
+        medians = np.array([median or 1 for _, median in MOVEMENTS.values()])
+        reasons = np.array(['Manual deduction', 'Farmer supply received', 'Warehouse transfer', 'Pest damage'])
+        has_orders = len(getattr(self, 'order_ids', ())) > 0
+
+        for start, stop, rng in self._blocks('movements', count):
+            size = stop - start
+            chunk_times = times[start:stop]
+            kinds = rng.choice(len(types), size=size, p=[share for share, _ in MOVEMENTS.values()])
+            bags = np.maximum(1, np.rint(rng.lognormal(np.log(medians[kinds]), 0.6))).astype(np.int64)
+            bags[types[kinds] == 'TRANSFER'] = 0
+            # Mostly the newest lots received by then
+            eligible = np.maximum(np.searchsorted(self.stock_times, chunk_times, side='right'), 1)
+            lots = np.maximum(eligible - 1 - (eligible * rng.random(size) ** 3).astype(np.int64), 0)
+            order_ids = np.full(size, None, dtype=object)
+            if has_orders:
+                # Deductions ship an order placed shortly before
+                orders = np.maximum(np.searchsorted(self.order_times, chunk_times, side='right') - 1 - rng.integers(0, 50, size), 0)
+                shipping = types[kinds] == 'DEDUCTION'
+                order_ids[shipping] = self.order_ids[orders[shipping]]
+            reason = np.where(order_ids != None, 'Order dispatch', reasons[kinds])  # noqa: E711
+
+            insert_rows(StockMovement, self.chunk_size, {
+                'stock_id': self.stock_ids[lots].tolist(),
+                'movement_type': types[kinds].tolist(),
+                'quantity_bags': bags.tolist(),
+                'quantity_tons': _decimals(bags * BAG_TONS, 3),
+                'order_id': [None if order_id is None else int(order_id) for order_id in order_ids],
+                'reason': reason.tolist(),
+                'performed_by_id': [self.staff_id] * size,
+                'created_at': self._datetimes(chunk_times),
+            })
+            if stop % (BLOCK_ROWS * 10) == 0 or stop == count:
+                self.log(f'movements {stop}/{count}')
+        reset_sequences(StockMovement)
+
+    def run(self, customers=0, farmers=0, orders=0, supplies=0, movements=0):
+        if orders and not customers:
+            raise LoadDataError('Orders need customers; pass --customers too.')
+        if supplies and not farmers:
+            raise LoadDataError('Supplies need farmers; pass --farmers too.')
+        if User.objects.filter(username='load_customer_0').exists() and customers:
+            raise LoadDataError('Generated customers already exist; use a fresh database.')
+
+        self.products()
+        self.staff_user()
+        with historical_timestamps(User, Customer, Farmer, Stock):
+            self.customers(customers)
+            self.farmers(farmers)
+            if supplies or movements:
+                self.stock()
+            self.orders(orders)
+            self.supplies(supplies)
+            if movements:
+                self.movements(movements)
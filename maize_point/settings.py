@@ -59,9 +59,15 @@ INSTALLED_APPS = [
     "orders.apps.OrdersConfig",
     "blog.apps.BlogConfig",
     "notifications.apps.NotificationsConfig",
+    "images.apps.ImagesConfig",
+    "reports.apps.ReportsConfig",
+    "analytics.apps.AnalyticsConfig",
+    "monitoring.apps.MonitoringConfig",
 ]
 
 MIDDLEWARE = [
+    "monitoring.profiling.ProfilingMiddleware",
+    "monitoring.middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -106,6 +112,15 @@ DATABASES = {
     }
 }
 
+# Cache (reports). Per-process memory by default; use Redis to share it across workers, e.g.
+# CACHE_BACKEND=django.core.cache.backends.redis.RedisCache CACHE_LOCATION=redis://localhost:6379/1
+CACHES = {
+    "default": {
+        "BACKEND": config("CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": config("CACHE_LOCATION", default="maize-point"),
+    }
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -147,6 +162,8 @@ STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 # Media files
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
+# Content-addressed image thumbnails and medium sizes, relative to MEDIA_ROOT
+IMAGE_VARIANTS_DIR = config("IMAGE_VARIANTS_DIR", default="derived")
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -159,7 +176,7 @@ AUTH_USER_MODEL = "accounts.User"
 # REST Framework Configuration
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.CachedJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
@@ -194,8 +211,19 @@ SIMPLE_JWT = {
     "USER_ID_CLAIM": "user_id",
     "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
     "TOKEN_TYPE_CLAIM": "token_type",
+    "TOKEN_OBTAIN_SERIALIZER": "accounts.serializers.UserTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "accounts.serializers.UserTokenRefreshSerializer",
 }
 
+# Refresh-token revocation store (see accounts/revocation.py)
+REVOCATION_BLOOM_CAPACITY = config("REVOCATION_BLOOM_CAPACITY", default=100000, cast=int)
+REVOCATION_BLOOM_ERROR_RATE = config("REVOCATION_BLOOM_ERROR_RATE", default=0.001, cast=float)
+REVOCATION_SYNC_INTERVAL = config("REVOCATION_SYNC_INTERVAL", default=1, cast=float)
+
+# Authenticated user cache (per process) used by CachedJWTAuthentication
+AUTH_USER_CACHE_TTL = config("AUTH_USER_CACHE_TTL", default=30, cast=int)
+AUTH_USER_CACHE_SIZE = config("AUTH_USER_CACHE_SIZE", default=10000, cast=int)
+
 # CORS Configuration
 CORS_ALLOWED_ORIGINS = config(
     "CORS_ALLOWED_ORIGINS",
@@ -234,6 +262,55 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
+# Run tasks inline (no broker needed) for local development
+CELERY_TASK_ALWAYS_EAGER = config("CELERY_TASK_ALWAYS_EAGER", default=False, cast=bool)
+CELERY_TASK_ACKS_LATE = True
+# Periodic tasks, run with: celery -A maize_point beat
+CELERY_BEAT_SCHEDULE = {
+    "refresh-report-rollups": {
+        "task": "reports.tasks.refresh_rollups",
+        "schedule": config("REPORTS_ROLLUP_INTERVAL", default=300, cast=int),
+    },
+    "build-analytics-snapshot": {
+        "task": "analytics.tasks.build_analytics_snapshot",
+        "schedule": config("ANALYTICS_SNAPSHOT_INTERVAL", default=900, cast=int),
+    },
+    "collect-business-metrics": {
+        "task": "monitoring.tasks.collect_business_metrics",
+        "schedule": config("METRICS_COLLECT_INTERVAL", default=60, cast=int),
+    },
+}
+
+# Pricing Engine
+# Seconds a compiled price table is reused before other workers' changes are picked up
+PRICE_TABLE_TTL = config("PRICE_TABLE_TTL", default=300, cast=int)
+
+# Farmer bulk import; the validation process pool is only used by the import_farmers command
+FARMER_IMPORT_WORKERS = config("FARMER_IMPORT_WORKERS", default=4, cast=int)
+# Rows read, validated and inserted per round; chunks smaller than the threshold skip the process pool
+FARMER_IMPORT_CHUNK_SIZE = config("FARMER_IMPORT_CHUNK_SIZE", default=5000, cast=int)
+FARMER_IMPORT_PARALLEL_THRESHOLD = config("FARMER_IMPORT_PARALLEL_THRESHOLD", default=2000, cast=int)
+# Error reports are kept outside MEDIA_ROOT and only served to admin/staff
+IMPORT_REPORT_DIR = config("IMPORT_REPORT_DIR", default=os.path.join(BASE_DIR, "import_reports"))
+
+# Report rollups: days are cut in this time zone
+REPORTS_TIME_ZONE = config("REPORTS_TIME_ZONE", default=TIME_ZONE)
+# Seconds the high-water mark is rewound on each refresh, for rows committed late
+REPORTS_ROLLUP_OVERLAP = config("REPORTS_ROLLUP_OVERLAP", default=300, cast=int)
+# Seconds a report covering today (or live stock) is cached; closed periods never expire
+REPORTS_CACHE_TTL = config("REPORTS_CACHE_TTL", default=60, cast=int)
+
+# Columnar NumPy snapshots for /api/analytics/query/, rebuilt every ANALYTICS_SNAPSHOT_INTERVAL seconds
+ANALYTICS_SNAPSHOT_DIR = config("ANALYTICS_SNAPSHOT_DIR", default=str(BASE_DIR / "analytics_snapshots"))
+
+# Duplicate farmer detection: minimum score (0-1) of name similarity and GPS proximity
+FARMER_DUPLICATE_THRESHOLD = config("FARMER_DUPLICATE_THRESHOLD", default=0.85, cast=float)
+
+# HTTP caching for public catalog endpoints (products, current prices, blog)
+CATALOG_CACHE_MAX_AGE = config("CATALOG_CACHE_MAX_AGE", default=60, cast=int)
+# Mark anonymous responses public so a reverse proxy/CDN can serve them
+CATALOG_CACHE_SHARED = config("CATALOG_CACHE_SHARED", default=False, cast=bool)
+CATALOG_CACHE_S_MAXAGE = config("CATALOG_CACHE_S_MAXAGE", default=300, cast=int)
 
 # Phone Number Configuration
 PHONENUMBER_DEFAULT_REGION = "GH"
@@ -247,6 +324,9 @@ LOGGING = {
             "format": "{levelname} {asctime} {module} {message}",
             "style": "{",
         },
+        "json": {
+            "()": "monitoring.log.JSONFormatter",
+        },
     },
     "handlers": {
         "console": {
@@ -254,10 +334,15 @@ LOGGING = {
             "formatter": "verbose",
         },
         "file": {
-            "class": "logging.FileHandler",
+            "class": "monitoring.log.QueuedFileHandler",
             "filename": os.path.join(BASE_DIR, "logs", "debug.log"),
             "formatter": "verbose",
         },
+        "requests": {
+            "class": "monitoring.log.QueuedFileHandler",
+            "filename": os.path.join(BASE_DIR, "logs", "requests.log"),
+            "formatter": "json",
+        },
     },
     "root": {
         "handlers": ["console", "file"],
@@ -284,5 +369,40 @@ LOGGING = {
             "level": "DEBUG",
             "propagate": False,
         },
+        "monitoring.requests": {
+            "handlers": ["requests"],
+            "level": "INFO",
+            "propagate": False,
+        },
     },
 }
+
+# Per-request metrics (monitoring.middleware): JSON lines in logs/requests.log and a Server-Timing header
+REQUEST_METRICS_ENABLED = config("REQUEST_METRICS_ENABLED", default=True, cast=bool)
+# Server-Timing for every client; otherwise only admins and staff get it
+SERVER_TIMING = config("SERVER_TIMING", default=DEBUG, cast=bool)
+# Queries a request may make before a warning is logged; override per endpoint or view class,
+# e.g. {"OrderViewSet.list": 5, "ReportViewSet": 40}, None for no budget
+REQUEST_QUERY_BUDGET = config("REQUEST_QUERY_BUDGET", default=25, cast=int)
+REQUEST_QUERY_BUDGETS = {}
+
+# /metrics (Prometheus). Set PROMETHEUS_MULTIPROC_DIR in the environment when running several worker processes.
+# Business gauges are read from METRICS_GAUGE_FILE, rewritten every METRICS_COLLECT_INTERVAL seconds.
+# Required in production: without a token /metrics answers only under DEBUG or to METRICS_ALLOWED_IPS
+# (scrapers connecting directly, not through a proxy that makes every client look local)
+METRICS_TOKEN = config("METRICS_TOKEN", default="")
+METRICS_ALLOWED_IPS = config("METRICS_ALLOWED_IPS", default="", cast=Csv())
+METRICS_GAUGE_FILE = config("METRICS_GAUGE_FILE", default=str(BASE_DIR / "metrics" / "business.json"))
+METRICS_TASK_QUEUES = config("METRICS_TASK_QUEUES", default="celery", cast=Csv())
+
+# Admin request profiling (X-Profile: 1 or ?profile=1); the newest PROFILING_KEEP profiles are kept in PROFILE_DIR
+PROFILING_ENABLED = config("PROFILING_ENABLED", default=True, cast=bool)
+PROFILE_DIR = config("PROFILE_DIR", default=str(BASE_DIR / "profiles"))
+PROFILING_KEEP = config("PROFILING_KEEP", default=50, cast=int)
+PROFILING_EXPLAIN_QUERIES = config("PROFILING_EXPLAIN_QUERIES", default=5, cast=int)
+PROFILING_TOP_FUNCTIONS = config("PROFILING_TOP_FUNCTIONS", default=40, cast=int)
+PROFILING_TRACEMALLOC_FRAMES = config("PROFILING_TRACEMALLOC_FRAMES", default=1, cast=int)
+
+# Endpoint benchmarks (run_benchmarks): history.jsonl and baseline.json live in BENCHMARK_DIR
+BENCHMARK_DIR = config("BENCHMARK_DIR", default=str(BASE_DIR / "benchmarks"))
+BENCHMARK_TOLERANCE = config("BENCHMARK_TOLERANCE", default=0.2, cast=float)
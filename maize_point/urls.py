@@ -6,6 +6,7 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
+from monitoring.views import metrics
 
 urlpatterns = [
     # Admin
@@ -16,6 +17,9 @@ urlpatterns = [
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('api/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
     
+    # Prometheus scrape endpoint
+    path('metrics', metrics, name='metrics'),
+    
     # API Endpoints
     path('api/auth/', include('accounts.urls')),
     path('api/customers/', include('customers.urls')),
@@ -25,6 +29,9 @@ urlpatterns = [
     path('api/inventory/', include('inventory.urls')),
     path('api/orders/', include('orders.urls')),
     path('api/blog/', include('blog.urls')),
+    path('api/reports/', include('reports.urls')),
+    path('api/analytics/', include('analytics.urls')),
+    path('api/monitoring/', include('monitoring.urls')),
 ]
 
 # Serve media files in development
@@ -0,0 +1,301 @@
+"""
+Endpoint latency benchmarks.
+
+run_benchmarks() creates a throwaway test database (in-memory SQLite, or
+test_<name> on PostgreSQL when DB_ENGINE points there), seeds it with
+generate_load_data at a fixed seed and end date, and drives each scenario
+through the Django test client: a few warm-up requests, then `iterations`
+timed ones, with INFO logging off. Requests that write run inside a
+transaction that is rolled back, so every iteration sees the same data. Each scenario records
+p50/p95/p99 latency, queries per request and the peak memory allocated
+while serving one request (measured in a separate, shorter pass, as
+tracemalloc slows everything it traces).
+
+Runs are appended to BENCHMARK_DIR/history.jsonl; compare() checks one
+against the saved baseline.json.
+"""
+from contextlib import contextmanager
+from datetime import date
+from io import StringIO
+import json
+import logging
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+
+import django
+import numpy as np
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection, connections, transaction
+from django.test import Client
+from django.test.utils import setup_databases, setup_test_environment, teardown_databases, teardown_test_environment
+from django.utils import timezone
+
+# Fixed so every run benchmarks the same rows
+DATASET_SEED = 20240601
+DATASET_END = date(2026, 1, 1)
+DATASETS = {
+    'small': {'customers': 200, 'farmers': 100, 'orders': 2000, 'supplies': 1000, 'movements': 4000},
+    'medium': {'customers': 2000, 'farmers': 1000, 'orders': 50000, 'supplies': 20000, 'movements': 100000},
+    'large': {'customers': 20000, 'farmers': 10000, 'orders': 500000, 'supplies': 200000, 'movements': 1000000},
+}
+# Scenario fields compared against the baseline: (field, relative tolerance applies)
+COMPARED = [('p50_ms', True), ('p95_ms', True), ('queries', False), ('alloc_peak_kb', True)]
+
+
+class BenchmarkError(Exception):
+    """A scenario couldn't run as specified"""
+
+
+class Scenario:
+    """One endpoint call; path and payload are built from the seeded data by setup()"""
+
+    def __init__(self, name, method, expected_status, setup, writes=False):
+        self.name = name
+        self.method = method
+        self.expected_status = expected_status
+        # setup() -> (path, payload or None)
+        self.setup = setup
+        self.writes = writes
+
+
+def _pending_order():
+    from orders.models import Order
+
+    order = Order.objects.filter(order_status='PENDING').order_by('id').first()
+    if order is None:
+        raise BenchmarkError('The dataset has no pending order to approve.')
+    return f'/api/orders/{order.pk}/approve/', {}
+
+
+def _supply_payload():
+    from farmers.models import Farmer
+    from products.models import Product
+
+    farmer = Farmer.objects.filter(is_approved=True).order_by('id').first()
+    if farmer is None:
+        raise BenchmarkError('The dataset has no approved farmer.')
+    return f'/api/farmers/{farmer.pk}/record_supply/', {
+        'farmer': farmer.pk,
+        'product': Product.objects.order_by('id').first().pk,
+        'quantity_bags': 40,
+        'quantity_tons': '2.000',
+        'date_delivered': f'{DATASET_END}T10:00:00Z',
+        'cost_per_bag': '210.00',
+        'amount_paid': '0.00',
+    }
+
+
+SCENARIOS = [
+    Scenario('orders_list', 'get', 200, lambda: ('/api/orders/', None)),
+    Scenario('order_approve', 'patch', 200, _pending_order, writes=True),
+    Scenario('farmer_record_supply', 'post', 201, _supply_payload, writes=True),
+    Scenario('products_list', 'get', 200, lambda: ('/api/products/', None)),
+]
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+            capture_output=True, text=True, timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def seed_dataset(size):
+    """Fill the (test) database with the fixed dataset; returns the admin the scenarios run as"""
+    from django.contrib.auth import get_user_model
+
+    call_command(
+        'generate_load_data', seed=DATASET_SEED, end=DATASET_END, stdout=StringIO(), **DATASETS[size],
+    )
+    return get_user_model().objects.create_user(
+        username='bench_admin', password='bench_admin', user_type='ADMIN', mobile_number='+233200000098',
+    )
+
+
+def api_client(user):
+    """A test client that sends the user's JWT, so requests go through the real authentication"""
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    return Client(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(user).access_token}')
+
+
+@contextmanager
+def throwaway_database():
+    """Run the block against freshly created test databases, destroyed afterwards"""
+    # DEBUG off, as in production: the debug cursor's query log costs time per query
+    setup_test_environment(debug=False)
+    old_config = setup_databases(verbosity=0, interactive=False)
+    # Thousands of identical "order approved" lines help nobody; warnings still show
+    logging.disable(logging.INFO)
+    try:
+        yield
+    finally:
+        logging.disable(logging.NOTSET)
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
+        for alias in connections:
+            connections[alias].close()
+
+
+def _request(client, scenario, path, payload, queries):
+    """One call, rolled back if the scenario writes; returns the response"""
+    def count(execute, sql, params, many, context):
+        queries.append(1)
+        return execute(sql, params, many, context)
+
+    send = getattr(client, scenario.method)
+    with connection.execute_wrapper(count):
+        if not scenario.writes:
+            return send(path, payload) if payload is not None else send(path)
+        with transaction.atomic():
+            response = send(path, payload, content_type='application/json')
+            transaction.set_rollback(True)
+        return response
+
+
+def run_scenario(client, scenario, iterations, warmup=3, alloc_iterations=5):
+    path, payload = scenario.setup()
+    if scenario.writes and payload is not None:
+        payload = json.dumps(payload)
+
+    for _ in range(warmup):
+        response = _request(client, scenario, path, payload, [])
+        if response.status_code != scenario.expected_status:
+            raise BenchmarkError(
+                f'{scenario.name}: expected {scenario.expected_status}, got {response.status_code}: '
+                f'{response.content[:300]!r}'
+            )
+
+    timings, query_counts = [], []
+    for _ in range(iterations):
+        queries = []
+        started = time.perf_counter()
+        _request(client, scenario, path, payload, queries)
+        timings.append((time.perf_counter() - started) * 1000)
+        query_counts.append(len(queries))
+
+    peaks = []
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        for _ in range(alloc_iterations):
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            _request(client, scenario, path, payload, [])
+            peaks.append((tracemalloc.get_traced_memory()[1] - baseline) / 1024)
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    p50, p95, p99 = np.percentile(timings, [50, 95, 99])
+    return {
+        'p50_ms': round(float(p50), 3),
+        'p95_ms': round(float(p95), 3),
+        'p99_ms': round(float(p99), 3),
+        'mean_ms': round(float(np.mean(timings)), 3),
+        'min_ms': round(min(timings), 3),
+        'max_ms': round(max(timings), 3),
+        # Constant for a given dataset; max in case a cache miss adds some
+        'queries': max(query_counts),
+        'alloc_peak_kb': round(float(np.median(peaks)), 1) if peaks else None,
+    }
+
+
+def run_benchmarks(size='small', iterations=50, names=None, log=None):
+    """Benchmark the selected scenarios (default: all) on a fresh test database; returns the run record"""
+    log = log or (lambda message: None)
+    scenarios = [scenario for scenario in SCENARIOS if not names or scenario.name in names]
+    if not scenarios:
+        raise BenchmarkError(f"No such scenario. Use: {', '.join(scenario.name for scenario in SCENARIOS)}")
+
+    with throwaway_database():
+        started = time.perf_counter()
+        admin = seed_dataset(size)
+        log(f'Seeded the {size} dataset in {time.perf_counter() - started:.1f}s')
+        client = api_client(admin)
+        results = {}
+        for scenario in scenarios:
+            results[scenario.name] = run_scenario(client, scenario, iterations)
+            log(f'{scenario.name}: p50 {results[scenario.name]["p50_ms"]} ms, '
+                f'p95 {results[scenario.name]["p95_ms"]} ms, {results[scenario.name]["queries"]} queries')
+        vendor = connection.vendor
+
+    return {
+        'run_at': timezone.now().isoformat(),
+        'commit': _git_commit(),
+        'database': vendor,
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'dataset': size,
+        'iterations': iterations,
+        'results': results,
+    }
+
+
+def history_path():
+    return os.path.join(settings.BENCHMARK_DIR, 'history.jsonl')
+
+
+def baseline_path():
+    return os.path.join(settings.BENCHMARK_DIR, 'baseline.json')
+
+
+def append_history(run):
+    os.makedirs(settings.BENCHMARK_DIR, exist_ok=True)
+    with open(history_path(), 'a') as file:
+        file.write(json.dumps(run) + '\n')
+
+
+def load_history():
+    try:
+        with open(history_path()) as file:
+            return [json.loads(line) for line in file if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def save_baseline(run):
+    os.makedirs(settings.BENCHMARK_DIR, exist_ok=True)
+    with open(f'{baseline_path()}.tmp', 'w') as file:
+        json.dump(run, file, indent=1)
+    os.replace(f'{baseline_path()}.tmp', baseline_path())
+
+
+def load_baseline():
+    try:
+        with open(baseline_path()) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+def compare(run, baseline, tolerance, noise_ms=1.0):
+    """
+    Rows of (scenario, field, baseline, current, change, regressed). Timings
+    and allocations regress beyond `tolerance` (0.2 = 20% slower) and, for
+    timings, `noise_ms`; query counts regress on any increase.
+    """
+    rows = []
+    for name, current in run['results'].items():
+        previous = baseline['results'].get(name)
+        if previous is None:
+            continue
+        for field, relative in COMPARED:
+            old, new = previous.get(field), current.get(field)
+            if old is None or new is None:
+                continue
+            change = (new - old) / old if old else 0.0
+            if relative:
+                regressed = new > old * (1 + tolerance) and (not field.endswith('_ms') or new - old > noise_ms)
+            else:
+                regressed = new > old
+            rows.append((name, field, old, new, change, regressed))
+    return rows
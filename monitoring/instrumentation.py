@@ -0,0 +1,90 @@
+"""
+Per-request counters: database queries and time (through a connection
+execute_wrapper, so it works with DEBUG off) and time spent validating and
+serializing in DRF serializers. The counters for the current request live in
+a context variable; outside a request nothing is recorded.
+"""
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from functools import wraps
+import time
+
+from django.db import connections
+
+_current = ContextVar('request_metrics', default=None)
+
+
+class RequestMetrics:
+    """What one request spent, filled in while it runs"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.query_count = 0
+        self.query_seconds = 0.0
+        self.serializer_seconds = 0.0
+        # Nested serializer calls (a serializer reading another's .data) count once
+        self._serializer_depth = 0
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+
+def current_metrics():
+    return _current.get()
+
+
+def _count_query(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.query_count += 1
+        metrics.query_seconds += time.perf_counter() - started
+
+
+@contextmanager
+def collect_metrics():
+    """Record queries and serializer time for the enclosed block; yields the RequestMetrics"""
+    metrics = RequestMetrics()
+    token = _current.set(metrics)
+    try:
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(_count_query))
+            yield metrics
+    finally:
+        _current.reset(token)
+
+
+def _timed(function):
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        metrics = _current.get()
+        if metrics is None:
+            return function(*args, **kwargs)
+        metrics._serializer_depth += 1
+        started = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            metrics._serializer_depth -= 1
+            if not metrics._serializer_depth:
+                metrics.serializer_seconds += time.perf_counter() - started
+    wrapper._request_timed = True
+    return wrapper
+
+
+def instrument_serializers():
+    """Time is_valid() and .data on every DRF serializer (idempotent)"""
+    from rest_framework.serializers import BaseSerializer, ListSerializer
+
+    # Serializer.data and ListSerializer.data both go through BaseSerializer.data
+    if not getattr(BaseSerializer.data.fget, '_request_timed', False):
+        BaseSerializer.data = property(_timed(BaseSerializer.data.fget))
+    for cls in (BaseSerializer, ListSerializer):
+        if not getattr(cls.is_valid, '_request_timed', False):
+            cls.is_valid = _timed(cls.is_valid)
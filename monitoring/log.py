@@ -0,0 +1,53 @@
+"""
+Logging helpers: a JSON formatter and a handler that hands records to a
+background thread, so request threads never wait on file I/O.
+"""
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import json
+import logging
+import queue
+
+# LogRecord attributes that aren't `extra=` fields
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message and any `extra=` fields"""
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        entry.update({key: value for key, value in vars(record).items() if key not in _RECORD_ATTRS})
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class QueuedFileHandler(QueueHandler):
+    """
+    Formats records on the calling thread and appends them to `filename`
+    from a listener thread. Formatting here keeps the record's state as it
+    was when logged; the queue is unbounded, so logging never blocks.
+    """
+
+    def __init__(self, filename, encoding='utf-8'):
+        super().__init__(queue.SimpleQueue())
+        target = logging.FileHandler(filename, encoding=encoding, delay=True)
+        target.setFormatter(logging.Formatter('%(message)s'))
+        self.listener = QueueListener(self.queue, target)
+        self.listener.start()
+        atexit.register(self._stop_listener)
+
+    def _stop_listener(self):
+        # Writes out whatever is still queued
+        if self.listener._thread is not None:
+            self.listener.stop()
+
+    def close(self):
+        self._stop_listener()
+        super().close()
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+from monitoring.querycounts import SIZES, check_query_counts
+import json
+
+
+class Command(BaseCommand):
+    help = (
+        'Call every router-registered GET endpoint with 1, 10 and 50 related rows seeded and fail when the '
+        'query count depends on the data size (N+1 queries)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--route',
+            action='append',
+            help='Only check routes whose name (ViewSet.action) contains this (repeatable)',
+        )
+        parser.add_argument('--report', help='Also write the full results as JSON to this file')
+
+    def handle(self, *args, **kwargs):
+        results = check_query_counts(kwargs['route'], log=lambda message: self.stdout.write(f'  {message}'))
+        if not results:
+            raise CommandError('No routes match.')
+
+        sizes = ' / '.join(str(size) for size in SIZES)
+        self.stdout.write(f'\n{"route":<40} queries at {sizes} rows')
+        for result in results:
+            if result.skipped:
+                self.stdout.write(f'{result.route.name:<40} skipped: {result.skipped}')
+            elif result.failed:
+                self.stdout.write(self.style.ERROR(result.report()))
+            else:
+                self.stdout.write(result.report())
+
+        if kwargs['report']:
+            with open(kwargs['report'], 'w') as file:
+                json.dump([result.as_dict() for result in results], file, indent=1)
+            self.stdout.write(f'\nReport written to {kwargs["report"]}')
+
+        failed = [result.route.name for result in results if result.failed]
+        if failed:
+            raise CommandError(f'Query counts grow with the data in {len(failed)} route(s): {", ".join(failed)}')
+        checked = sum(1 for result in results if not result.skipped)
+        self.stdout.write(self.style.SUCCESS(f'✓ {checked} routes make the same number of queries at every size'))
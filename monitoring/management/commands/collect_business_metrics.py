@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from monitoring.metrics import collect_business_metrics
+
+
+class Command(BaseCommand):
+    help = 'Recompute the business gauges (stock, pending orders, farmer balances, task backlog) served at /metrics'
+
+    def handle(self, *args, **kwargs):
+        values = collect_business_metrics()
+        for product, bags in values['stock_bags'].items():
+            self.stdout.write(f'{product}: {bags} bags')
+        self.stdout.write(f'Pending orders: {values["pending_orders"]}')
+        self.stdout.write(f'Outstanding farmer balances: GHS {values["farmer_outstanding"]:,.2f}')
+        backlog = values['notification_backlog']
+        self.stdout.write(f'Task backlog: {backlog if backlog is not None else "broker unreachable"}')
+        self.stdout.write(self.style.SUCCESS('✓ Business metrics collected'))
@@ -0,0 +1,86 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from monitoring.benchmarks import (
+    DATASETS, SCENARIOS, BenchmarkError, append_history, compare, load_baseline, run_benchmarks, save_baseline,
+)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark key API endpoints on a seeded throwaway database and compare against the saved baseline'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=50, help='Timed requests per scenario (default: 50)')
+        parser.add_argument(
+            '--dataset',
+            choices=list(DATASETS),
+            default='small',
+            help='Size of the seeded dataset (default: small)',
+        )
+        parser.add_argument(
+            '--scenario',
+            action='append',
+            choices=[scenario.name for scenario in SCENARIOS],
+            help='Only run this scenario (repeatable; default: all)',
+        )
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=settings.BENCHMARK_TOLERANCE,
+            help='Allowed slowdown against the baseline, e.g. 0.2 for 20%% (default: BENCHMARK_TOLERANCE)',
+        )
+        parser.add_argument(
+            '--noise-ms',
+            type=float,
+            default=1.0,
+            help='Ignore latency changes smaller than this many milliseconds (default: 1.0)',
+        )
+        parser.add_argument('--save-baseline', action='store_true', help='Make this run the new baseline')
+        parser.add_argument('--no-history', action='store_true', help="Don't append this run to the history file")
+
+    def handle(self, *args, **kwargs):
+        if kwargs['iterations'] < 1:
+            raise CommandError('--iterations must be positive.')
+        try:
+            run = run_benchmarks(
+                size=kwargs['dataset'],
+                iterations=kwargs['iterations'],
+                names=kwargs['scenario'],
+                log=lambda message: self.stdout.write(f'  {message}'),
+            )
+        except BenchmarkError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(f'\n{"scenario":<22} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9} {"queries":>8} {"alloc KB":>9}')
+        for name, result in run['results'].items():
+            self.stdout.write(
+                f'{name:<22} {result["p50_ms"]:>9.2f} {result["p95_ms"]:>9.2f} {result["p99_ms"]:>9.2f} '
+                f'{result["queries"]:>8} {result["alloc_peak_kb"]:>9.1f}'
+            )
+        if not kwargs['no_history']:
+            append_history(run)
+
+        regressions = []
+        baseline = load_baseline()
+        if baseline is None:
+            if not kwargs['save_baseline']:
+                self.stdout.write('\nNo baseline saved yet; run with --save-baseline to create one.')
+        elif (baseline['dataset'], baseline['database']) != (run['dataset'], run['database']):
+            self.stdout.write(self.style.WARNING(
+                f'\nBaseline was taken on the {baseline["dataset"]} dataset with {baseline["database"]}; not comparing.'
+            ))
+        else:
+            self.stdout.write(f'\nAgainst baseline {baseline["run_at"]} ({baseline.get("commit") or "unknown commit"}):')
+            for name, field, old, new, change, regressed in compare(run, baseline, kwargs['tolerance'], kwargs['noise_ms']):
+                line = f'  {name:<22} {field:<14} {old:>10} -> {new:<10} {change:+.1%}'
+                if regressed:
+                    regressions.append(line)
+                    self.stdout.write(self.style.ERROR(line + '  REGRESSION'))
+                else:
+                    self.stdout.write(line)
+
+        if kwargs['save_baseline']:
+            save_baseline(run)
+            self.stdout.write(self.style.SUCCESS('✓ Saved as the new baseline'))
+        if regressions:
+            raise CommandError(f'{len(regressions)} regression(s) beyond {kwargs["tolerance"]:.0%} of the baseline.')
+        self.stdout.write(self.style.SUCCESS('✓ Benchmarks complete'))
@@ -0,0 +1,154 @@
+"""
+Prometheus metrics served at /metrics.
+
+Request latency and query count histograms are recorded by
+RequestMetricsMiddleware. With PROMETHEUS_MULTIPROC_DIR set (required when
+running several worker processes) prometheus_client keeps them in shared
+files and the view merges every process's values.
+
+Business gauges are not computed on scrape. collect_business_metrics()
+runs periodically (Celery beat, or the collect_business_metrics command),
+and writes the values to METRICS_GAUGE_FILE. Each scrape only reads that
+file, so any process, including a worker that never ran the collector,
+serves the same figures.
+"""
+import json
+import os
+import re
+import time
+
+from django.conf import settings
+from django.db.models import DecimalField, ExpressionWrapper, F, Sum
+from django.db.models.functions import Coalesce
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Histogram, generate_latest,
+)
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.multiprocess import MultiProcessCollector
+
+REQUEST_LATENCY = Histogram(
+    'maizepoint_http_request_duration_seconds',
+    'Time to produce a response, by route, method and status',
+    ['route', 'method', 'status'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUEST_QUERIES = Histogram(
+    'maizepoint_http_request_db_queries',
+    'Database queries made per request, by route and method',
+    ['route', 'method'],
+    buckets=(0, 1, 2, 5, 10, 25, 50, 100, 250),
+)
+
+_GROUP = re.compile(r'\(\?P<(\w+)>[^)]*\)')
+
+
+def route_label(match):
+    """'api/orders/{pk}/' from a resolved URL pattern; a fixed label for unmatched paths keeps cardinality bounded"""
+    if match is None:
+        return 'unmatched'
+    return _GROUP.sub(r'{\1}', match.route).replace('^', '').replace('$', '') or '/'
+
+
+def observe_request(route, method, status, seconds, queries):
+    REQUEST_LATENCY.labels(route, method, str(status)).observe(seconds)
+    REQUEST_QUERIES.labels(route, method).observe(queries)
+
+
+def _queue_lengths():
+    """Messages waiting in each broker queue that tasks (emails, notifications) go through"""
+    from maize_point.celery import app
+
+    lengths = {}
+    with app.connection_for_read() as connection:
+        channel = connection.default_channel
+        for queue in settings.METRICS_TASK_QUEUES:
+            try:
+                lengths[queue] = channel.queue_declare(queue=queue, passive=True).message_count
+            except Exception:
+                # Queue not declared yet: nothing has been sent through it
+                lengths[queue] = 0
+    return lengths
+
+
+def collect_business_metrics():
+    """Compute the business gauges and publish them to METRICS_GAUGE_FILE; returns the values"""
+    from farmers.models import FarmerSupply
+    from orders.models import Order
+    from products.models import Product
+
+    values = {
+        'stock_bags': dict(
+            Product.objects.annotate(bags=Coalesce(Sum('stock_items__quantity_bags'), 0))
+            .order_by('name').values_list('name', 'bags')
+        ),
+        'pending_orders': Order.objects.filter(order_status='PENDING').count(),
+        'farmer_outstanding': float(
+            FarmerSupply.objects.exclude(payment_status='PAID').aggregate(
+                outstanding=Sum(ExpressionWrapper(
+                    F('total_cost') - F('amount_paid'), output_field=DecimalField(max_digits=14, decimal_places=2)
+                ))
+            )['outstanding'] or 0
+        ),
+        'collected_at': time.time(),
+    }
+    try:
+        values['notification_backlog'] = _queue_lengths()
+    except Exception:
+        # Broker unreachable: leave the gauge out rather than report an empty queue
+        values['notification_backlog'] = None
+
+    path = settings.METRICS_GAUGE_FILE
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(f'{path}.tmp', 'w') as file:
+        json.dump(values, file)
+    os.replace(f'{path}.tmp', path)
+    return values
+
+
+class BusinessMetricsCollector:
+    """Serves the last collect_business_metrics() values on scrape"""
+
+    def collect(self):
+        try:
+            with open(settings.METRICS_GAUGE_FILE) as file:
+                values = json.load(file)
+        except (FileNotFoundError, ValueError):
+            return
+
+        stock = GaugeMetricFamily('maizepoint_stock_bags', 'Bags on hand per product', labels=['product'])
+        for product, bags in values['stock_bags'].items():
+            stock.add_metric([product], bags)
+        yield stock
+        yield GaugeMetricFamily('maizepoint_orders_pending', 'Orders awaiting processing', value=values['pending_orders'])
+        yield GaugeMetricFamily(
+            'maizepoint_farmer_outstanding_ghs', 'Unpaid balance owed to farmers for supplies',
+            value=values['farmer_outstanding'],
+        )
+        if values.get('notification_backlog') is not None:
+            backlog = GaugeMetricFamily(
+                'maizepoint_notification_backlog', 'Tasks (emails, notifications) waiting in the broker queue',
+                labels=['queue'],
+            )
+            for queue, length in values['notification_backlog'].items():
+                backlog.add_metric([queue], length)
+            yield backlog
+        yield GaugeMetricFamily(
+            'maizepoint_business_metrics_collected_timestamp_seconds', 'When the business gauges were last computed',
+            value=values['collected_at'],
+        )
+
+
+_business = BusinessMetricsCollector()
+REGISTRY.register(_business)
+
+
+def render_metrics():
+    """(body, content type) of the current metrics in the Prometheus text format"""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        # Merge every process's histogram files; a fresh registry per scrape, as prometheus_client requires
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+        registry.register(_business)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
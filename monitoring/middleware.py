@@ -0,0 +1,125 @@
+"""
+Per-request instrumentation: which view and action ran, how many queries
+it made and how long they took, serializer time, total latency and
+response size. Each request is logged as structured JSON on the
+`monitoring.requests` logger and counted in the /metrics histograms;
+requests over their query budget log a warning. Admins and staff (everyone
+with SERVER_TIMING, the default under DEBUG) get a Server-Timing header.
+
+Streaming responses (the CSV/XLSX exports) produce their body, and make most
+of their queries, after the middleware has returned. Their entries are
+marked `streaming` and carry only the setup cost measured before the first
+byte, as setup_ms / setup_queries; they stay out of the histograms.
+"""
+import logging
+
+from django.conf import settings
+
+from .instrumentation import collect_metrics
+from .metrics import observe_request, route_label
+
+logger = logging.getLogger('monitoring.requests')
+
+
+def endpoint_name(view_func, method):
+    """'OrderViewSet.list' for DRF viewsets, 'LoginView.post' for API views, the function name otherwise"""
+    cls = getattr(view_func, 'cls', None) or getattr(view_func, 'view_class', None)
+    if cls is None:
+        return f'{view_func.__module__}.{view_func.__name__}'
+    actions = getattr(view_func, 'actions', None) or {}
+    return f'{cls.__name__}.{actions.get(method, method)}'
+
+
+def query_budget(endpoint):
+    """Most queries `endpoint` may make before a warning; REQUEST_QUERY_BUDGETS entries may name a whole view class"""
+    budgets = settings.REQUEST_QUERY_BUDGETS
+    for key in (endpoint, endpoint.split('.')[0]):
+        if key in budgets:
+            return budgets[key]
+    return settings.REQUEST_QUERY_BUDGET
+
+
+def server_timing_allowed(request):
+    """Query counts and timings are internal: sent to everyone only with SERVER_TIMING, else to admins and staff"""
+    if settings.SERVER_TIMING:
+        return True
+    user = getattr(request, 'user', None)
+    return bool(user and user.is_authenticated and user.user_type in ('ADMIN', 'STAFF'))
+
+
+def response_size(response):
+    if response.has_header('Content-Length'):
+        return int(response['Content-Length'])
+    if response.streaming:
+        return None
+    return len(response.content)
+
+
+class RequestMetricsMiddleware:
+    """Records and logs the cost of every request; put it first in MIDDLEWARE so it covers the rest"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.REQUEST_METRICS_ENABLED:
+            return self.get_response(request)
+
+        with collect_metrics() as metrics:
+            request.metrics = metrics
+            response = self.get_response(request)
+        elapsed = metrics.elapsed
+
+        endpoint = getattr(request, 'endpoint', None)
+        match = getattr(request, 'resolver_match', None)
+        entry = {
+            'method': request.method,
+            'path': request.path,
+            'endpoint': endpoint,
+            'route': match.route if match else None,
+            'status': response.status_code,
+            'duration_ms': round(elapsed * 1000, 2),
+            'db_queries': metrics.query_count,
+            'db_ms': round(metrics.query_seconds * 1000, 2),
+            'serializer_ms': round(metrics.serializer_seconds * 1000, 2),
+            'response_bytes': response_size(response),
+            'user_id': getattr(getattr(request, 'user', None), 'pk', None),
+            'streaming': response.streaming,
+        }
+
+        if response.streaming:
+            entry['setup_ms'] = entry.pop('duration_ms')
+            entry['setup_queries'] = entry.pop('db_queries')
+            del entry['db_ms'], entry['serializer_ms']
+            logger.info(
+                f'{request.method} {request.path} {response.status_code} streaming '
+                f'(setup {entry["setup_ms"]}ms, {metrics.query_count} queries)',
+                extra=entry,
+            )
+            return response
+
+        level = logging.INFO
+        budget = query_budget(endpoint) if endpoint else None
+        if budget is not None and metrics.query_count > budget:
+            level = logging.WARNING
+            entry['query_budget'] = budget
+        logger.log(
+            level,
+            f'{request.method} {request.path} {response.status_code} '
+            f'{entry["duration_ms"]}ms {metrics.query_count} queries'
+            + (f' (budget {budget})' if level == logging.WARNING else ''),
+            extra=entry,
+        )
+
+        observe_request(route_label(match), request.method, response.status_code, elapsed, metrics.query_count)
+
+        if server_timing_allowed(request):
+            response['Server-Timing'] = ', '.join([
+                f'db;dur={entry["db_ms"]};desc="{metrics.query_count} queries"',
+                f'serializer;dur={entry["serializer_ms"]}',
+                f'total;dur={entry["duration_ms"]}',
+            ])
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.endpoint = endpoint_name(view_func, request.method.lower())
@@ -0,0 +1,196 @@
+"""
+On-demand profiling of single requests by admins.
+
+An admin sends `X-Profile: 1` (or `?profile=1`) and the request runs
+under cProfile and tracemalloc with every SQL query logged. Afterwards the
+slowest SELECTs are EXPLAINed and everything is written to PROFILE_DIR:
+`<id>.prof` (pstats, for snakeviz or `python -m pstats`) and `<id>.json`
+(request, timings, query log, query plans, top functions and allocations).
+The response carries `X-Profile-Id`. Other users' flags are ignored, so
+the profiler's overhead can't be triggered by anyone else.
+"""
+from contextlib import ExitStack
+import cProfile
+import io
+import json
+import os
+import pstats
+import time
+import tracemalloc
+import uuid
+
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+
+def profiling_requested(request):
+    flag = request.headers.get('X-Profile') or request.GET.get('profile')
+    return settings.PROFILING_ENABLED and flag not in (None, '', '0', 'false')
+
+
+def requesting_admin(request):
+    """The admin behind the request's credentials, or None; authenticates early with the API's own classes"""
+    drf_request = Request(request, authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES])
+    try:
+        user = drf_request.user
+    except APIException:
+        return None
+    if user.is_authenticated and user.user_type == 'ADMIN':
+        return user
+    return None
+
+
+def _log_query(queries):
+    def wrapper(execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            queries.append({
+                'alias': context['connection'].alias,
+                'sql': sql,
+                # Raw values so EXPLAIN binds them as the query did; json.dump stringifies the rest
+                'params': None if many else list(params or ()),
+                'ms': round((time.perf_counter() - started) * 1000, 3),
+            })
+    return wrapper
+
+
+def explain(query):
+    """Plan of a logged SELECT, as text lines"""
+    connection = connections[query['alias']]
+    with connection.cursor() as cursor:
+        cursor.execute(f'{connection.ops.explain_query_prefix()} {query["sql"]}', query['params'])
+        return [' '.join(str(column) for column in row) for row in cursor.fetchall()]
+
+
+def _top_functions(profile, limit):
+    stream = io.StringIO()
+    stats = pstats.Stats(profile, stream=stream)
+    stats.sort_stats('cumulative').print_stats(limit)
+    return stream.getvalue()
+
+
+def _top_allocations(before, after, limit):
+    return [
+        {'location': str(stat.traceback), 'size_kb': round(stat.size_diff / 1024, 1), 'count': stat.count_diff}
+        for stat in after.compare_to(before, 'lineno')[:limit]
+    ]
+
+
+def profile_request(request, get_response, user):
+    """Run get_response(request) under the profilers; saves the profile and returns the response"""
+    queries = []
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start(settings.PROFILING_TRACEMALLOC_FRAMES)
+    tracemalloc.reset_peak()
+    memory_before = tracemalloc.take_snapshot()
+    profile = cProfile.Profile()
+
+    started = time.perf_counter()
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(_log_query(queries)))
+        profile.enable()
+        try:
+            response = get_response(request)
+        finally:
+            profile.disable()
+    elapsed = time.perf_counter() - started
+
+    memory_after = tracemalloc.take_snapshot()
+    peak = tracemalloc.get_traced_memory()[1]
+    if started_tracing:
+        tracemalloc.stop()
+
+    slowest = sorted(
+        (query for query in queries if query['sql'].lstrip().upper().startswith('SELECT') and query['params'] is not None),
+        key=lambda query: query['ms'], reverse=True,
+    )[:settings.PROFILING_EXPLAIN_QUERIES]
+    plans = []
+    for query in slowest:
+        try:
+            plans.append({'sql': query['sql'], 'ms': query['ms'], 'plan': explain(query)})
+        except Exception as e:
+            plans.append({'sql': query['sql'], 'ms': query['ms'], 'error': str(e)})
+
+    profile_id = f'{timezone.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:11]}'
+    os.makedirs(settings.PROFILE_DIR, exist_ok=True)
+    profile.dump_stats(os.path.join(settings.PROFILE_DIR, f'{profile_id}.prof'))
+    match = getattr(request, 'resolver_match', None)
+    report = {
+        'id': profile_id,
+        'created_at': timezone.now().isoformat(),
+        'user': user.username,
+        'method': request.method,
+        'path': request.get_full_path(),
+        'endpoint': getattr(request, 'endpoint', None),
+        'route': match.route if match else None,
+        'status': response.status_code,
+        'duration_ms': round(elapsed * 1000, 2),
+        'query_count': len(queries),
+        'query_ms': round(sum(query['ms'] for query in queries), 2),
+        'memory_peak_kb': round(peak / 1024, 1),
+        'top_functions': _top_functions(profile, settings.PROFILING_TOP_FUNCTIONS),
+        'top_allocations': _top_allocations(memory_before, memory_after, settings.PROFILING_TOP_FUNCTIONS),
+        'explain': plans,
+        'queries': queries,
+    }
+    with open(os.path.join(settings.PROFILE_DIR, f'{profile_id}.json'), 'w') as file:
+        json.dump(report, file, indent=1, default=str)
+    prune_profiles()
+
+    response['X-Profile-Id'] = profile_id
+    return response
+
+
+def profile_ids():
+    """Stored profile ids, newest first"""
+    try:
+        names = os.listdir(settings.PROFILE_DIR)
+    except FileNotFoundError:
+        return []
+    return sorted((name[:-5] for name in names if name.endswith('.json')), reverse=True)
+
+
+def prune_profiles():
+    for profile_id in profile_ids()[settings.PROFILING_KEEP:]:
+        for extension in ('json', 'prof'):
+            try:
+                os.remove(os.path.join(settings.PROFILE_DIR, f'{profile_id}.{extension}'))
+            except FileNotFoundError:
+                pass
+
+
+def profile_path(profile_id, extension):
+    """Path of a stored profile file, or None; ids are checked against the directory listing, never joined raw"""
+    if profile_id not in profile_ids():
+        return None
+    return os.path.join(settings.PROFILE_DIR, f'{profile_id}.{extension}')
+
+
+def load_profile(profile_id):
+    path = profile_path(profile_id, 'json')
+    if path is None:
+        return None
+    with open(path) as file:
+        return json.load(file)
+
+
+class ProfilingMiddleware:
+    """Profiles requests flagged by an admin; put it first in MIDDLEWARE so the profile covers everything else"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if profiling_requested(request):
+            user = requesting_admin(request)
+            if user is not None:
+                return profile_request(request, self.get_response, user)
+        return self.get_response(request)
@@ -0,0 +1,344 @@
+"""
+Query-count regression checks for every router-registered GET endpoint.
+
+measure_query_counts() walks the URL resolver for DRF viewset routes (list,
+detail and custom actions), then, on a database flushed between sizes,
+seeds 1, 10 and 50 rows of every model and calls each route
+as an admin (customer-only actions as the first customer). Detail routes
+get the first ("hub") object, which owns every related row, so
+/farmers/<pk>/supply_history/ sees 1, 10 or 50 supplies. A route whose
+query count changes with the data size has an N+1 somewhere.
+
+Every query is attributed to the serializer field being rendered when it
+ran, by wrapping Serializer._readable_fields (the generator
+to_representation() loops over) for the duration of the check. The report
+for a failing route lists the fields whose query counts grew, e.g.
+FarmerSupplySerializer.farmer_name (farmer.full_name): 1 -> 10 -> 50.
+Queries outside any serializer field are counted under "(view)".
+
+check_query_counts() runs it on throwaway test databases for the management
+command; monitoring.tests runs it on the test suite's database.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+from decimal import Decimal
+import re
+from urllib.parse import urlencode
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection
+from django.urls import get_resolver
+from django.utils import timezone
+from rest_framework.serializers import Serializer
+
+from .benchmarks import api_client, throwaway_database
+
+SIZES = (1, 10, 50)
+OUTSIDE_SERIALIZERS = '(view)'
+
+# Actions that only answer customers; they run as the first customer, who placed every order
+CUSTOMER_ROUTES = {'CustomerViewSet.me', 'OrderViewSet.history'}
+# Query strings for actions that require one, built from the seeded data
+ROUTE_QUERIES = {
+    'PriceViewSet.quote': lambda: {'product': _hub('products.Product').pk, 'quantity_bags': 20},
+    'BlogPostViewSet.search': lambda: {'q': 'prices'},
+}
+
+_GROUP = re.compile(r'\(\?P<(\w+)>[^)]*\)')
+_field = ContextVar('serializer_field', default=None)
+
+
+def _hub(label):
+    return apps.get_model(label).objects.order_by('pk').first()
+
+
+class Route:
+    """A GET action of a registered viewset"""
+
+    def __init__(self, pattern, viewset, action):
+        self.pattern = pattern
+        self.viewset = viewset
+        self.action = action
+        self.kwargs = _GROUP.findall(pattern)
+
+    @property
+    def name(self):
+        return f'{self.viewset.__name__}.{self.action}'
+
+    def path(self):
+        """URL for the current data, or None when a URL argument can't be filled from a model"""
+        values = {}
+        for kwarg in self.kwargs:
+            queryset = getattr(self.viewset, 'queryset', None)
+            lookup = getattr(self.viewset, 'lookup_url_kwarg', None) or getattr(self.viewset, 'lookup_field', 'pk')
+            if queryset is None or kwarg != lookup:
+                return None
+            hub = queryset.model.objects.order_by('pk').first()
+            if hub is None:
+                return None
+            values[kwarg] = getattr(hub, getattr(self.viewset, 'lookup_field', 'pk'))
+        path = '/' + _GROUP.sub(lambda match: str(values[match.group(1)]), self.pattern).replace('^', '').replace('$', '')
+        if self.name in ROUTE_QUERIES:
+            path += '?' + urlencode(ROUTE_QUERIES[self.name]())
+        return path
+
+
+def _patterns(patterns, prefix=''):
+    for pattern in patterns:
+        if hasattr(pattern, 'url_patterns'):
+            yield from _patterns(pattern.url_patterns, prefix + str(pattern.pattern))
+        else:
+            yield prefix + str(pattern.pattern), pattern.callback
+
+
+def api_routes():
+    """Every GET action of every router-registered viewset, without the format-suffix duplicates"""
+    routes = []
+    for pattern, callback in _patterns(get_resolver().url_patterns):
+        actions = getattr(callback, 'actions', None)
+        if not actions or 'get' not in actions or '<format>' in pattern:
+            continue
+        routes.append(Route(pattern, callback.cls, actions['get']))
+    return routes
+
+
+def _field_label(serializer, field):
+    label = f'{type(serializer).__name__}.{field.field_name}'
+    if field.source not in (field.field_name, '*'):
+        label += f' ({field.source})'
+    return label
+
+
+@contextmanager
+def attribute_queries_to_fields():
+    """Make _field.get() name the serializer field being rendered; nested fields win"""
+    original = Serializer._readable_fields
+
+    def readable_fields(self):
+        for field in original.fget(self):
+            token = _field.set(_field_label(self, field))
+            try:
+                yield field
+            finally:
+                _field.reset(token)
+
+    Serializer._readable_fields = property(readable_fields)
+    try:
+        yield
+    finally:
+        Serializer._readable_fields = original
+
+
+def _get(client, path):
+    """(status, {field label: queries}) of one GET, streamed responses read to the end"""
+    counts = {}
+
+    def record(execute, sql, params, many, context):
+        label = _field.get() or OUTSIDE_SERIALIZERS
+        counts[label] = counts.get(label, 0) + 1
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(record):
+        response = client.get(path)
+        if response.streaming:
+            b''.join(response.streaming_content)
+    return response.status_code, counts
+
+
+def seed(n):
+    """n rows of every model, all related rows pointing at the first ("hub") objects; returns an admin"""
+    from customers.models import Customer, CustomerSegment
+    from farmers.models import Farmer, FarmerMergeSuggestion, FarmerSupply
+    from inventory.models import Stock, StockMovement
+    from orders.models import Order
+    from pricing.models import Price, PriceRule
+    from products.models import Product
+    from blog.models import BlogPost
+
+    User = get_user_model()
+    now = timezone.now()
+    admin = User.objects.create_user(
+        username='query_check_admin', password='query_check_admin', user_type='ADMIN', mobile_number='+233200000097',
+    )
+    products = [
+        Product.objects.create(name=f'Maize {i}', description='Query count check', packaging_sizes=['50kg bag'])
+        for i in range(n)
+    ]
+    prices = [
+        Price.objects.create(
+            product=product, price_per_bag=Decimal('250.00'), price_per_ton=Decimal('5000.00'),
+            packaging_size='50kg bag', updated_by=admin,
+        )
+        for product in products
+    ]
+    for i in range(n):
+        PriceRule.objects.create(
+            price=prices[0], label=f'Break {i}', min_quantity_bags=10 * (i + 1), price_per_bag=Decimal('240.00'),
+        )
+
+    customers = []
+    for i in range(n):
+        user = User.objects.create_user(
+            username=f'query_check_customer_{i}', password='query_check_customer', user_type='CUSTOMER',
+            first_name='Ama', last_name=f'Mensah {i}', mobile_number=f'+23324{i:07d}',
+        )
+        customer = Customer.objects.create(user=user, location='Accra')
+        CustomerSegment.objects.create(
+            customer=customer, segment='LOYAL', recency_days=3, frequency=5, monetary=Decimal('1000.00'), trend=0.1,
+            recency_score=4, frequency_score=4, monetary_score=4, computed_at=now,
+        )
+        customers.append(customer)
+
+    farmers = [
+        Farmer.objects.create(
+            full_name=f'Kofi Asante {i}', mobile_number=f'+23350{i:07d}', ghana_card_number=f'GHA-{i:09d}-0',
+            gps_latitude=Decimal('7.590000'), gps_longitude=Decimal('-1.940000'), region='Bono East',
+            district='Techiman', community='Tanoso', maize_types_supplied=[products[0].name],
+            is_approved=True, created_by=admin,
+        )
+        for i in range(n)
+    ]
+    for i, farmer in enumerate(farmers):
+        FarmerMergeSuggestion.objects.create(
+            farmer=farmers[0], duplicate=farmer, score=Decimal('0.900'), name_similarity=Decimal('0.950'),
+            distance_km=Decimal('1.000'), reviewed_by=admin if i % 2 else None,
+        )
+
+    lots = [
+        Stock.objects.create(
+            product=products[0], quantity_bags=100, quantity_tons=Decimal('5.000'), source_type='FARMER',
+            farmer=farmers[0], moisture_content=Decimal('13.50'), warehouse_location='Kumasi Central',
+            cost_price=Decimal('210.00'), date_received=now - timedelta(days=i),
+            expiry_alert_date=(now + timedelta(days=3)).date(),
+        )
+        for i in range(n)
+    ]
+    for i in range(n):
+        FarmerSupply.objects.create(
+            farmer=farmers[0], product=products[0], quantity_bags=100, quantity_tons=Decimal('5.000'),
+            date_delivered=now - timedelta(days=i), cost_per_bag=Decimal('210.00'), total_cost=Decimal('21000.00'),
+            stock=lots[0], recorded_by=admin,
+        )
+    orders = [
+        Order.objects.create(
+            customer=customers[0], product=products[0], quantity_bags=10, quantity_tons=Decimal('0.500'),
+            unit_price=Decimal('250.00'), total_price=Decimal('2500.00'), delivery_method='PICKUP',
+            payment_option='MOBILE_MONEY', order_status='PROCESSING', approved_by=admin, approved_at=now,
+        )
+        for _ in range(n)
+    ]
+    for _ in range(n):
+        StockMovement.objects.create(
+            stock=lots[0], movement_type='DEDUCTION', quantity_bags=10, quantity_tons=Decimal('0.500'),
+            order=orders[0], reason='Query count check', performed_by=admin,
+        )
+    for i in range(n):
+        BlogPost.objects.create(
+            title=f'Harvest update {i}', content='Prices are steady this week.', category='Market',
+            is_published=True, published_at=now - timedelta(days=i), author=admin,
+        )
+    return admin
+
+
+class RouteResult:
+    """Query counts of one route at each data size"""
+
+    def __init__(self, route):
+        self.route = route
+        self.statuses = []
+        self.totals = []
+        # field label -> queries at each size
+        self.fields = {}
+        self.skipped = None
+
+    def add(self, status, counts):
+        size_index = len(self.totals)
+        self.statuses.append(status)
+        self.totals.append(sum(counts.values()))
+        for label, count in counts.items():
+            self.fields.setdefault(label, [0] * len(SIZES))[size_index] = count
+
+    @property
+    def failed(self):
+        return self.skipped is None and len(set(self.totals)) > 1
+
+    def offending_fields(self):
+        """(label, counts per size) of the fields whose query count changes with the data size"""
+        return sorted(
+            ((label, counts) for label, counts in self.fields.items() if len(set(counts)) > 1),
+            key=lambda item: item[1][-1] - item[1][0], reverse=True,
+        )
+
+    def report(self):
+        """The route's counts at each size, then one line per offending field"""
+        lines = [f'{self.route.name:<40} {" / ".join(map(str, self.totals))}' + ('  N+1' if self.failed else '')]
+        for label, counts in self.offending_fields():
+            lines.append(f'    {label}: {" -> ".join(map(str, counts))}')
+        return '\n'.join(lines)
+
+    def as_dict(self):
+        return {
+            'route': self.route.name,
+            'pattern': self.route.pattern,
+            'skipped': self.skipped,
+            'statuses': self.statuses,
+            'queries': dict(zip(SIZES, self.totals)),
+            'failed': self.failed,
+            'offending_fields': {label: dict(zip(SIZES, counts)) for label, counts in self.offending_fields()},
+        }
+
+
+def _measure(clients, result):
+    client = clients['customer' if result.route.name in CUSTOMER_ROUTES else 'admin']
+    path = result.route.path()
+    if path is None:
+        result.skipped = 'URL arguments not backed by a model'
+        return
+    # The first call fills process-level caches (content types, lazy settings); the shared
+    # cache is cleared so cached endpoints do their full work when measured
+    client.get(path)
+    caches['default'].clear()
+    status, counts = _get(client, path)
+    if status >= 400:
+        result.skipped = f'status {status}'
+        return
+    result.add(status, counts)
+
+
+def measure_query_counts(names=None, log=None):
+    """
+    Query counts of every GET route (or those whose name contains one of names) at each size in SIZES,
+    measured on the current database, which is flushed before each size
+    """
+    log = log or (lambda message: None)
+    routes = [route for route in api_routes() if not names or any(name in route.name for name in names)]
+    results = [RouteResult(route) for route in routes]
+
+    from maize_point.celery import app
+
+    # Seeding commits, so on_commit hooks run: send their tasks inline (to the test mailbox) rather than to a broker
+    always_eager, app.conf.task_always_eager = app.conf.task_always_eager, True
+    try:
+        with attribute_queries_to_fields():
+            for size in SIZES:
+                # Committed rather than rolled back: some endpoints read through other connections
+                call_command('flush', interactive=False, verbosity=0)
+                caches['default'].clear()
+                clients = {'admin': api_client(seed(size)), 'customer': api_client(_hub('customers.Customer').user)}
+                for result in results:
+                    if not result.skipped:
+                        _measure(clients, result)
+                log(f'Measured {len(results)} routes with {size} rows each')
+    finally:
+        app.conf.task_always_eager = always_eager
+    return results
+
+
+def check_query_counts(names=None, log=None):
+    """measure_query_counts() on a throwaway test database"""
+    with throwaway_database():
+        return measure_query_counts(names, log)
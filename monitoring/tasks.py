@@ -0,0 +1,8 @@
+from celery import shared_task
+from .metrics import collect_business_metrics as collect
+
+
+@shared_task
+def collect_business_metrics():
+    """Periodic refresh of the business gauges served at /metrics (see CELERY_BEAT_SCHEDULE)"""
+    collect()
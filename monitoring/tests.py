@@ -0,0 +1,79 @@
+import logging
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from .benchmarks import api_client
+from .querycounts import measure_query_counts
+
+
+@override_settings(REQUEST_METRICS_ENABLED=True, SERVER_TIMING=False)
+class RequestMetricsMiddlewareTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.admin = get_user_model().objects.create_user(
+            username='admin', password='admin', user_type='ADMIN', mobile_number='+233200000001',
+        )
+
+    def test_server_timing_only_for_staff(self):
+        self.assertNotIn('Server-Timing', self.client.get('/api/products/'))
+        self.assertIn('db;dur=', api_client(self.admin).get('/api/products/')['Server-Timing'])
+
+    @override_settings(SERVER_TIMING=True)
+    def test_server_timing_for_everyone(self):
+        self.assertIn('Server-Timing', self.client.get('/api/products/'))
+
+    def test_streaming_response_logs_setup_cost_only(self):
+        with self.assertLogs('monitoring.requests', 'INFO') as logs:
+            response = api_client(self.admin).get('/api/orders/export/')
+            b''.join(response.streaming_content)
+        entry = logs.records[-1]
+        self.assertTrue(entry.streaming)
+        self.assertIsInstance(entry.setup_queries, int)
+        self.assertFalse(hasattr(entry, 'db_queries'))
+        self.assertNotIn('Server-Timing', response)
+
+
+@override_settings(DEBUG=False, METRICS_TOKEN='', METRICS_ALLOWED_IPS=[])
+class MetricsEndpointTests(TestCase):
+
+    def test_closed_without_token(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+
+    @override_settings(METRICS_ALLOWED_IPS=['10.0.0.5'])
+    def test_allowed_ip(self):
+        self.assertEqual(self.client.get('/metrics', REMOTE_ADDR='10.0.0.5').status_code, 200)
+        self.assertEqual(self.client.get('/metrics', REMOTE_ADDR='10.0.0.6').status_code, 403)
+
+    @override_settings(METRICS_TOKEN='scrape-token')
+    def test_token(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 401)
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer scrape-token')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'maizepoint_http_request_duration_seconds', response.content)
+
+
+class RouteQueryCountTests(TransactionTestCase):
+    """No router-registered GET endpoint makes more queries as the data grows"""
+
+    def setUp(self):
+        cache.clear()
+        # Seeding 50 rows of everything logs thousands of INFO lines; warnings still show
+        logging.disable(logging.INFO)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    def test_query_counts_do_not_grow_with_the_data(self):
+        results = measure_query_counts()
+        self.assertTrue(results)
+        failed = [result.report() for result in results if result.failed]
+        if failed:
+            self.fail('Query counts grow with the data (N+1):\n' + '\n'.join(failed))
+        # A route answering with an error is skipped, which would hide an N+1
+        errors = [
+            f'{result.route.name}: {result.skipped}'
+            for result in results if (result.skipped or '').startswith('status')
+        ]
+        if errors:
+            self.fail('Routes answered with an error:\n' + '\n'.join(errors))
@@ -0,0 +1,12 @@
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+from .views import ProfileViewSet
+
+router = DefaultRouter()
+router.register(r'profiles', ProfileViewSet, basename='profile')
+
+app_name = 'monitoring'
+
+urlpatterns = [
+    path('', include(router.urls)),
+]
@@ -0,0 +1,68 @@
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.utils.crypto import constant_time_compare
+from rest_framework import viewsets, permissions, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from .metrics import render_metrics
+from .profiling import load_profile, profile_ids, profile_path
+
+PROFILE_SUMMARY_FIELDS = [
+    'id', 'created_at', 'user', 'method', 'path', 'endpoint', 'status',
+    'duration_ms', 'query_count', 'query_ms', 'memory_peak_kb',
+]
+
+
+class IsAdmin(permissions.BasePermission):
+    """Only admins can access"""
+    
+    def has_permission(self, request, view):
+        return request.user.is_authenticated and request.user.user_type == 'ADMIN'
+
+
+def metrics(request):
+    """
+    Prometheus scrape endpoint. The gauges are business figures, so it fails
+    closed: `Authorization: Bearer <METRICS_TOKEN>` when a token is set,
+    otherwise only under DEBUG or from METRICS_ALLOWED_IPS.
+    """
+    if settings.METRICS_TOKEN:
+        header = request.headers.get('Authorization', '')
+        if not constant_time_compare(header, f'Bearer {settings.METRICS_TOKEN}'):
+            return HttpResponse('Unauthorized\n', status=401, content_type='text/plain')
+    elif not settings.DEBUG and request.META.get('REMOTE_ADDR') not in settings.METRICS_ALLOWED_IPS:
+        return HttpResponse('Forbidden: set METRICS_TOKEN\n', status=403, content_type='text/plain')
+    body, content_type = render_metrics()
+    return HttpResponse(body, content_type=content_type)
+
+
+class ProfileViewSet(viewsets.ViewSet):
+    """Request profiles recorded with `X-Profile: 1`, newest first"""
+    permission_classes = [IsAdmin]
+    lookup_value_regex = r'[0-9a-f-]+'
+    
+    def list(self, request):
+        profiles = []
+        for profile_id in profile_ids():
+            profile = load_profile(profile_id)
+            if profile is not None:
+                profiles.append({field: profile.get(field) for field in PROFILE_SUMMARY_FIELDS})
+        return Response(profiles)
+    
+    def retrieve(self, request, pk=None):
+        """Full profile: top functions and allocations, EXPLAIN of the slowest queries and the query log"""
+        profile = load_profile(pk)
+        if profile is None:
+            return Response({'error': 'Profile not found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(profile)
+    
+    @action(detail=True, methods=['get'])
+    def download(self, request, pk=None):
+        """The raw cProfile stats (?file=prof, default) or the JSON report (?file=json)"""
+        extension = request.query_params.get('file', 'prof')
+        if extension not in ('prof', 'json'):
+            return Response({'error': 'file must be prof or json'}, status=status.HTTP_400_BAD_REQUEST)
+        path = profile_path(pk, extension)
+        if path is None:
+            return Response({'error': 'Profile not found'}, status=status.HTTP_404_NOT_FOUND)
+        return FileResponse(open(path, 'rb'), as_attachment=True, filename=f'{pk}.{extension}')
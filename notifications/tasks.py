@@ -0,0 +1,57 @@
+from celery import shared_task
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import send_mail
+import logging
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def send_welcome_email(self, user_id):
+    """Send the welcome email to a newly registered customer"""
+    try:
+        user = User.objects.get(pk=user_id)
+    except User.DoesNotExist:
+        logger.warning(f"Welcome email skipped: user {user_id} no longer exists")
+        return
+
+    subject = 'Welcome to Maize Supply & Storage Enterprise'
+    message = f"""
+    Dear {user.full_name},
+    
+    Welcome to Maize Supply & Storage Enterprise!
+    
+    Your account has been successfully created. You can now place orders and manage your profile.
+    
+    Username: {user.username}
+    Email: {user.email}
+    
+    If you have any questions, please don't hesitate to contact us.
+    
+    Best regards,
+    Maize Supply & Storage Team
+    """
+
+    try:
+        send_mail(
+            subject,
+            message,
+            settings.DEFAULT_FROM_EMAIL,
+            [user.email],
+            fail_silently=False,
+        )
+        logger.info(f"Registration email sent to {user.email}")
+    except Exception as exc:
+        logger.error(f"Failed to send registration email to {user.email}: {str(exc)}")
+        raise self.retry(exc=exc)
+
+
+def queue_welcome_email(user_id):
+    """Hand the welcome email to the task queue without failing the caller"""
+    try:
+        send_welcome_email.delay(user_id)
+    except Exception as e:
+        logger.error(f"Failed to queue welcome email for user {user_id}: {str(e)}")
@@ -0,0 +1,37 @@
+from .models import Order
+
+# (header, values_list lookup)
+ORDER_EXPORT_COLUMNS = [
+    ('order_id', 'order_id'),
+    ('created_at', 'created_at'),
+    ('customer_id', 'customer__customer_id'),
+    ('customer_first_name', 'customer__user__first_name'),
+    ('customer_last_name', 'customer__user__last_name'),
+    ('product', 'product__name'),
+    ('quantity_bags', 'quantity_bags'),
+    ('quantity_tons', 'quantity_tons'),
+    ('unit_price', 'unit_price'),
+    ('total_price', 'total_price'),
+    ('delivery_method', 'delivery_method'),
+    ('delivery_date', 'delivery_date'),
+    ('payment_option', 'payment_option'),
+    ('order_status', 'order_status'),
+    ('approved_at', 'approved_at'),
+]
+
+
+# query parameter: lookup, matching the list endpoint's filterset_fields
+ORDER_EXPORT_FILTERS = {
+    'order_status': 'order_status',
+    'payment_option': 'payment_option',
+    'delivery_method': 'delivery_method',
+    'product': 'product',
+}
+
+
+def order_export_queryset(params=None):
+    orders = Order.objects.order_by('-created_at')
+    for name, lookup in ORDER_EXPORT_FILTERS.items():
+        if params and params.get(name):
+            orders = orders.filter(**{lookup: params[name]})
+    return orders
@@ -0,0 +1,78 @@
+from django.core.management.base import BaseCommand, CommandError
+from farmers.exports import SUPPLY_EXPORT_COLUMNS, supply_export_queryset
+from inventory.exports import MOVEMENT_EXPORT_COLUMNS, movement_export_queryset
+from maize_point.exports import export_rows, iter_csv, write_xlsx
+from orders.exports import ORDER_EXPORT_COLUMNS, order_export_queryset
+import os
+import resource
+import tempfile
+import time
+
+SOURCES = {
+    'orders': (ORDER_EXPORT_COLUMNS, order_export_queryset),
+    'supplies': (SUPPLY_EXPORT_COLUMNS, supply_export_queryset),
+    'movements': (MOVEMENT_EXPORT_COLUMNS, movement_export_queryset),
+}
+
+
+def rss_mb():
+    """Current resident set size; falls back to the peak where /proc is unavailable"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class Command(BaseCommand):
+    help = 'Stream a full export and sample memory use, to check it stays flat as rows grow'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--source', choices=list(SOURCES), default='orders', help='Table to export (default: orders)')
+        parser.add_argument('--format', choices=['csv', 'xlsx'], default='csv', help='File format (default: csv)')
+        parser.add_argument(
+            '--sample-every',
+            type=int,
+            default=100000,
+            help='Rows between memory samples (default: 100000)',
+        )
+
+    def handle(self, *args, **kwargs):
+        columns, get_queryset = SOURCES[kwargs['source']]
+        queryset = get_queryset()
+        total = queryset.count()
+        if not total:
+            raise CommandError(f'No {kwargs["source"]} to export.')
+        every = max(kwargs['sample_every'], 1)
+        self.stdout.write(f'Exporting {total} {kwargs["source"]} as {kwargs["format"]}\n')
+        self.stdout.write(f'{"rows":>10} {"seconds":>8} {"RSS MB":>8}')
+
+        samples = []
+        started = time.perf_counter()
+
+        def sampled(rows):
+            for count, row in enumerate(rows, 1):
+                if count % every == 0:
+                    samples.append(rss_mb())
+                    self.stdout.write(f'{count:>10} {time.perf_counter() - started:>8.1f} {samples[-1]:>8.1f}')
+                yield row
+
+        baseline = rss_mb()
+        rows = sampled(export_rows(queryset, columns))
+        with tempfile.TemporaryFile(mode='w+b') as file:
+            if kwargs['format'] == 'xlsx':
+                write_xlsx(file, columns, rows)
+            else:
+                for line in iter_csv(columns, rows):
+                    file.write(line.encode())
+            size = file.tell()
+        elapsed = time.perf_counter() - started
+        samples.append(rss_mb())
+
+        self.stdout.write(f'\nBaseline RSS: {baseline:.1f} MB')
+        self.stdout.write(f'Final RSS:    {samples[-1]:.1f} MB')
+        self.stdout.write(f'Output:       {size / 2**20:.1f} MB in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s)')
+        growth = max(samples) - (samples[0] if len(samples) > 1 else baseline)
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ RSS grew {growth:.1f} MB between the first and highest sample'
+        ))
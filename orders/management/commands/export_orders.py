@@ -0,0 +1,12 @@
+from maize_point.exports import ExportCommand
+from orders.exports import ORDER_EXPORT_COLUMNS, ORDER_EXPORT_FILTERS, order_export_queryset
+
+
+class Command(ExportCommand):
+    help = 'Export orders to CSV or XLSX, streamed in chunks'
+    columns = ORDER_EXPORT_COLUMNS
+    filters = ORDER_EXPORT_FILTERS
+    title = 'Orders'
+
+    def get_queryset(self, params):
+        return order_export_queryset(params)
@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from django.core.validators import MinValueValidator
 from customers.models import Customer
@@ -61,6 +61,8 @@ class Order(models.Model):
             models.Index(fields=['customer', 'order_status']),
             models.Index(fields=['order_status']),
             models.Index(fields=['created_at']),
+            # Report rollups look up rows changed since their last refresh
+            models.Index(fields=['updated_at']),
         ]
     
     def save(self, *args, **kwargs):
@@ -72,7 +74,19 @@ class Order(models.Model):
         if self.unit_price and self.quantity_bags:
             self.total_price = self.unit_price * self.quantity_bags
         
-        super().save(*args, **kwargs)
+        if self._state.adding:
+            self._stored_values = None
+            super().save(*args, **kwargs)
+            return
+        
+        using = kwargs.get('using') or self._state.db
+        with transaction.atomic(using=using):
+            # Read the stored status and total under a row lock, so concurrent saves of the same order
+            # queue up and the counter signal applies each transition once, whatever this instance loaded
+            self._stored_values = Order.objects.using(using).select_for_update().filter(pk=self.pk).values_list(
+                'order_status', 'total_price'
+            ).first()
+            super().save(*args, **kwargs)
     
     def __str__(self):
         return f"{self.order_id} - {self.customer.user.full_name} - {self.product.name}"
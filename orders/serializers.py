@@ -2,6 +2,7 @@ from rest_framework import serializers
 from .models import Order
 from customers.serializers import CustomerSerializer
 from products.serializers import ProductSerializer
+from pricing.engine import quote, customer_tier_for, QuoteError
 
 
 class OrderSerializer(serializers.ModelSerializer):
@@ -30,11 +31,13 @@ class OrderSerializer(serializers.ModelSerializer):
 
 class OrderCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating orders (customers)"""
+    packaging_size = serializers.CharField(write_only=True, required=False)
     
     class Meta:
         model = Order
-        fields = ['product', 'quantity_bags', 'quantity_tons', 'unit_price',
+        fields = ['product', 'packaging_size', 'quantity_bags', 'quantity_tons', 'unit_price',
                   'delivery_method', 'delivery_address', 'payment_option', 'customer_notes']
+        extra_kwargs = {'unit_price': {'required': False}}
     
     def validate(self, attrs):
         # Check if product is available
@@ -47,6 +50,21 @@ class OrderCreateSerializer(serializers.ModelSerializer):
         if not current_price:
             raise serializers.ValidationError({"product": "No price set for this product."})
         
+        # Quote from the price table unless a negotiated unit price was given
+        packaging_size = attrs.pop('packaging_size', None)
+        if attrs.get('unit_price') is None:
+            request = self.context.get('request')
+            try:
+                result = quote(
+                    product.id,
+                    attrs['quantity_bags'],
+                    packaging_size=packaging_size,
+                    customer_tier=customer_tier_for(request.user if request else None),
+                )
+            except QuoteError as e:
+                raise serializers.ValidationError({"unit_price": str(e)})
+            attrs['unit_price'] = result.unit_price
+        
         return attrs
 
 
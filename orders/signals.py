@@ -1,7 +1,10 @@
-from django.db.models.signals import post_save
+from django.db.models import F, Max, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.core.mail import send_mail
 from django.conf import settings
+from customers.models import Customer
 from .models import Order
 import logging
 
@@ -77,3 +80,51 @@ def send_order_notification(sender, instance, created, **kwargs):
     
     except Exception as e:
         logger.error(f"Failed to send order notification for {instance.order_id}: {str(e)}")
+
+
+def _delivered_total(status, total_price):
+    return (total_price or 0) if status == 'DELIVERED' else 0
+
+
+@receiver(post_save, sender=Order)
+def update_customer_order_counters(sender, instance, created, raw=False, **kwargs):
+    """Keep Customer.order_count, delivered_revenue and last_order_at current"""
+    if raw:
+        return
+    
+    updates = {}
+    if created:
+        updates['order_count'] = F('order_count') + 1
+        updates['last_order_at'] = Greatest(
+            Coalesce(F('last_order_at'), Value(instance.created_at)),
+            Value(instance.created_at)
+        )
+        previous = 0
+    else:
+        # Stored values read under a row lock by Order.save()
+        stored = getattr(instance, '_stored_values', None)
+        previous = _delivered_total(*stored) if stored else 0
+    
+    revenue_delta = _delivered_total(instance.order_status, instance.total_price) - previous
+    if revenue_delta:
+        updates['delivered_revenue'] = F('delivered_revenue') + revenue_delta
+    
+    if updates:
+        Customer.objects.filter(pk=instance.customer_id).update(**updates)
+
+
+@receiver(post_delete, sender=Order)
+def decrement_customer_order_counters(sender, instance, **kwargs):
+    """Remove a deleted order from its customer's counters"""
+    updates = {
+        'order_count': F('order_count') - 1,
+        # The row is already gone, so this is the latest of the remaining orders (NULL if none are left)
+        'last_order_at': Subquery(
+            Order.objects.filter(customer=OuterRef('pk')).order_by().values('customer')
+            .annotate(latest=Max('created_at')).values('latest')
+        ),
+    }
+    revenue = _delivered_total(instance.order_status, instance.total_price)
+    if revenue:
+        updates['delivered_revenue'] = F('delivered_revenue') - revenue
+    Customer.objects.filter(pk=instance.customer_id, order_count__gt=0).update(**updates)
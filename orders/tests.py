@@ -0,0 +1,122 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from customers.models import Customer
+from inventory.models import Stock, StockMovement
+from monitoring.benchmarks import api_client
+from products.models import Product
+from .models import Order
+
+
+class OrderTestData:
+    """A customer, a product and an order factory"""
+
+    def setUp(self):
+        user = get_user_model().objects.create_user(
+            username='ama', password='ama-password', user_type='CUSTOMER', mobile_number='+233241000001',
+        )
+        self.customer = Customer.objects.create(user=user, location='Accra')
+        self.product = Product.objects.create(name='Yellow Maize', description='Test', packaging_sizes=['50kg bag'])
+
+    def create_order(self, **kwargs):
+        fields = {
+            'customer': self.customer, 'product': self.product, 'quantity_bags': 10,
+            'quantity_tons': Decimal('0.500'), 'unit_price': Decimal('250.00'), 'delivery_method': 'PICKUP',
+            'payment_option': 'MOBILE_MONEY', 'order_status': 'PENDING',
+        }
+        fields.update(kwargs)
+        return Order.objects.create(**fields)
+
+
+class CustomerOrderCounterTests(OrderTestData, TestCase):
+
+    def delivered_revenue(self):
+        return Customer.objects.get(pk=self.customer.pk).delivered_revenue
+
+    def test_stale_instances_count_a_delivery_once(self):
+        order = self.create_order(order_status='PROCESSING')
+        # Two requests load the order before either saves it
+        first, second = Order.objects.get(pk=order.pk), Order.objects.get(pk=order.pk)
+        for instance in (first, second):
+            instance.order_status = 'DELIVERED'
+            instance.save()
+        self.assertEqual(self.delivered_revenue(), Decimal('2500.00'))
+
+    def test_deferred_status_counts_a_delivery_once(self):
+        order = self.create_order(order_status='DELIVERED')
+        self.assertEqual(self.delivered_revenue(), Decimal('2500.00'))
+        order = Order.objects.defer('order_status').get(pk=order.pk)
+        order.order_status = 'DELIVERED'
+        order.save()
+        self.assertEqual(self.delivered_revenue(), Decimal('2500.00'))
+
+    def test_undelivering_removes_the_revenue(self):
+        order = self.create_order(order_status='DELIVERED')
+        order.order_status = 'CANCELLED'
+        order.save()
+        self.assertEqual(self.delivered_revenue(), Decimal('0.00'))
+        customer = Customer.objects.get(pk=self.customer.pk)
+        self.assertEqual(customer.order_count, 1)
+
+    def test_deleting_the_latest_order_moves_last_order_at_back(self):
+        earlier = self.create_order()
+        Order.objects.filter(pk=earlier.pk).update(created_at=timezone.now() - timedelta(days=3))
+        earlier.refresh_from_db()
+        latest = self.create_order(order_status='DELIVERED')
+        latest.delete()
+        customer = Customer.objects.get(pk=self.customer.pk)
+        self.assertEqual(customer.last_order_at, earlier.created_at)
+        self.assertEqual((customer.order_count, customer.delivered_revenue), (1, Decimal('0.00')))
+        earlier.delete()
+        self.assertIsNone(Customer.objects.get(pk=self.customer.pk).last_order_at)
+
+
+class OrderApprovalTests(OrderTestData, TestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.admin = get_user_model().objects.create_user(
+            username='admin', password='admin', user_type='ADMIN', mobile_number='+233200000001',
+        )
+
+    def add_lots(self, *bags):
+        received = timezone.now() - timedelta(days=len(bags))
+        lots = []
+        for count in bags:
+            lots.append(Stock.objects.create(
+                product=self.product, quantity_bags=count, quantity_tons=Decimal('0.050') * count,
+                source_type='FARMER', moisture_content=Decimal('13.50'), warehouse_location='Kumasi Central',
+                cost_price=Decimal('210.00'), date_received=received,
+            ))
+            received += timedelta(days=1)
+        return lots
+
+    def approve(self, order):
+        response = api_client(self.admin).patch(f'/api/orders/{order.pk}/approve/')
+        self.assertEqual(response.status_code, 200)
+
+    def deducted_tons(self, order):
+        movements = StockMovement.objects.filter(order=order, movement_type='DEDUCTION').order_by('stock__date_received')
+        return [movement.quantity_tons for movement in movements]
+
+    def test_deducts_tons_across_two_lots(self):
+        older, newer = self.add_lots(6, 10)
+        order = self.create_order()
+        self.approve(order)
+        self.assertEqual(self.deducted_tons(order), [Decimal('0.300'), Decimal('0.200')])
+        older.refresh_from_db()
+        newer.refresh_from_db()
+        self.assertEqual((older.quantity_bags, older.quantity_tons), (0, Decimal('0.000')))
+        self.assertEqual((newer.quantity_bags, newer.quantity_tons), (6, Decimal('0.300')))
+
+    def test_lot_shares_add_up_to_the_order(self):
+        self.add_lots(1, 1, 1)
+        order = self.create_order(quantity_bags=3, quantity_tons=Decimal('1.000'))
+        self.approve(order)
+        self.assertEqual(self.deducted_tons(order), [Decimal('0.333'), Decimal('0.333'), Decimal('0.334')])
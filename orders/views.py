@@ -1,17 +1,24 @@
+from decimal import Decimal
+
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django.utils import timezone
-from django.db.models import Sum, Q
+from django.db.models import Sum, Q, Prefetch
+from maize_point.exports import ExportError, export_response, filter_date_range
+from .exports import ORDER_EXPORT_COLUMNS
 from .models import Order
+from products.models import Product
 from .serializers import OrderSerializer, OrderCreateSerializer, OrderStatusUpdateSerializer
 from inventory.models import Stock, StockMovement
 import logging
 
 logger = logging.getLogger(__name__)
 
+TONS = Decimal('0.001')
+
 
 class IsAdminOrStaffOrOwner(permissions.BasePermission):
     """Admin/staff see all, customers see only their own"""
@@ -28,8 +35,11 @@ class IsAdminOrStaffOrOwner(permissions.BasePermission):
 class OrderViewSet(viewsets.ModelViewSet):
     """ViewSet for Order model"""
     queryset = Order.objects.select_related(
-        'customer__user', 'product', 'approved_by'
-    ).all()
+        'customer__user', 'approved_by'
+    ).prefetch_related(
+        # product_details renders stock and price; the catalog annotations spare a query per order
+        Prefetch('product', queryset=Product.objects.with_catalog_data())
+    )
     permission_classes = [IsAdminOrStaffOrOwner]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ['order_status', 'payment_option', 'delivery_method', 'product']
@@ -90,7 +100,11 @@ class OrderViewSet(viewsets.ModelViewSet):
                 break
             
             deduct_bags = min(stock.quantity_bags, remaining_to_deduct)
-            deduct_tons = (deduct_bags / order.quantity_bags) * order.quantity_tons
+            if deduct_bags == remaining_to_deduct:
+                # The last lot takes what is left so the lots add up to the order's tons
+                deduct_tons = remaining_tons
+            else:
+                deduct_tons = (order.quantity_tons * deduct_bags / order.quantity_bags).quantize(TONS)
             
             stock.quantity_bags -= deduct_bags
             stock.quantity_tons -= deduct_tons
@@ -175,3 +189,12 @@ class OrderViewSet(viewsets.ModelViewSet):
             serializer = self.get_serializer(orders, many=True)
             return Response(serializer.data)
         return Response({'error': 'Customer profile not found.'}, status=status.HTTP_404_NOT_FOUND)
+    
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """Stream the filtered orders as CSV or XLSX (?file_type=xlsx, ?start=&end=)"""
+        try:
+            orders = filter_date_range(self.filter_queryset(self.get_queryset()), 'created_at', request.query_params)
+            return export_response(orders, ORDER_EXPORT_COLUMNS, 'orders', request.query_params.get('file_type', 'csv'))
+        except ExportError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
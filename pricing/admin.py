@@ -1,5 +1,11 @@
 from django.contrib import admin
-from .models import Price
+from .models import Price, PriceRule
+
+
+class PriceRuleInline(admin.TabularInline):
+    model = PriceRule
+    extra = 0
+    fields = ['label', 'min_quantity_bags', 'customer_tier', 'price_per_bag', 'starts_at', 'ends_at']
 
 
 @admin.register(Price)
@@ -10,6 +16,7 @@ class PriceAdmin(admin.ModelAdmin):
     search_fields = ['product__name', 'packaging_size']
     readonly_fields = ['effective_date']
     ordering = ['-effective_date']
+    inlines = [PriceRuleInline]
     
     fieldsets = (
         ('Product Information', {
@@ -22,3 +29,13 @@ class PriceAdmin(admin.ModelAdmin):
             'fields': ('market_notes', 'updated_by', 'effective_date')
         }),
     )
+
+
+@admin.register(PriceRule)
+class PriceRuleAdmin(admin.ModelAdmin):
+    list_display = ['price', 'label', 'min_quantity_bags', 'customer_tier', 'price_per_bag',
+                    'starts_at', 'ends_at']
+    list_filter = ['customer_tier', 'price__product', 'starts_at', 'ends_at']
+    search_fields = ['label', 'price__product__name', 'price__packaging_size']
+    readonly_fields = ['created_at', 'updated_at']
+    ordering = ['price', 'customer_tier', 'min_quantity_bags']
@@ -0,0 +1,172 @@
+"""
+Precomputed price tables for quoting orders.
+
+Current prices and their rules (quantity breaks, customer tiers and
+time-bounded promotions) are compiled into one lookup table per
+(product, packaging size, customer tier). Each table is a sorted list of
+bag-count breakpoints with the best unit price from that break upwards, so
+quoting is a bisect over the breakpoints instead of rule evaluation.
+
+The compiled table lives in process memory. It is dropped whenever a Price or
+PriceRule is saved or deleted, when the next promotion starts or ends, and
+after PRICE_TABLE_TTL seconds so other worker processes pick up changes.
+"""
+from bisect import bisect_right
+from collections import namedtuple
+from datetime import timedelta
+import threading
+
+from django.conf import settings
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from customers.models import Customer
+from .models import Price, PriceRule
+
+DEFAULT_TIER = 'STANDARD'
+TIERS = [code for code, _ in Customer.PRICING_TIER_CHOICES]
+
+Quote = namedtuple('Quote', [
+    'price_id', 'product_id', 'packaging_size', 'customer_tier',
+    'quantity_bags', 'unit_price', 'total_price', 'rule_label',
+])
+
+
+class QuoteError(Exception):
+    """Raised when no price can be quoted for the requested product"""
+
+
+class PriceTable:
+    """Compiled break tables keyed by (product_id, packaging_size, tier)"""
+
+    def __init__(self, entries, packaging_sizes, compiled_at, valid_until):
+        # entries: key -> (breaks, unit_prices, labels, price_id)
+        self.entries = entries
+        self.packaging_sizes = packaging_sizes
+        self.compiled_at = compiled_at
+        self.valid_until = valid_until
+
+    def is_valid(self, moment):
+        return moment < self.valid_until
+
+    def quote(self, product_id, quantity_bags, packaging_size=None, customer_tier=None):
+        if quantity_bags < 1:
+            raise QuoteError('Quantity must be at least 1 bag.')
+        tier = customer_tier or DEFAULT_TIER
+        if packaging_size is None:
+            sizes = self.packaging_sizes.get(product_id, ())
+            if len(sizes) != 1:
+                raise QuoteError(
+                    'packaging_size is required for this product.' if sizes
+                    else 'No price set for this product.'
+                )
+            packaging_size = sizes[0]
+        try:
+            breaks, unit_prices, labels, price_id = self.entries[(product_id, packaging_size, tier)]
+        except KeyError:
+            raise QuoteError('No price set for this product and packaging size.')
+
+        index = bisect_right(breaks, quantity_bags) - 1
+        unit_price = unit_prices[index]
+        return Quote(
+            price_id=price_id,
+            product_id=product_id,
+            packaging_size=packaging_size,
+            customer_tier=tier,
+            quantity_bags=quantity_bags,
+            unit_price=unit_price,
+            total_price=unit_price * quantity_bags,
+            rule_label=labels[index],
+        )
+
+
+def compile_price_table(now=None):
+    """Compile all current prices and their active rules into a PriceTable"""
+    now = now or timezone.now()
+    ttl = getattr(settings, 'PRICE_TABLE_TTL', 300)
+    valid_until = now + timedelta(seconds=ttl)
+
+    prices = Price.objects.filter(is_current=True).prefetch_related(
+        Prefetch('rules', queryset=PriceRule.objects.order_by('min_quantity_bags'))
+    )
+
+    entries = {}
+    packaging_sizes = {}
+    for price in prices:
+        packaging_sizes.setdefault(price.product_id, []).append(price.packaging_size)
+
+        active_rules = []
+        for rule in price.rules.all():
+            # The table must be rebuilt when a promotion starts or ends
+            for boundary in (rule.starts_at, rule.ends_at):
+                if boundary and now < boundary < valid_until:
+                    valid_until = boundary
+            if rule.is_active_at(now):
+                active_rules.append(rule)
+
+        for tier in TIERS:
+            # Cheapest price offered at each breakpoint for this tier
+            points = {1: (price.price_per_bag, '')}
+            for rule in active_rules:
+                if rule.customer_tier not in ('', tier):
+                    continue
+                current = points.get(rule.min_quantity_bags)
+                if current is None or rule.price_per_bag < current[0]:
+                    points[rule.min_quantity_bags] = (rule.price_per_bag, rule.label)
+
+            # Carry the running minimum forward so buying more never costs more per bag
+            breaks, unit_prices, labels = [], [], []
+            best = None
+            for quantity in sorted(points):
+                unit_price, label = points[quantity]
+                if best is not None and unit_price >= best[0]:
+                    continue
+                best = (unit_price, label)
+                breaks.append(quantity)
+                unit_prices.append(unit_price)
+                labels.append(label)
+            entries[(price.product_id, price.packaging_size, tier)] = (
+                breaks, unit_prices, labels, price.id
+            )
+
+    return PriceTable(entries, packaging_sizes, now, valid_until)
+
+
+_table = None
+_lock = threading.Lock()
+
+
+def get_price_table():
+    """Return the compiled price table, rebuilding it when stale"""
+    global _table
+    now = timezone.now()
+    table = _table
+    if table is not None and table.is_valid(now):
+        return table
+    with _lock:
+        if _table is None or not _table.is_valid(now):
+            _table = compile_price_table(now)
+        return _table
+
+
+def invalidate_price_table():
+    """Drop the compiled table so the next quote recompiles it"""
+    global _table
+    _table = None
+
+
+def quote(product_id, quantity_bags, packaging_size=None, customer_tier=None):
+    return get_price_table().quote(
+        product_id, quantity_bags,
+        packaging_size=packaging_size,
+        customer_tier=customer_tier,
+    )
+
+
+def customer_tier_for(user):
+    """Pricing tier for the requesting user (standard for anonymous/staff)"""
+    if user is None or not user.is_authenticated:
+        return DEFAULT_TIER
+    customer = getattr(user, 'customer_profile', None)
+    return customer.pricing_tier if customer else DEFAULT_TIER
+
@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand, CommandError
+from pricing.engine import compile_price_table
+import random
+import time
+
+
+class Command(BaseCommand):
+    help = 'Benchmark order quoting against the precompiled price table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--quotes',
+            type=int,
+            default=100000,
+            help='Number of quotes to run (default: 100000)',
+        )
+        parser.add_argument(
+            '--target',
+            type=int,
+            default=10000,
+            help='Minimum acceptable quotes per second (default: 10000)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42,
+            help='Random seed for the quote mix (default: 42)',
+        )
+
+    def handle(self, *args, **kwargs):
+        started = time.perf_counter()
+        table = compile_price_table()
+        compile_ms = (time.perf_counter() - started) * 1000
+
+        keys = list(table.entries)
+        if not keys:
+            raise CommandError('No current prices to quote. Run create_sample_data first.')
+
+        rng = random.Random(kwargs['seed'])
+        requests = [
+            (product_id, rng.randint(1, 5000), packaging_size, tier)
+            for product_id, packaging_size, tier in (
+                rng.choice(keys) for _ in range(kwargs['quotes'])
+            )
+        ]
+
+        started = time.perf_counter()
+        for product_id, quantity, packaging_size, tier in requests:
+            table.quote(product_id, quantity, packaging_size, tier)
+        elapsed = time.perf_counter() - started
+        rate = len(requests) / elapsed
+
+        self.stdout.write(f'Price table: {len(keys)} entries compiled in {compile_ms:.1f} ms')
+        self.stdout.write(f'Quotes: {len(requests)} in {elapsed * 1000:.1f} ms')
+        self.stdout.write(f'Per quote: {elapsed / len(requests) * 1e6:.2f} µs')
+        if rate >= kwargs['target']:
+            self.stdout.write(self.style.SUCCESS(f'Throughput: {rate:,.0f} quotes/sec'))
+        else:
+            raise CommandError(
+                f'Throughput {rate:,.0f} quotes/sec is below the target of {kwargs["target"]:,}'
+            )
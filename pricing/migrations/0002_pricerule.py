@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-19 17:47
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pricing', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PriceRule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('label', models.CharField(blank=True, help_text='e.g., 10 ton break, Harvest promo', max_length=100)),
+                ('min_quantity_bags', models.PositiveIntegerField(default=1, help_text='Rule applies from this many bags upwards', validators=[django.core.validators.MinValueValidator(1)])),
+                ('customer_tier', models.CharField(blank=True, choices=[('STANDARD', 'Standard'), ('WHOLESALE', 'Wholesale'), ('DISTRIBUTOR', 'Distributor')], help_text='Leave blank to apply to all customer tiers', max_length=20)),
+                ('price_per_bag', models.DecimalField(decimal_places=2, help_text='Price per bag (GHS)', max_digits=10)),
+                ('starts_at', models.DateTimeField(blank=True, help_text='Promotion start (blank = always)', null=True)),
+                ('ends_at', models.DateTimeField(blank=True, help_text='Promotion end (blank = open-ended)', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('price', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rules', to='pricing.price')),
+            ],
+            options={
+                'db_table': 'price_rules',
+                'ordering': ['price', 'customer_tier', 'min_quantity_bags'],
+                'indexes': [models.Index(fields=['price', 'customer_tier'], name='price_rules_price_i_dcbfd5_idx'), models.Index(fields=['ends_at'], name='price_rules_ends_at_e5a3d0_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-19 17:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pricing', '0002_pricerule'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='price',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name='price',
+            index=models.Index(fields=['updated_at'], name='prices_updated_fe240e_idx'),
+        ),
+    ]
@@ -1,6 +1,9 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
+from django.utils import timezone
+from django.core.validators import MinValueValidator
 from products.models import Product
+from customers.models import Customer
 
 
 class Price(models.Model):
@@ -13,6 +16,7 @@ class Price(models.Model):
     effective_date = models.DateTimeField(auto_now_add=True)
     updated_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True)
     is_current = models.BooleanField(default=True)
+    updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         db_table = 'prices'
@@ -20,6 +24,7 @@ class Price(models.Model):
         indexes = [
             models.Index(fields=['product', 'is_current']),
             models.Index(fields=['effective_date']),
+            models.Index(fields=['updated_at']),
         ]
         unique_together = [['product', 'packaging_size', 'is_current']]
     
@@ -27,11 +32,72 @@ class Price(models.Model):
         return f"{self.product.name} - {self.packaging_size} - GHS {self.price_per_bag}/bag"
     
     def save(self, *args, **kwargs):
-        if self.is_current:
-            # Set all other prices for this product and packaging to not current
-            Price.objects.filter(
-                product=self.product,
-                packaging_size=self.packaging_size,
-                is_current=True
-            ).update(is_current=False)
-        super().save(*args, **kwargs)
+        # One transaction, so the quote table is recompiled (on commit) with the copied rules
+        with transaction.atomic():
+            replaced = []
+            if self.is_current:
+                # Set all other prices for this product and packaging to not current
+                previous = Price.objects.filter(
+                    product=self.product,
+                    packaging_size=self.packaging_size,
+                    is_current=True
+                ).exclude(pk=self.pk)
+                replaced = list(previous.values_list('pk', flat=True))
+                previous.update(is_current=False)
+            super().save(*args, **kwargs)
+            if replaced:
+                self.carry_rules_forward(replaced)
+    
+    def carry_rules_forward(self, price_ids):
+        """Copy the unexpired rules of the replaced prices, so breaks and promotions survive a price update"""
+        now = timezone.now()
+        rules = PriceRule.objects.filter(price_id__in=price_ids).exclude(ends_at__lte=now)
+        PriceRule.objects.bulk_create([
+            PriceRule(
+                price=self, label=rule.label, min_quantity_bags=rule.min_quantity_bags,
+                customer_tier=rule.customer_tier, price_per_bag=rule.price_per_bag,
+                starts_at=rule.starts_at, ends_at=rule.ends_at,
+            )
+            for rule in rules
+        ])
+
+
+class PriceRule(models.Model):
+    """Quantity break, customer-tier or promotional price attached to a Price"""
+    price = models.ForeignKey(Price, on_delete=models.CASCADE, related_name='rules')
+    label = models.CharField(max_length=100, blank=True, help_text='e.g., 10 ton break, Harvest promo')
+    min_quantity_bags = models.PositiveIntegerField(
+        default=1,
+        validators=[MinValueValidator(1)],
+        help_text='Rule applies from this many bags upwards'
+    )
+    customer_tier = models.CharField(
+        max_length=20,
+        choices=Customer.PRICING_TIER_CHOICES,
+        blank=True,
+        help_text='Leave blank to apply to all customer tiers'
+    )
+    price_per_bag = models.DecimalField(max_digits=10, decimal_places=2, help_text='Price per bag (GHS)')
+    starts_at = models.DateTimeField(null=True, blank=True, help_text='Promotion start (blank = always)')
+    ends_at = models.DateTimeField(null=True, blank=True, help_text='Promotion end (blank = open-ended)')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'price_rules'
+        ordering = ['price', 'customer_tier', 'min_quantity_bags']
+        indexes = [
+            models.Index(fields=['price', 'customer_tier']),
+            models.Index(fields=['ends_at']),
+        ]
+    
+    def __str__(self):
+        tier = self.get_customer_tier_display() or 'All tiers'
+        return f"{self.price} - {tier} - {self.min_quantity_bags}+ bags @ GHS {self.price_per_bag}"
+    
+    def is_active_at(self, moment):
+        if self.starts_at and moment < self.starts_at:
+            return False
+        if self.ends_at and moment >= self.ends_at:
+            return False
+        return True
@@ -1,18 +1,39 @@
 from rest_framework import serializers
-from .models import Price
+from .models import Price, PriceRule
 from products.serializers import ProductSerializer
+from customers.models import Customer
+
+
+class PriceRuleSerializer(serializers.ModelSerializer):
+    """Serializer for PriceRule model"""
+    
+    class Meta:
+        model = PriceRule
+        fields = ['id', 'price', 'label', 'min_quantity_bags', 'customer_tier',
+                  'price_per_bag', 'starts_at', 'ends_at', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'created_at', 'updated_at']
+    
+    def validate(self, attrs):
+        if attrs.get('price_per_bag') is not None and attrs['price_per_bag'] <= 0:
+            raise serializers.ValidationError({"price_per_bag": "Price must be greater than 0"})
+        starts_at = attrs.get('starts_at', getattr(self.instance, 'starts_at', None))
+        ends_at = attrs.get('ends_at', getattr(self.instance, 'ends_at', None))
+        if starts_at and ends_at and ends_at <= starts_at:
+            raise serializers.ValidationError({"ends_at": "End must be after start"})
+        return attrs
 
 
 class PriceSerializer(serializers.ModelSerializer):
     """Serializer for Price model"""
     product_name = serializers.CharField(source='product.name', read_only=True)
     updated_by_name = serializers.CharField(source='updated_by.full_name', read_only=True)
+    rules = PriceRuleSerializer(many=True, read_only=True)
     
     class Meta:
         model = Price
         fields = ['id', 'product', 'product_name', 'price_per_bag', 'price_per_ton',
                   'packaging_size', 'market_notes', 'effective_date', 'updated_by',
-                  'updated_by_name', 'is_current']
+                  'updated_by_name', 'is_current', 'rules']
         read_only_fields = ['id', 'effective_date', 'updated_by']
     
     def validate(self, attrs):
@@ -31,3 +52,11 @@ class CurrentPriceSerializer(serializers.ModelSerializer):
         model = Price
         fields = ['id', 'product', 'price_per_bag', 'price_per_ton', 'packaging_size',
                   'market_notes', 'effective_date']
+
+
+class QuoteRequestSerializer(serializers.Serializer):
+    """Query parameters for quoting an order"""
+    product = serializers.IntegerField()
+    quantity_bags = serializers.IntegerField(min_value=1)
+    packaging_size = serializers.CharField(required=False)
+    customer_tier = serializers.ChoiceField(choices=Customer.PRICING_TIER_CHOICES, required=False)
@@ -1,10 +1,16 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from .models import Price
+from .models import Price, PriceRule
+from .engine import invalidate_price_table
+from maize_point.caching import track_deletions
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Deleted prices change the catalog's ETags
+track_deletions(Price)
+
 
 @receiver(post_save, sender=Price)
 def update_price_current_flag(sender, instance, created, **kwargs):
@@ -12,3 +18,14 @@ def update_price_current_flag(sender, instance, created, **kwargs):
     if instance.is_current and not kwargs.get('raw', False):
         # This is handled in the model's save method, but we log it here
         logger.info(f"New current price set for {instance.product.name} - {instance.packaging_size}")
+
+
+@receiver(post_save, sender=Price)
+@receiver(post_delete, sender=Price)
+@receiver(post_save, sender=PriceRule)
+@receiver(post_delete, sender=PriceRule)
+def invalidate_compiled_prices(sender, **kwargs):
+    """Recompile the quote table after any price or rule change"""
+    invalidate_price_table()
+    # Also drop any table compiled from uncommitted data in the meantime
+    transaction.on_commit(invalidate_price_table)
@@ -1,8 +1,9 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import PriceViewSet
+from .views import PriceViewSet, PriceRuleViewSet
 
 router = DefaultRouter()
+router.register(r'rules', PriceRuleViewSet, basename='price-rule')
 router.register(r'', PriceViewSet, basename='price')
 
 app_name = 'pricing'
@@ -1,10 +1,17 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from django.db.models import Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter
-from .models import Price
-from .serializers import PriceSerializer, CurrentPriceSerializer
+from maize_point.caching import ConditionalGetMixin
+from products.models import Product
+from inventory.models import Stock
+from .models import Price, PriceRule
+from .serializers import (
+    PriceSerializer, CurrentPriceSerializer, PriceRuleSerializer, QuoteRequestSerializer
+)
+from .engine import quote, customer_tier_for, QuoteError
 
 
 class IsAdminOrReadOnly(permissions.BasePermission):
@@ -16,9 +23,11 @@ class IsAdminOrReadOnly(permissions.BasePermission):
         return request.user.is_authenticated and request.user.user_type == 'ADMIN'
 
 
-class PriceViewSet(viewsets.ModelViewSet):
+class PriceViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """ViewSet for Price model"""
-    queryset = Price.objects.select_related('product', 'updated_by').all()
+    conditional_sources = [(Price, 'updated_at'), (Product, 'updated_at'), (Stock, 'updated_at')]
+    conditional_actions = ('current',)
+    queryset = Price.objects.select_related('product', 'updated_by').prefetch_related('rules').all()
     serializer_class = PriceSerializer
     permission_classes = [IsAdminOrReadOnly]
     filter_backends = [DjangoFilterBackend, OrderingFilter]
@@ -35,7 +44,9 @@ class PriceViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def current(self, request):
         """Get current prices for all products"""
-        prices = Price.objects.filter(is_current=True).select_related('product', 'updated_by')
+        prices = Price.objects.filter(is_current=True).select_related('updated_by').prefetch_related(
+            Prefetch('product', queryset=Product.objects.with_catalog_data())
+        )
         serializer = CurrentPriceSerializer(prices, many=True)
         return Response(serializer.data)
     
@@ -50,3 +61,48 @@ class PriceViewSet(viewsets.ModelViewSet):
         
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
+    
+    @action(detail=False, methods=['get'])
+    def quote(self, request):
+        """Quote a unit and total price from the precompiled price table"""
+        serializer = QuoteRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        
+        # Only admin and staff may quote on behalf of another tier
+        tier = customer_tier_for(request.user)
+        if data.get('customer_tier') and request.user.is_authenticated \
+                and request.user.user_type in ['ADMIN', 'STAFF']:
+            tier = data['customer_tier']
+        
+        try:
+            result = quote(
+                data['product'],
+                data['quantity_bags'],
+                packaging_size=data.get('packaging_size'),
+                customer_tier=tier,
+            )
+        except QuoteError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        return Response({
+            'price': result.price_id,
+            'product': result.product_id,
+            'packaging_size': result.packaging_size,
+            'customer_tier': result.customer_tier,
+            'quantity_bags': result.quantity_bags,
+            'unit_price': str(result.unit_price),
+            'total_price': str(result.total_price),
+            'rule': result.rule_label,
+        })
+
+
+class PriceRuleViewSet(viewsets.ModelViewSet):
+    """ViewSet for PriceRule model"""
+    queryset = PriceRule.objects.select_related('price__product').all()
+    serializer_class = PriceRuleSerializer
+    permission_classes = [IsAdminOrReadOnly]
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_fields = ['price', 'price__product', 'customer_tier']
+    ordering_fields = ['min_quantity_bags', 'starts_at', 'ends_at']
+    ordering = ['price', 'customer_tier', 'min_quantity_bags']
@@ -1,6 +1,32 @@
 from django.db import models
 
 
+class ProductQuerySet(models.QuerySet):
+    
+    def with_catalog_data(self):
+        """Annotate stock totals and prefetch current prices for list endpoints"""
+        from inventory.models import Stock
+        from pricing.models import Price
+        
+        stock = Stock.objects.filter(product=models.OuterRef('pk')).order_by().values('product')
+        return self.annotate(
+            stock_total_bags=models.Subquery(
+                stock.annotate(total=models.Sum('quantity_bags')).values('total'),
+                output_field=models.IntegerField()
+            ),
+            stock_total_tons=models.Subquery(
+                stock.annotate(total=models.Sum('quantity_tons')).values('total'),
+                output_field=models.DecimalField(max_digits=10, decimal_places=3)
+            ),
+        ).prefetch_related(
+            models.Prefetch(
+                'prices',
+                queryset=Price.objects.filter(is_current=True).order_by('-effective_date'),
+                to_attr='current_prices'
+            )
+        )
+
+
 class Product(models.Model):
     """Product model for maize types"""
     name = models.CharField(max_length=200, unique=True, help_text='Product name (e.g., Yellow Maize, White Maize)')
@@ -13,12 +39,15 @@ class Product(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ProductQuerySet.as_manager()
+    
     class Meta:
         db_table = 'products'
         ordering = ['name']
         indexes = [
             models.Index(fields=['name']),
             models.Index(fields=['is_available']),
+            models.Index(fields=['updated_at']),
         ]
     
     def __str__(self):
@@ -27,6 +56,8 @@ class Product(models.Model):
     @property
     def current_stock(self):
         """Get current total stock for this product"""
+        if hasattr(self, 'stock_total_bags'):
+            return {'total_bags': self.stock_total_bags, 'total_tons': self.stock_total_tons}
         return self.stock_items.aggregate(
             total_bags=models.Sum('quantity_bags'),
             total_tons=models.Sum('quantity_tons')
@@ -35,4 +66,6 @@ class Product(models.Model):
     @property
     def current_price(self):
         """Get current price for this product"""
+        if hasattr(self, 'current_prices'):
+            return self.current_prices[0] if self.current_prices else None
         return self.prices.filter(is_current=True).first()
@@ -0,0 +1,5 @@
+from maize_point.caching import track_deletions
+from .models import Product
+
+# Deleted products change the catalog's ETags
+track_deletions(Product)
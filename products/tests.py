@@ -0,0 +1,86 @@
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from inventory.models import Stock
+from pricing.models import Price
+from .models import Product
+
+
+class CatalogQueryCountTests(TestCase):
+    """The catalog endpoints read stock and prices in a fixed number of queries, however many products there are"""
+
+    def setUp(self):
+        cache.clear()
+        self.products = 0
+
+    def add_products(self, count):
+        for _ in range(count):
+            self.products += 1
+            product = Product.objects.create(
+                name=f'Maize {self.products}', description='Test', packaging_sizes=['50kg bag'],
+            )
+            Price.objects.create(
+                product=product, price_per_bag=Decimal('250.00'), price_per_ton=Decimal('5000.00'),
+                packaging_size='50kg bag',
+            )
+            for _ in range(2):
+                Stock.objects.create(
+                    product=product, quantity_bags=100, quantity_tons=Decimal('5.000'), source_type='FARMER',
+                    moisture_content=Decimal('13.50'), warehouse_location='Kumasi Central',
+                    cost_price=Decimal('210.00'), date_received=timezone.now(),
+                )
+
+    def assert_constant_queries(self, path, queries):
+        for count in (1, 9):
+            self.add_products(count)
+            with self.assertNumQueries(queries):
+                response = self.client.get(path)
+            self.assertEqual(response.status_code, 200)
+
+    def test_product_list(self):
+        # Change markers, page count, products with stock totals, current prices
+        self.assert_constant_queries('/api/products/', 4)
+        product = self.client.get('/api/products/').json()['results'][0]
+        self.assertEqual(product['current_stock'], {'total_bags': 200, 'total_tons': 10.0})
+        self.assertEqual(product['current_price']['price_per_bag'], '250.00')
+
+    def test_current_prices(self):
+        # Change markers, prices, products with stock totals, their current prices
+        self.assert_constant_queries('/api/pricing/current/', 4)
+
+
+class CatalogConditionalGetTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        product = Product.objects.create(name='Yellow Maize', description='Test', packaging_sizes=['50kg bag'])
+        self.lots = [
+            Stock.objects.create(
+                product=product, quantity_bags=100, quantity_tons=Decimal('5.000'), source_type='FARMER',
+                moisture_content=Decimal('13.50'), warehouse_location='Kumasi Central',
+                cost_price=Decimal('210.00'), date_received=timezone.now(),
+            )
+            for _ in range(2)
+        ]
+
+    def test_not_modified_reads_only_the_timestamps(self):
+        etag = self.client.get('/api/products/')['ETag']
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/products/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('COUNT(', queries[0]['sql'].upper())
+
+    def test_delete_changes_the_etag(self):
+        etag = self.client.get('/api/products/')['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            # The older lot: the newest updated_at stays the same
+            self.lots[0].delete()
+        response = self.client.get('/api/products/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
@@ -1,6 +1,9 @@
 from rest_framework import viewsets, permissions
 from rest_framework.filters import SearchFilter, OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
+from maize_point.caching import ConditionalGetMixin
+from inventory.models import Stock
+from pricing.models import Price
 from .models import Product
 from .serializers import ProductSerializer
 
@@ -14,9 +17,10 @@ class IsAdminOrReadOnly(permissions.BasePermission):
         return request.user.is_authenticated and request.user.user_type == 'ADMIN'
 
 
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """ViewSet for Product model"""
-    queryset = Product.objects.all()
+    conditional_sources = [(Product, 'updated_at'), (Stock, 'updated_at'), (Price, 'updated_at')]
+    queryset = Product.objects.with_catalog_data()
     serializer_class = ProductSerializer
     permission_classes = [IsAdminOrReadOnly]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
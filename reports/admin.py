@@ -0,0 +1,44 @@
+from django.contrib import admin
+from .models import DailyOrderFact, DailySupplyFact, DailyMovementFact, RollupState
+
+
+class FactAdmin(admin.ModelAdmin):
+    """Fact rows are rebuilt by refresh_rollups; the admin only browses them"""
+    date_hierarchy = 'day'
+    list_select_related = ['product']
+    ordering = ['-day']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(DailyOrderFact)
+class DailyOrderFactAdmin(FactAdmin):
+    list_display = ['day', 'product', 'order_status', 'payment_option', 'delivery_method',
+                    'order_count', 'quantity_bags', 'revenue']
+    list_filter = ['order_status', 'payment_option', 'delivery_method', 'product']
+
+
+@admin.register(DailySupplyFact)
+class DailySupplyFactAdmin(FactAdmin):
+    list_display = ['day', 'product', 'region', 'payment_status', 'supply_count',
+                    'quantity_bags', 'total_cost', 'amount_paid']
+    list_filter = ['payment_status', 'region', 'product']
+
+
+@admin.register(DailyMovementFact)
+class DailyMovementFactAdmin(FactAdmin):
+    list_display = ['day', 'product', 'warehouse_location', 'movement_type', 'movement_count', 'quantity_bags']
+    list_filter = ['movement_type', 'warehouse_location', 'product']
+
+
+@admin.register(RollupState)
+class RollupStateAdmin(admin.ModelAdmin):
+    list_display = ['source', 'high_water_mark', 'version', 'refreshed_at']
+    readonly_fields = ['source', 'high_water_mark', 'version', 'refreshed_at']
+
+    def has_add_permission(self, request):
+        return False
@@ -0,0 +1,122 @@
+# Generated by Django 4.2.30 on 2026-10-19 18:19
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('products', '0002_product_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyMovementFact',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('warehouse_location', models.CharField(max_length=200)),
+                ('movement_type', models.CharField(max_length=20)),
+                ('movement_count', models.PositiveIntegerField(default=0)),
+                ('quantity_bags', models.BigIntegerField(default=0)),
+                ('quantity_tons', models.DecimalField(decimal_places=3, default=0, max_digits=14)),
+            ],
+            options={
+                'db_table': 'report_daily_movements',
+                'ordering': ['day'],
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyOrderFact',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('order_status', models.CharField(max_length=20)),
+                ('payment_option', models.CharField(max_length=20)),
+                ('delivery_method', models.CharField(max_length=20)),
+                ('order_count', models.PositiveIntegerField(default=0)),
+                ('quantity_bags', models.BigIntegerField(default=0)),
+                ('quantity_tons', models.DecimalField(decimal_places=3, default=0, max_digits=14)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+            ],
+            options={
+                'db_table': 'report_daily_orders',
+                'ordering': ['day'],
+            },
+        ),
+        migrations.CreateModel(
+            name='DailySupplyFact',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('region', models.CharField(max_length=100)),
+                ('payment_status', models.CharField(max_length=20)),
+                ('supply_count', models.PositiveIntegerField(default=0)),
+                ('quantity_bags', models.BigIntegerField(default=0)),
+                ('quantity_tons', models.DecimalField(decimal_places=3, default=0, max_digits=14)),
+                ('total_cost', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ('amount_paid', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+            ],
+            options={
+                'db_table': 'report_daily_supplies',
+                'ordering': ['day'],
+            },
+        ),
+        migrations.CreateModel(
+            name='RollupDirtyDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=20)),
+                ('day', models.DateField()),
+            ],
+            options={
+                'db_table': 'report_rollup_dirty_days',
+            },
+        ),
+        migrations.CreateModel(
+            name='RollupState',
+            fields=[
+                ('source', models.CharField(max_length=20, primary_key=True, serialize=False)),
+                ('high_water_mark', models.DateTimeField(blank=True, null=True)),
+                ('version', models.PositiveIntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'report_rollup_state',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='rollupdirtyday',
+            constraint=models.UniqueConstraint(fields=('source', 'day'), name='unique_rollup_dirty_day'),
+        ),
+        migrations.AddField(
+            model_name='dailysupplyfact',
+            name='product',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='products.product'),
+        ),
+        migrations.AddField(
+            model_name='dailyorderfact',
+            name='product',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='products.product'),
+        ),
+        migrations.AddField(
+            model_name='dailymovementfact',
+            name='product',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='products.product'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailysupplyfact',
+            constraint=models.UniqueConstraint(fields=('day', 'product', 'region', 'payment_status'), name='unique_daily_supply_fact'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailyorderfact',
+            constraint=models.UniqueConstraint(fields=('day', 'product', 'order_status', 'payment_option', 'delivery_method'), name='unique_daily_order_fact'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailymovementfact',
+            constraint=models.UniqueConstraint(fields=('day', 'product', 'warehouse_location', 'movement_type'), name='unique_daily_movement_fact'),
+        ),
+    ]
@@ -0,0 +1,108 @@
+from django.db import models
+from products.models import Product
+
+
+class DailyOrderFact(models.Model):
+    """Orders aggregated per day (Accra time), product, status, payment option and delivery method"""
+    day = models.DateField()
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='+')
+    order_status = models.CharField(max_length=20)
+    payment_option = models.CharField(max_length=20)
+    delivery_method = models.CharField(max_length=20)
+    order_count = models.PositiveIntegerField(default=0)
+    quantity_bags = models.BigIntegerField(default=0)
+    quantity_tons = models.DecimalField(max_digits=14, decimal_places=3, default=0)
+    revenue = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+
+    class Meta:
+        db_table = 'report_daily_orders'
+        ordering = ['day']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['day', 'product', 'order_status', 'payment_option', 'delivery_method'],
+                name='unique_daily_order_fact',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.day} - {self.product_id} - {self.order_status}: {self.order_count} orders"
+
+
+class DailySupplyFact(models.Model):
+    """Farmer supplies aggregated per delivery day (Accra time), product, farmer region and payment status"""
+    day = models.DateField()
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='+')
+    region = models.CharField(max_length=100)
+    payment_status = models.CharField(max_length=20)
+    supply_count = models.PositiveIntegerField(default=0)
+    quantity_bags = models.BigIntegerField(default=0)
+    quantity_tons = models.DecimalField(max_digits=14, decimal_places=3, default=0)
+    total_cost = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    amount_paid = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+
+    class Meta:
+        db_table = 'report_daily_supplies'
+        ordering = ['day']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['day', 'product', 'region', 'payment_status'],
+                name='unique_daily_supply_fact',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.day} - {self.product_id} - {self.region}: {self.supply_count} supplies"
+
+
+class DailyMovementFact(models.Model):
+    """Stock movements aggregated per day (Accra time), product, warehouse and movement type"""
+    day = models.DateField()
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='+')
+    warehouse_location = models.CharField(max_length=200)
+    movement_type = models.CharField(max_length=20)
+    movement_count = models.PositiveIntegerField(default=0)
+    quantity_bags = models.BigIntegerField(default=0)
+    quantity_tons = models.DecimalField(max_digits=14, decimal_places=3, default=0)
+
+    class Meta:
+        db_table = 'report_daily_movements'
+        ordering = ['day']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['day', 'product', 'warehouse_location', 'movement_type'],
+                name='unique_daily_movement_fact',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.day} - {self.product_id} - {self.movement_type}: {self.movement_count} movements"
+
+
+class RollupState(models.Model):
+    """High-water mark of the last incremental refresh of one fact table"""
+    source = models.CharField(max_length=20, primary_key=True)
+    high_water_mark = models.DateTimeField(null=True, blank=True)
+    # Bumped whenever the refresh rewrote any day; part of report cache keys
+    version = models.PositiveIntegerField(default=0)
+    refreshed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'report_rollup_state'
+
+    def __str__(self):
+        return f"{self.source} up to {self.high_water_mark}"
+
+
+class RollupDirtyDay(models.Model):
+    """A day to re-aggregate on the next refresh, for changes the high-water mark can't see (deletes, moved dates)"""
+    source = models.CharField(max_length=20)
+    day = models.DateField()
+
+    class Meta:
+        db_table = 'report_rollup_dirty_days'
+        constraints = [
+            models.UniqueConstraint(fields=['source', 'day'], name='unique_rollup_dirty_day'),
+        ]
+
+    def __str__(self):
+        return f"{self.source} {self.day}"
@@ -0,0 +1,213 @@
+"""
+Parameterised sales, procurement, inventory and finance reports.
+
+Each report groups daily fact rows by an interval (day, week, month or the
+whole period) and any of the report's dimensions, optionally filtered on
+those dimensions. Results are cached under a key built from the report name,
+the normalised parameters and the data version of what the report reads:
+rollup versions for the fact tables, plus a counter bumped on every Stock
+write for live stock levels. New data means a new key, so nothing has to be
+deleted. Closed periods are cached without expiry; a period that reaches
+today, or a report showing live stock, expires after REPORTS_CACHE_TTL.
+"""
+from decimal import Decimal
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Sum
+from django.db.models.functions import TruncMonth, TruncWeek
+from django.utils import timezone
+
+from inventory.models import Stock
+from .models import DailyMovementFact, DailyOrderFact, DailySupplyFact, RollupState
+from .rollups import local_day
+from .summary import build_report
+
+INTERVALS = ['total', 'day', 'week', 'month']
+STOCK_VERSION_KEY = 'reports:version:stock'
+
+ORDER_MEASURES = {
+    'order_count': Sum('order_count'),
+    'quantity_bags': Sum('quantity_bags'),
+    'quantity_tons': Sum('quantity_tons'),
+    'revenue': Sum('revenue'),
+}
+SUPPLY_MEASURES = {
+    'supply_count': Sum('supply_count'),
+    'quantity_bags': Sum('quantity_bags'),
+    'quantity_tons': Sum('quantity_tons'),
+    'total_cost': Sum('total_cost'),
+    'amount_paid': Sum('amount_paid'),
+}
+MOVEMENT_MEASURES = {
+    'movement_count': Sum('movement_count'),
+    'quantity_bags': Sum('quantity_bags'),
+    'quantity_tons': Sum('quantity_tons'),
+}
+
+# name: (dimensions usable in group_by and as filters, sources whose versions key the cache)
+REPORTS = {
+    'sales': (['product', 'order_status', 'payment_option', 'delivery_method'], ['orders']),
+    'procurement': (['product', 'region', 'payment_status'], ['supplies']),
+    'inventory': (['product', 'warehouse_location', 'movement_type'], ['movements', 'stock']),
+    'finance': (['product'], ['orders', 'supplies']),
+    'summary': ([], ['orders', 'supplies', 'movements', 'stock']),
+}
+
+
+def group_rows(queryset, interval, group_by, measures, date_field='day'):
+    """Sum `measures` over `queryset`, bucketed by interval and grouped by dimensions"""
+    keys = []
+    if interval == 'day':
+        keys.append(date_field)
+    elif interval in ('week', 'month'):
+        trunc = TruncWeek if interval == 'week' else TruncMonth
+        queryset = queryset.annotate(period=trunc(date_field))
+        keys.append('period')
+    for dimension in group_by:
+        keys.append(dimension)
+        if dimension == 'product':
+            keys.append('product__name')
+
+    # SQLite sums decimals as floats; round back to the column's precision
+    exponents = {}
+    for name, aggregate in measures.items():
+        field = queryset.model._meta.get_field(aggregate.get_source_expressions()[0].name)
+        if field.get_internal_type() == 'DecimalField':
+            exponents[name] = Decimal(1).scaleb(-field.decimal_places)
+
+    rows = []
+    for row in queryset.order_by().values(*keys).annotate(**measures).order_by(*keys):
+        if date_field in row:
+            row['period'] = row.pop(date_field)
+        if 'product__name' in row:
+            row['product_name'] = row.pop('product__name')
+        for name in measures:
+            row[name] = row[name] or 0
+            if name in exponents:
+                row[name] = Decimal(row[name]).quantize(exponents[name])
+        rows.append(row)
+    return rows
+
+
+def _facts(fact, params):
+    return fact.objects.filter(day__gte=params['start'], day__lte=params['end'], **params['filters'])
+
+
+def _totals(rows, measures):
+    return {name: sum((row[name] for row in rows), 0) for name in measures}
+
+
+def sales_report(params):
+    rows = group_rows(_facts(DailyOrderFact, params), params['interval'], params['group_by'], ORDER_MEASURES)
+    return {'rows': rows, 'totals': _totals(rows, ORDER_MEASURES)}
+
+
+def procurement_report(params):
+    rows = group_rows(_facts(DailySupplyFact, params), params['interval'], params['group_by'], SUPPLY_MEASURES)
+    for row in rows:
+        row['outstanding'] = row['total_cost'] - row['amount_paid']
+    totals = _totals(rows, SUPPLY_MEASURES)
+    totals['outstanding'] = totals['total_cost'] - totals['amount_paid']
+    return {'rows': rows, 'totals': totals}
+
+
+def inventory_report(params):
+    """Stock movements over the period, plus current stock levels"""
+    movements = group_rows(
+        _facts(DailyMovementFact, params), params['interval'], params['group_by'], MOVEMENT_MEASURES
+    )
+    stock_group = [name for name in params['group_by'] if name in ('product', 'warehouse_location')]
+    stock_filters = {
+        name: value for name, value in params['filters'].items()
+        if name.split('__')[0] in ('product', 'warehouse_location')
+    }
+    stock_measures = {'quantity_bags': Sum('quantity_bags'), 'quantity_tons': Sum('quantity_tons')}
+    stock = group_rows(Stock.objects.filter(**stock_filters), 'total', stock_group, stock_measures)
+    return {
+        'movements': movements,
+        'movement_totals': _totals(movements, MOVEMENT_MEASURES),
+        'stock': stock,
+        'stock_totals': _totals(stock, stock_measures),
+    }
+
+
+def finance_report(params):
+    """Delivered revenue against supply cost, per interval (and product)"""
+    revenue = group_rows(
+        _facts(DailyOrderFact, params).filter(order_status='DELIVERED'),
+        params['interval'], params['group_by'], {'revenue': Sum('revenue')},
+    )
+    costs = group_rows(
+        _facts(DailySupplyFact, params), params['interval'], params['group_by'],
+        {'supply_cost': Sum('total_cost'), 'supply_paid': Sum('amount_paid')},
+    )
+
+    merged = {}
+    for row in revenue + costs:
+        key = tuple(row.get(name) for name in ('period', 'product'))
+        entry = merged.setdefault(key, {'revenue': 0, 'supply_cost': 0, 'supply_paid': 0})
+        entry.update(row)
+    rows = []
+    for key in sorted(merged, key=lambda key: tuple('' if value is None else str(value) for value in key)):
+        row = merged[key]
+        row['gross_profit'] = row['revenue'] - row['supply_cost']
+        row['payables'] = row['supply_cost'] - row['supply_paid']
+        rows.append(row)
+    return {'rows': rows, 'totals': _totals(rows, ['revenue', 'supply_cost', 'supply_paid', 'gross_profit', 'payables'])}
+
+
+def summary_report(params):
+    # Runs inside the request: one connection, one snapshot, no thread pool
+    return build_report(params['start'], params['end'], workers=1)
+
+
+BUILDERS = {
+    'sales': sales_report,
+    'procurement': procurement_report,
+    'inventory': inventory_report,
+    'finance': finance_report,
+    'summary': summary_report,
+}
+
+
+def bump_stock_version():
+    try:
+        cache.incr(STOCK_VERSION_KEY)
+    except ValueError:
+        cache.set(STOCK_VERSION_KEY, 1, None)
+
+
+def data_version(sources):
+    """Version string of the data a report reads; changes whenever that data may have"""
+    versions = dict(RollupState.objects.filter(source__in=sources).values_list('source', 'version'))
+    if 'stock' in sources:
+        versions['stock'] = cache.get(STOCK_VERSION_KEY, 0)
+    return ':'.join(f'{source}={versions.get(source, 0)}' for source in sources)
+
+
+def cache_timeout(name, params):
+    # Live stock levels (and summary's customer/farmer counts) keep changing after a period closes
+    if 'stock' not in REPORTS[name][1] and params['end'] < local_day(timezone.now()):
+        return None
+    return settings.REPORTS_CACHE_TTL
+
+
+def run_report(name, params):
+    """(report data, served from cache) for validated params"""
+    sources = REPORTS[name][1]
+    normalised = json.dumps(params, cls=DjangoJSONEncoder, sort_keys=True)
+    digest = hashlib.md5(f'{name}|{normalised}|{data_version(sources)}'.encode()).hexdigest()
+    key = f'reports:{name}:{digest}'
+
+    data = cache.get(key)
+    if data is not None:
+        return data, True
+    data = {'report': name, **params, **BUILDERS[name](params)}
+    # Stored as JSON-ready primitives so a hit costs no re-encoding of Decimals or dates
+    data = json.loads(json.dumps(data, cls=DjangoJSONEncoder))
+    cache.set(key, data, cache_timeout(name, params))
+    return data, False
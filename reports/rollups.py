@@ -0,0 +1,198 @@
+"""
+Incremental daily rollups of orders, farmer supplies and stock movements.
+
+Each fact table holds one row per (day in REPORTS_TIME_ZONE, dimensions).
+A refresh finds the days touched since the source's high-water mark (rows
+whose change timestamp moved past it, plus days queued in RollupDirtyDay by
+deletes and moved dates), and re-aggregates those days from scratch, so
+late-arriving updates simply rewrite the day they belong to. Re-aggregating
+is idempotent, which is what lets the high-water mark overlap by
+REPORTS_ROLLUP_OVERLAP to catch rows committed late with an older timestamp.
+"""
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from farmers.models import FarmerSupply
+from inventory.models import StockMovement
+from orders.models import Order
+from .models import DailyMovementFact, DailyOrderFact, DailySupplyFact, RollupDirtyDay, RollupState
+
+
+def report_timezone():
+    return ZoneInfo(settings.REPORTS_TIME_ZONE)
+
+
+def local_day(value):
+    return timezone.localtime(value, report_timezone()).date()
+
+
+def day_bounds(first_day, last_day):
+    """Aware [start, end) datetimes covering first_day..last_day in report time"""
+    zone = report_timezone()
+    start = datetime.combine(first_day, time.min, tzinfo=zone)
+    end = datetime.combine(last_day + timedelta(days=1), time.min, tzinfo=zone)
+    return start, end
+
+
+def _runs(days):
+    """Split days into (first, last) runs of consecutive dates"""
+    runs = []
+    for day in sorted(days):
+        if runs and day == runs[-1][1] + timedelta(days=1):
+            runs[-1][1] = day
+        else:
+            runs.append([day, day])
+    return runs
+
+
+class Rollup:
+    """How one fact table is aggregated from its source model"""
+
+    def __init__(self, name, fact, model, date_field, change_fields, dimensions, measures):
+        self.name = name
+        self.fact = fact
+        self.model = model
+        self.date_field = date_field
+        # Timestamps that move when a row's day or dimensions may have changed
+        self.change_fields = change_fields
+        # fact field -> source lookup
+        self.dimensions = dimensions
+        self.measures = measures
+
+    def _with_day(self, queryset):
+        return queryset.order_by().annotate(rollup_day=TruncDate(self.date_field, tzinfo=report_timezone()))
+
+    def changed_days(self, since):
+        days = set()
+        for field in self.change_fields:
+            changed = self.model.objects.filter(**{f'{field}__gt': since})
+            days.update(self._with_day(changed).values_list('rollup_day', flat=True).distinct())
+        return days
+
+    def aggregate(self, queryset):
+        # Prefixed so the aliases can't clash with field names on the source model
+        rows = self._with_day(queryset).values(
+            'rollup_day', **{f'dim_{name}': F(lookup) for name, lookup in self.dimensions.items()}
+        ).annotate(**self.measures)
+        return [
+            self.fact(
+                day=row['rollup_day'],
+                **{name: row[f'dim_{name}'] for name in self.dimensions},
+                **{name: row[name] or 0 for name in self.measures},
+            )
+            for row in rows
+        ]
+
+    def rebuild_days(self, days, batch_size=2000):
+        for first_day, last_day in _runs(days):
+            start, end = day_bounds(first_day, last_day)
+            facts = self.aggregate(self.model.objects.filter(
+                **{f'{self.date_field}__gte': start, f'{self.date_field}__lt': end}
+            ))
+            with transaction.atomic():
+                self.fact.objects.filter(day__gte=first_day, day__lte=last_day).delete()
+                self.fact.objects.bulk_create(facts, batch_size=batch_size)
+
+    def rebuild_all(self, batch_size=2000):
+        facts = self.aggregate(self.model.objects.all())
+        with transaction.atomic():
+            self.fact.objects.all().delete()
+            self.fact.objects.bulk_create(facts, batch_size=batch_size)
+        return {fact.day for fact in facts}
+
+    def refresh(self, full=False):
+        """Bring the fact table up to date; returns the number of days rewritten"""
+        RollupState.objects.get_or_create(source=self.name)
+        with transaction.atomic():
+            # Serialises concurrent refreshes of the same table
+            state = RollupState.objects.select_for_update().get(source=self.name)
+            # Taken before reading so rows written during the refresh are seen next time
+            started = timezone.now()
+
+            dirty = list(RollupDirtyDay.objects.filter(source=self.name).values_list('id', 'day'))
+            if full or state.high_water_mark is None:
+                days = self.rebuild_all()
+            else:
+                since = state.high_water_mark - timedelta(seconds=settings.REPORTS_ROLLUP_OVERLAP)
+                days = self.changed_days(since) | {day for _, day in dirty}
+                self.rebuild_days(days)
+
+            RollupDirtyDay.objects.filter(id__in=[pk for pk, _ in dirty]).delete()
+            state.high_water_mark = started
+            state.refreshed_at = timezone.now()
+            if days or full:
+                state.version += 1
+            state.save()
+        return len(days)
+
+
+ROLLUPS = {
+    'orders': Rollup(
+        'orders', DailyOrderFact, Order, 'created_at',
+        change_fields=['updated_at'],
+        dimensions={
+            'product_id': 'product_id',
+            'order_status': 'order_status',
+            'payment_option': 'payment_option',
+            'delivery_method': 'delivery_method',
+        },
+        measures={
+            'order_count': Count('id'),
+            'quantity_bags': Sum('quantity_bags'),
+            'quantity_tons': Sum('quantity_tons'),
+            'revenue': Sum('total_price'),
+        },
+    ),
+    'supplies': Rollup(
+        'supplies', DailySupplyFact, FarmerSupply, 'date_delivered',
+        # A farmer moving region changes the region of all their supplies
+        change_fields=['updated_at', 'farmer__updated_at'],
+        dimensions={
+            'product_id': 'product_id',
+            'region': 'farmer__region',
+            'payment_status': 'payment_status',
+        },
+        measures={
+            'supply_count': Count('id'),
+            'quantity_bags': Sum('quantity_bags'),
+            'quantity_tons': Sum('quantity_tons'),
+            'total_cost': Sum('total_cost'),
+            'amount_paid': Sum('amount_paid'),
+        },
+    ),
+    'movements': Rollup(
+        'movements', DailyMovementFact, StockMovement, 'created_at',
+        # Movements are never edited, but their stock's product or warehouse can be
+        change_fields=['created_at', 'stock__updated_at'],
+        dimensions={
+            'product_id': 'stock__product_id',
+            'warehouse_location': 'stock__warehouse_location',
+            'movement_type': 'movement_type',
+        },
+        measures={
+            'movement_count': Count('id'),
+            'quantity_bags': Sum('quantity_bags'),
+            'quantity_tons': Sum('quantity_tons'),
+        },
+    ),
+}
+
+
+def refresh_rollups(sources=None, full=False):
+    """Refresh the given fact tables (default: all); returns {source: days rewritten}"""
+    return {name: ROLLUPS[name].refresh(full=full) for name in (sources or ROLLUPS)}
+
+
+def mark_dirty(source, value):
+    """Queue the day of `value` (an aware datetime) for re-aggregation"""
+    if value is not None:
+        RollupDirtyDay.objects.bulk_create(
+            [RollupDirtyDay(source=source, day=local_day(value))], ignore_conflicts=True
+        )
+
@@ -0,0 +1,55 @@
+from datetime import timedelta
+from django.utils import timezone
+from rest_framework import serializers
+from .queries import INTERVALS
+from .rollups import local_day
+
+
+class ReportPeriodSerializer(serializers.Serializer):
+    """Query parameters selecting an inclusive range of report days (Accra time)"""
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    days = serializers.IntegerField(required=False, min_value=1, max_value=3660, default=30)
+
+    def validate(self, attrs):
+        attrs['end'] = attrs.get('end') or local_day(timezone.now())
+        attrs['start'] = attrs.get('start') or attrs['end'] - timedelta(days=attrs['days'])
+        if attrs['start'] > attrs['end']:
+            raise serializers.ValidationError({'start': 'Start must not be after end.'})
+        return attrs
+
+
+class ReportQuerySerializer(ReportPeriodSerializer):
+    """
+    Period plus ?interval=, ?group_by=a,b and one filter per dimension
+    (?product=1,2&order_status=DELIVERED). Dimensions come from the context.
+    """
+    interval = serializers.ChoiceField(choices=INTERVALS, default='total')
+    group_by = serializers.CharField(required=False, default='')
+
+    def validate_group_by(self, value):
+        group_by = [name.strip() for name in value.split(',') if name.strip()]
+        unknown = [name for name in group_by if name not in self.context['dimensions']]
+        if unknown:
+            raise serializers.ValidationError(
+                f"Unknown dimension(s): {', '.join(unknown)}. Use: {', '.join(self.context['dimensions'])}"
+            )
+        return group_by
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        attrs.pop('days')
+        filters = {}
+        for name in self.context['dimensions']:
+            raw = self.initial_data.get(name)
+            if not raw:
+                continue
+            values = sorted({value.strip() for value in raw.split(',') if value.strip()})
+            if name == 'product':
+                try:
+                    values = sorted(int(value) for value in values)
+                except ValueError:
+                    raise serializers.ValidationError({'product': 'Product ids must be integers.'})
+            filters[f'{name}__in'] = values
+        attrs['filters'] = filters
+        return attrs
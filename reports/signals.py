@@ -0,0 +1,41 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from farmers.models import FarmerSupply
+from inventory.models import Stock, StockMovement
+from orders.models import Order
+from .queries import bump_stock_version
+from .rollups import mark_dirty
+
+
+@receiver(post_delete, sender=Order)
+def order_deleted(sender, instance, **kwargs):
+    """A deleted row leaves no timestamp behind, so queue its day explicitly"""
+    mark_dirty('orders', instance.created_at)
+
+
+@receiver(post_delete, sender=FarmerSupply)
+def supply_deleted(sender, instance, **kwargs):
+    mark_dirty('supplies', instance.date_delivered)
+
+
+@receiver(post_delete, sender=StockMovement)
+def movement_deleted(sender, instance, **kwargs):
+    mark_dirty('movements', instance.created_at)
+
+
+@receiver(post_save, sender=FarmerSupply)
+def supply_moved(sender, instance, created, **kwargs):
+    """The refresh sees the new delivery day; the day it was moved away from needs queueing"""
+    # Stored date read under a row lock by FarmerSupply.save()
+    previous = getattr(instance, '_stored_date_delivered', None)
+    if not created and previous is not None and previous != instance.date_delivered:
+        mark_dirty('supplies', previous)
+
+
+@receiver(post_save, sender=Stock)
+@receiver(post_delete, sender=Stock)
+def stock_changed(sender, **kwargs):
+    """Live stock levels are part of the inventory report's cache key"""
+    # After commit: bumped earlier, a concurrent request could cache the old stock under the new version
+    transaction.on_commit(bump_stock_version)
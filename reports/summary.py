@@ -0,0 +1,136 @@
+"""
+The business report behind generate_reports and /api/reports/summary/.
+
+Orders, supplies and movements are read from the daily fact tables, so a
+year-long report sums a few hundred rows per product instead of scanning
+the transactional tables. Customer and farmer counts and current stock are
+small point-in-time figures and stay live.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from django.db import connection
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+from customers.models import Customer
+from farmers.models import Farmer
+from inventory.models import Stock
+from products.models import Product
+from .models import DailyMovementFact, DailyOrderFact, DailySupplyFact
+from .rollups import day_bounds
+
+
+def customer_section(first_day, last_day):
+    start, end = day_bounds(first_day, last_day)
+    return Customer.objects.aggregate(
+        total_active=Count('id', filter=Q(is_active=True)),
+        new=Count('id', filter=Q(created_at__gte=start, created_at__lt=end)),
+    )
+
+
+def farmer_section(first_day, last_day):
+    return Farmer.objects.filter(is_active=True).aggregate(
+        total_active=Count('id'),
+        approved=Count('id', filter=Q(is_approved=True)),
+        pending=Count('id', filter=Q(is_approved=False)),
+    )
+
+
+def supply_section(first_day, last_day):
+    stats = DailySupplyFact.objects.filter(day__gte=first_day, day__lte=last_day).aggregate(
+        count=Coalesce(Sum('supply_count'), 0),
+        total_bags=Coalesce(Sum('quantity_bags'), 0),
+        total_cost=Sum('total_cost'),
+        total_paid=Sum('amount_paid'),
+    )
+    stats['total_cost'] = stats['total_cost'] or 0
+    stats['total_paid'] = stats['total_paid'] or 0
+    stats['outstanding'] = stats['total_cost'] - stats['total_paid']
+    return stats
+
+
+def stock_section(first_day, last_day):
+    stats = Stock.objects.aggregate(
+        total_bags=Coalesce(Sum('quantity_bags'), 0),
+        total_tons=Sum('quantity_tons'),
+        low_stock_count=Count('id', filter=Q(quantity_bags__lt=100)),
+    )
+    stats['total_tons'] = (stats['total_tons'] or Decimal(0)).quantize(Decimal('0.001'))
+    # One GROUP BY instead of a query per product
+    stats['by_product'] = list(
+        Product.objects.annotate(bags=Coalesce(Sum('stock_items__quantity_bags'), 0))
+        .order_by('name').values('name', 'bags')
+    )
+    return stats
+
+
+def order_section(first_day, last_day):
+    facts = DailyOrderFact.objects.filter(day__gte=first_day, day__lte=last_day)
+    stats = facts.aggregate(
+        total=Coalesce(Sum('order_count'), 0),
+        revenue=Sum('revenue', filter=Q(order_status='DELIVERED')),
+        pending=Coalesce(Sum('order_count', filter=Q(order_status='PENDING')), 0),
+        processing=Coalesce(Sum('order_count', filter=Q(order_status='PROCESSING')), 0),
+        delivered=Coalesce(Sum('order_count', filter=Q(order_status='DELIVERED')), 0),
+        cancelled=Coalesce(Sum('order_count', filter=Q(order_status='CANCELLED')), 0),
+    )
+    stats['revenue'] = stats['revenue'] or 0
+    stats['top_products'] = list(
+        facts.filter(order_status='DELIVERED').values('product__name').annotate(
+            bags_sold=Sum('quantity_bags'),
+            revenue=Sum('revenue'),
+        ).order_by('-bags_sold')[:5]
+    )
+    return stats
+
+
+def movement_section(first_day, last_day):
+    return list(
+        DailyMovementFact.objects.filter(day__gte=first_day, day__lte=last_day)
+        .values('movement_type').annotate(count=Sum('movement_count'), total_bags=Sum('quantity_bags'))
+        .order_by('movement_type')
+    )
+
+
+SECTIONS = {
+    'customers': customer_section,
+    'farmers': farmer_section,
+    'supplies': supply_section,
+    'stock': stock_section,
+    'orders': order_section,
+    'movements': movement_section,
+}
+
+
+def _run_section(function, first_day, last_day):
+    # Each thread gets its own connection; close it so it isn't left open
+    try:
+        return function(first_day, last_day)
+    finally:
+        connection.close()
+
+
+def build_report(first_day, last_day, workers=1):
+    """
+    All report sections for first_day..last_day (inclusive, report time). Serial by default, on the caller's
+    connection; generate_reports passes workers to compute the sections concurrently, each on its own connection
+    """
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                name: pool.submit(_run_section, function, first_day, last_day)
+                for name, function in SECTIONS.items()
+            }
+            report = {name: future.result() for name, future in futures.items()}
+    else:
+        report = {name: function(first_day, last_day) for name, function in SECTIONS.items()}
+
+    revenue = report['orders']['revenue']
+    supply_cost = report['supplies']['total_cost']
+    report['finance'] = {
+        'revenue': revenue,
+        'supply_cost': supply_cost,
+        'gross_profit': revenue - supply_cost,
+    }
+    return {'period': {'start': first_day, 'end': last_day}, **report}
@@ -0,0 +1,8 @@
+from celery import shared_task
+from .rollups import refresh_rollups as refresh
+
+
+@shared_task
+def refresh_rollups():
+    """Periodic incremental refresh of the report fact tables (see CELERY_BEAT_SCHEDULE)"""
+    return refresh()
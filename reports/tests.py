@@ -0,0 +1,92 @@
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from farmers.models import Farmer, FarmerSupply
+from inventory.models import Stock
+from monitoring.benchmarks import api_client
+from products.models import Product
+from .models import RollupDirtyDay
+from .queries import data_version
+from .rollups import local_day
+
+
+class SummaryReportTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.admin = get_user_model().objects.create_user(
+            username='admin', password='admin', user_type='ADMIN', mobile_number='+233200000001',
+        )
+
+    @mock.patch('reports.summary.ThreadPoolExecutor')
+    def test_endpoint_builds_sections_on_the_request_connection(self, pool):
+        response = api_client(self.admin).get('/api/reports/summary/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('gross_profit', response.json()['finance'])
+        pool.assert_not_called()
+
+
+class MovedSupplyTests(TestCase):
+    """Moving a supply to another day queues the day it was stored under for re-aggregation"""
+
+    def setUp(self):
+        farmer = Farmer.objects.create(
+            full_name='Kwame Boateng', mobile_number='+233501000001', ghana_card_number='GHA-000000001-0',
+            gps_latitude=Decimal('6.700000'), gps_longitude=Decimal('-1.450000'), region='Ashanti',
+            district='Ejisu', community='Onwe',
+        )
+        product = Product.objects.create(name='Yellow Maize', description='Test', packaging_sizes=['50kg bag'])
+        self.delivered = timezone.now() - timedelta(days=10)
+        self.supply = FarmerSupply.objects.create(
+            farmer=farmer, product=product, quantity_bags=10, quantity_tons=Decimal('0.500'),
+            date_delivered=self.delivered, cost_per_bag=Decimal('210.00'),
+        )
+
+    def dirty_days(self):
+        return set(RollupDirtyDay.objects.filter(source='supplies').values_list('day', flat=True))
+
+    def test_stale_instances_queue_each_day_moved_away_from(self):
+        # Two requests load the supply before either saves it
+        first, second = FarmerSupply.objects.get(pk=self.supply.pk), FarmerSupply.objects.get(pk=self.supply.pk)
+        first.date_delivered = self.delivered - timedelta(days=1)
+        first.save()
+        second.date_delivered = self.delivered - timedelta(days=2)
+        second.save()
+        self.assertEqual(self.dirty_days(), {local_day(self.delivered), local_day(first.date_delivered)})
+
+    def test_deferred_date_queues_the_stored_day(self):
+        supply = FarmerSupply.objects.defer('date_delivered').get(pk=self.supply.pk)
+        supply.date_delivered = self.delivered - timedelta(days=1)
+        supply.save()
+        self.assertEqual(self.dirty_days(), {local_day(self.delivered)})
+
+    def test_unmoved_supply_queues_nothing(self):
+        supply = FarmerSupply.objects.get(pk=self.supply.pk)
+        supply.amount_paid = Decimal('100.00')
+        supply.save()
+        self.assertEqual(self.dirty_days(), set())
+
+
+class StockVersionTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.product = Product.objects.create(name='Yellow Maize', description='Test', packaging_sizes=['50kg bag'])
+
+    def test_version_changes_when_the_stock_write_commits(self):
+        before = data_version(['stock'])
+        with self.captureOnCommitCallbacks(execute=True):
+            Stock.objects.create(
+                product=self.product, quantity_bags=100, quantity_tons=Decimal('5.000'), source_type='FARMER',
+                moisture_content=Decimal('13.50'), warehouse_location='Kumasi Central',
+                cost_price=Decimal('210.00'), date_received=timezone.now(),
+            )
+            # Not yet committed: reports still read (and cache under) the old version
+            self.assertEqual(data_version(['stock']), before)
+        self.assertNotEqual(data_version(['stock']), before)
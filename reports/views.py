@@ -0,0 +1,51 @@
+from rest_framework import viewsets, permissions, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from .queries import REPORTS, run_report
+from .serializers import ReportQuerySerializer
+
+
+class IsAdminOrStaff(permissions.BasePermission):
+    """Only admin and staff can access"""
+    
+    def has_permission(self, request, view):
+        return request.user.is_authenticated and request.user.user_type in ['ADMIN', 'STAFF']
+
+
+class ReportViewSet(viewsets.ViewSet):
+    """Business reports, read from the daily rollup tables and cached per parameters and data version"""
+    permission_classes = [IsAdminOrStaff]
+    
+    def report(self, request, name):
+        query = ReportQuerySerializer(data=request.query_params, context={'dimensions': REPORTS[name][0]})
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+        data, cached = run_report(name, query.validated_data)
+        response = Response(data)
+        response['X-Cache'] = 'HIT' if cached else 'MISS'
+        return response
+    
+    @action(detail=False, methods=['get'])
+    def summary(self, request):
+        """The generate_reports business report for ?start=&end= (or ?days=, default 30)"""
+        return self.report(request, 'summary')
+    
+    @action(detail=False, methods=['get'])
+    def sales(self, request):
+        """Orders by ?interval= and ?group_by= product, order_status, payment_option, delivery_method"""
+        return self.report(request, 'sales')
+    
+    @action(detail=False, methods=['get'])
+    def procurement(self, request):
+        """Farmer supplies by ?interval= and ?group_by= product, region, payment_status"""
+        return self.report(request, 'procurement')
+    
+    @action(detail=False, methods=['get'])
+    def inventory(self, request):
+        """Stock movements by ?interval= and ?group_by= product, warehouse_location, movement_type, plus current stock"""
+        return self.report(request, 'inventory')
+    
+    @action(detail=False, methods=['get'])
+    def finance(self, request):
+        """Delivered revenue against supply cost by ?interval= (and ?group_by=product)"""
+        return self.report(request, 'finance')